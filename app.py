@@ -95,8 +95,11 @@ else:
 # 메인 로거 설정
 logger = logging.getLogger(__name__)
 
-def create_app():
-    """Flask 앱 팩토리 함수"""
+def create_app(engine_options=None):
+    """Flask 앱 팩토리 함수
+
+    engine_options: SQLALCHEMY_ENGINE_OPTIONS 대체값 (CLI 스크립트의 NullPool 등)
+    """
     # .env 로드 (환경변수 미설정 시 .env 사용)
     try:
         load_dotenv()
@@ -106,6 +109,35 @@ def create_app():
     
     # 설정 로드
     app.config.from_object(DevelopmentConfig)
+    if engine_options is not None:
+        # db.init_app 이전에 반영되어야 엔진 생성에 적용됨
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+    
+    # 운영 환경 여부 (FLASK_ENV=production 또는 DEBUG 비활성)
+    is_production = os.getenv('FLASK_ENV') == 'production' or not app.config.get('DEBUG')
+    if is_production:
+        # jinja_env 생성 전에 설정해야 auto_reload에 반영됨
+        app.config['TEMPLATES_AUTO_RELOAD'] = False
+    
+    # Jinja 바이트코드 캐시: 워커 재시작 후 첫 렌더링의 템플릿 파싱/컴파일 생략
+    try:
+        from jinja2 import FileSystemBytecodeCache
+        bytecode_cache_dir = app.config['JINJA_BYTECODE_CACHE_DIR']
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+    except Exception as e:
+        logger.warning(f"Jinja 바이트코드 캐시 설정 실패: {e}")
+    # 운영 환경에서는 템플릿 변경 감시(stat) 생략 + 부팅 시 전체 템플릿 사전 컴파일
+    if is_production:
+        app.jinja_env.auto_reload = False
+        prewarmed = 0
+        for template_name in app.jinja_env.list_templates(extensions=['html']):
+            try:
+                app.jinja_env.get_template(template_name)
+                prewarmed += 1
+            except Exception as e:
+                logger.warning(f"템플릿 사전 컴파일 실패 ({template_name}): {e}")
+        logger.info(f"Jinja 템플릿 사전 컴파일 완료: {prewarmed}개")
     
     # 전역 템플릿 컨텍스트: now()
     @app.context_processor
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from datetime import timedelta
 
 class Config:
@@ -7,6 +8,18 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///stock_newsletter.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # DB 커넥션 풀 설정 (웹훅 등 버스트 트래픽 시 연결 재사용)
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_pre_ping': True,
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+    }
+    # SQLite(기본값)는 풀 크기 옵션을 쓰지 않으므로 서버형 DB에만 적용
+    if not SQLALCHEMY_DATABASE_URI.startswith('sqlite'):
+        SQLALCHEMY_ENGINE_OPTIONS.update({
+            'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+            'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        })
+    
     # 세션 설정
     PERMANENT_SESSION_LIFETIME = timedelta(hours=24)
     
@@ -17,6 +30,9 @@ class Config:
     # 주식 데이터 디렉토리
     STOCK_LISTS_DIR = 'stock_lists'
     
+    # Jinja 템플릿 바이트코드 캐시 디렉토리 (워커 재시작 시 템플릿 재컴파일 생략)
+    JINJA_BYTECODE_CACHE_DIR = os.environ.get('JINJA_BYTECODE_CACHE_DIR') or os.path.join(tempfile.gettempdir(), 'jinja_cache')
+    
     # 로깅 설정
     LOG_TO_STDOUT = os.environ.get('LOG_TO_STDOUT')
     
@@ -0,0 +1,19 @@
+from alembic import op
+
+revision = 'a7c3e1d9f402'
+down_revision = '125b65200b47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 웹훅 IN 조회용 인덱스 보장 (모델 선언과 동일한 이름, 이미 있으면 건너뜀)
+    # - email_events.sg_event_id는 UNIQUE 제약이 인덱스를 겸하므로 추가하지 않음
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_email_messages_sendgrid_message_id "
+        "ON email_messages (sendgrid_message_id)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_email_messages_sendgrid_message_id")
@@ -1,6 +1,7 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, g
 from flask_login import login_required, current_user
 from functools import wraps
+from secrets import token_hex
 from models import db, User, Stock
 from forms import CSVUploadForm
 from services.core.unified_market_analysis_service import UnifiedMarketAnalysisService
@@ -26,7 +27,12 @@ def admin_required(f):
     """관리자 권한 확인 데코레이터"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated or not current_user.is_admin:
+        # 요청 단위로 권한 확인 결과를 g에 캐시 (중첩 데코레이터/헬퍼에서 재조회 방지)
+        is_admin = getattr(g, '_admin_checked', None)
+        if is_admin is None:
+            is_admin = bool(current_user.is_authenticated and current_user.is_admin)
+            g._admin_checked = is_admin
+        if not is_admin:
             flash('관리자 권한이 필요합니다.', 'error')
             return redirect(url_for('auth.login'))
         return f(*args, **kwargs)
@@ -581,6 +587,12 @@ def refresh_market_data():
         if us_tickers:
             data_reading_service.get_latest_ohlcv(us_tickers, 'US', caller='admin.refresh_market_data')
         
+        # 갱신된 데이터가 사용자 홈/통합 뉴스레터에 바로 반영되도록 캐시 무효화
+        from routes.user_routes import clear_home_payload_cache
+        from services.newsletter_generation_service import clear_combined_newsletter_cache
+        clear_home_payload_cache()
+        clear_combined_newsletter_cache()
+        
         return jsonify({'success': True, 'message': '주가 데이터가 성공적으로 갱신되었습니다.'})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
@@ -971,6 +983,12 @@ def force_data_download():
         logging.info(f"[ADMIN] === 강제 데이터 다운로드 완료 ===")
         logging.info(f"[ADMIN] 전체 처리: {total_processed}, 성공: {success_count}, 실패: {fail_count}")
         
+        # 갱신된 데이터가 사용자 홈/통합 뉴스레터에 바로 반영되도록 캐시 무효화
+        from routes.user_routes import clear_home_payload_cache
+        from services.newsletter_generation_service import clear_combined_newsletter_cache
+        clear_home_payload_cache()
+        clear_combined_newsletter_cache()
+        
         return jsonify({
             'success': True, 
             'message': f'강제 데이터 다운로드 완료. 성공: {success_count}, 실패: {fail_count}',
@@ -1250,8 +1268,7 @@ def subscribers_create():
             return jsonify({'success': False, 'message': 'email 필요'}), 400
         # 이메일 기준으로 구독자 조회
         sub = NewsletterSubscription.query.filter_by(email=email).first()
-        import uuid
-        token = uuid.uuid4().hex
+        token = token_hex(16)
         if not sub:
             # 생성
             from datetime import datetime
@@ -1359,11 +1376,10 @@ def subscribers_update(sub_id: int):
 def subscribers_regenerate_token(sub_id: int):
     try:
         from models import db, NewsletterSubscription
-        import uuid
         sub = NewsletterSubscription.query.get(sub_id)
         if not sub:
             return jsonify({'success': False, 'message': '구독 정보를 찾을 수 없습니다.'}), 404
-        sub.unsubscribe_token = uuid.uuid4().hex
+        sub.unsubscribe_token = token_hex(16)
         db.session.commit()
         return jsonify({'success': True, 'token': sub.unsubscribe_token})
     except Exception as e:
@@ -1381,6 +1397,24 @@ def get_market_summary_data(market: str, timeframe: str = 'd') -> Dict:
         logging.error(f"시장 요약 데이터 생성 오류: {e}")
         return {}
 
+@admin_bp.route('/debug/pool')
+@login_required
+@admin_required
+def debug_pool():
+    """DB 커넥션 풀 상태 조회 (버스트 트래픽 시 풀 고갈 여부 확인용)"""
+    try:
+        pool = db.engine.pool
+        stats = {'status': pool.status(), 'class': type(pool).__name__}
+        # QueuePool 계열에서만 제공되는 지표
+        for name in ('size', 'checkedin', 'checkedout', 'overflow'):
+            metric = getattr(pool, name, None)
+            if callable(metric):
+                stats[name] = metric()
+        return jsonify({'success': True, 'pool': stats})
+    except Exception as e:
+        logging.error(f"DB 풀 상태 조회 오류: {e}")
+        return jsonify({'success': False, 'message': str(e)}), 500
+
 @admin_bp.route('/api/market_summary/<market>')
 @login_required
 @admin_required
@@ -1,26 +1,19 @@
 import os
+import re
+import ast
 import logging
 import pandas as pd
-import base64
-import io
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import mplfinance as mpf
+import numpy as np
 import glob
-
-# 한글 폰트 설정
-plt.rcParams['font.family'] = ['DejaVu Sans', 'Arial Unicode MS', 'Malgun Gothic', 'NanumGothic', 'sans-serif']
-plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
+import sys
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+# matplotlib/mplfinance는 ChartService에서 최초 차트 생성 시 지연 로드됩니다.
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-from flask import Blueprint, render_template, request, jsonify, current_app, redirect, url_for
+from flask import Blueprint, render_template, request, jsonify, current_app, redirect, url_for, send_file
 from flask_login import login_required
-import google.generativeai as genai
-import requests
-import json
-import ta
 
 # Services
 from services.market.data_download_service import DataDownloadService
@@ -28,7 +21,7 @@ from services.technical_indicators_service import technical_indicators_service
 from services.analysis.ai_analysis_service import AIAnalysisService
 from services.analysis.chart_service import ChartService
 from services.market.data_reading_service import DataReadingService
-import logging
+from services.market.file_management_service import FileManagementService
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from services.core.unified_market_analysis_service import UnifiedMarketAnalysisService
 from services.core.cache_service import CacheService
@@ -42,65 +35,139 @@ from config import DevelopmentConfig
 # Blueprint 생성
 analysis_bp = Blueprint('analysis', __name__, url_prefix='/analysis')
 
+# 상태 없는 서비스는 모듈 단위로 한 번만 생성해 재사용
+_chart_service = ChartService()
+_ai_service = AIAnalysisService()
+_indicators_service = technical_indicators_service
+_drs = DataReadingService()
+
+logger = logging.getLogger(__name__)
+
+# 시장별 시간대/장 시간 (키는 대문자 시장 코드)
+_MARKET_TZ = {
+    'KOSPI': ZoneInfo('Asia/Seoul'),
+    'KOSDAQ': ZoneInfo('Asia/Seoul'),
+    'US': ZoneInfo('America/New_York'),
+}
+# (start_h, start_m, close_h, close_m) - 현지 시각 기준
+_MARKET_HOURS = {
+    'KOSPI': (9, 0, 15, 30),   # 09:00-15:30 KST
+    'KOSDAQ': (9, 0, 15, 30),  # 09:00-15:30 KST
+    'US': (9, 30, 16, 0),      # 09:30-16:00 EST
+}
+
 def _get_market_timezone(market: str) -> ZoneInfo:
-    try:
-        m = (market or '').upper()
-        if m in ['KOSPI', 'KOSDAQ']:
-            return ZoneInfo('Asia/Seoul')
-        return ZoneInfo('America/New_York')
-    except Exception:
-        return ZoneInfo('Asia/Seoul')
+    return _MARKET_TZ.get((market or '').upper(), _MARKET_TZ['US'])
 
 def _get_market_hours(market: str) -> tuple:
     """Return (start_h, start_m, close_h, close_m) in local market time."""
-    m = (market or '').upper()
-    if m in ['KOSPI', 'KOSDAQ']:
-        return (9, 0, 15, 30)  # 09:00-15:30 KST
-    return (9, 30, 16, 0)     # 09:30-16:00 EST
+    return _MARKET_HOURS.get((market or '').upper(), _MARKET_HOURS['US'])
 
 def _prev_business_day(dt_local: datetime) -> datetime:
-    d = dt_local.date()
-    while True:
-        d = d - timedelta(days=1)
-        if d.weekday() < 5:
-            return datetime(d.year, d.month, d.day, tzinfo=dt_local.tzinfo)
+    # 월요일은 금요일(3일 전), 일요일은 금요일(2일 전), 그 외는 전날 (공휴일 미고려)
+    wd = dt_local.weekday()
+    delta = 3 if wd == 0 else (2 if wd == 6 else 1)
+    d = dt_local.date() - timedelta(days=delta)
+    return datetime(d.year, d.month, d.day, tzinfo=dt_local.tzinfo)
+
+@lru_cache(maxsize=4096)
+def _scan_latest_cached_analysis_file(ticker: str, market: str, dir_mtime_ns: int) -> str | None:
+    """디렉토리 mtime을 키에 포함해 파일 추가/삭제 시 자동으로 무효화되는 스캔 결과 캐시"""
+    pattern = os.path.join("static", "analysis", f"{ticker}_AI_Analysis_{market}_*.html")
+    files = glob.glob(pattern)
+    if not files:
+        return None
+    return max(files, key=os.path.getmtime)
 
 def _find_latest_cached_analysis_file(ticker: str, market: str) -> str | None:
     try:
         analysis_dir = os.path.join("static", "analysis")
-        pattern = os.path.join(analysis_dir, f"{ticker}_AI_Analysis_{market}_*.html")
-        files = glob.glob(pattern)
-        if not files:
-            return None
-        files.sort(key=lambda p: os.path.getmtime(p))
-        return files[-1]
-    except Exception:
+        dir_mtime_ns = os.stat(analysis_dir).st_mtime_ns
+        return _scan_latest_cached_analysis_file(ticker, market, dir_mtime_ns)
+    except OSError:
         return None
 
 def _detect_canonical_market_by_files(ticker: str, preferred_market: str) -> str:
+    # 선호 시장 우선, 중복 제거 순서 유지
+    candidates = tuple(dict.fromkeys([preferred_market, 'US', 'KOSPI', 'KOSDAQ']))
+    # 후보 디렉토리 mtime을 키에 포함 → 파일 추가/삭제 시 자동으로 다시 스캔
+    dir_mtimes = []
+    for cand in candidates:
+        try:
+            dir_mtimes.append(os.stat(os.path.join("static", "data", cand)).st_mtime_ns)
+        except OSError:
+            dir_mtimes.append(None)
+    return _scan_canonical_market(ticker, candidates, tuple(dir_mtimes))
+
+@lru_cache(maxsize=2048)
+def _scan_canonical_market(ticker: str, candidates: tuple, dir_mtimes: tuple) -> str:
+    preferred_market = candidates[0]
+    needles = (f"{ticker}_indicators_d_", f"{ticker}_ohlcv_d_")
+    for cand in candidates:
+        try:
+            # 디렉토리 전체를 읽지 않고 첫 일치 파일에서 즉시 종료
+            with os.scandir(os.path.join("static", "data", cand)) as it:
+                for entry in it:
+                    if entry.name.startswith(needles) and entry.name.endswith('.csv'):
+                        return cand
+        except OSError:
+            continue
+    return preferred_market
+
+# 시장별 티커 접두사 인덱스 (디렉토리 mtime이 바뀔 때만 재구성)
+_MARKET_TICKERS: dict[str, set[str]] = {}
+_MARKET_MTIME: dict[str, int] = {}
+
+def _get_market_tickers(market: str) -> set[str]:
+    dir_path = os.path.join("static", "data", market)
     try:
-        candidates = [preferred_market] + [m for m in ['US', 'KOSPI', 'KOSDAQ'] if m != preferred_market]
-        for cand in candidates:
-            try:
-                data_dir = os.path.join("static", "data", cand)
-                if glob.glob(os.path.join(data_dir, f"{ticker}_indicators_d_*.csv")) or \
-                   glob.glob(os.path.join(data_dir, f"{ticker}_ohlcv_d_*.csv")):
-                    return cand
-            except Exception:
-                continue
-        return preferred_market
-    except Exception:
-        return preferred_market
+        mtime_ns = os.stat(dir_path).st_mtime_ns
+        if _MARKET_MTIME.get(market) != mtime_ns:
+            with os.scandir(dir_path) as it:
+                _MARKET_TICKERS[market] = {e.name.split('_', 1)[0] for e in it if '_' in e.name}
+            _MARKET_MTIME[market] = mtime_ns
+    except OSError:
+        _MARKET_MTIME.pop(market, None)
+        return set()
+    return _MARKET_TICKERS.get(market, set())
+
+# 티커 → 시장 통합 인덱스 (시장별 인덱스 중 하나라도 바뀌면 재구성)
+_MARKET_LOOKUP_ORDER = ('KOSPI', 'KOSDAQ', 'US')
+_TICKER_MARKET_INDEX: dict[str, str] = {}
+_TICKER_MARKET_INDEX_KEY: tuple = ()
+
+def _lookup_market_by_index(ticker: str, default: str = 'KOSPI') -> str:
+    global _TICKER_MARKET_INDEX, _TICKER_MARKET_INDEX_KEY
+    ticker_sets = [_get_market_tickers(mkt) for mkt in _MARKET_LOOKUP_ORDER]
+    index_key = tuple(_MARKET_MTIME.get(mkt) for mkt in _MARKET_LOOKUP_ORDER)
+    if index_key != _TICKER_MARKET_INDEX_KEY:
+        index = {}
+        # 조회 순서가 앞선 시장이 우선 (기존 순차 검사와 동일)
+        for mkt, tickers in zip(reversed(_MARKET_LOOKUP_ORDER), reversed(ticker_sets)):
+            index.update(dict.fromkeys(tickers, mkt))
+        _TICKER_MARKET_INDEX, _TICKER_MARKET_INDEX_KEY = index, index_key
+    return _TICKER_MARKET_INDEX.get(ticker, default)
 
 def _get_file_created_dt_in_tz(path: str, tz: ZoneInfo) -> datetime | None:
     try:
         mtime = os.path.getmtime(path)
         return datetime.fromtimestamp(mtime, tz)
-    except Exception:
+    except OSError:
         return None
 
-def _determine_market_phase(now_local: datetime, market: str) -> str:
-    sh, sm, ch, cm = _get_market_hours(market)
+def _bulk_file_mtimes(paths: list[str], tz: ZoneInfo) -> list[datetime | None]:
+    """여러 파일의 mtime을 한 번의 벡터 변환으로 tz-aware datetime 리스트로 반환 (없는 파일은 None)"""
+    def _mtime(path: str) -> float:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return np.nan
+    mtimes = np.fromiter((_mtime(p) for p in paths), dtype=np.float64, count=len(paths))
+    converted = pd.to_datetime(mtimes, unit='s', utc=True).tz_convert(tz)
+    return [None if pd.isna(ts) else ts.to_pydatetime() for ts in converted]
+
+def _determine_market_phase(now_local: datetime, market_hours: tuple) -> str:
+    sh, sm, ch, cm = market_hours
     start_dt = now_local.replace(hour=sh, minute=sm, second=0, microsecond=0)
     close_dt = now_local.replace(hour=ch, minute=cm, second=0, microsecond=0)
     if now_local < start_dt:
@@ -109,63 +176,161 @@ def _determine_market_phase(now_local: datetime, market: str) -> str:
         return 'open'
     return 'post'
 
-def _get_prev_close_and_today_close(now_local: datetime, market: str) -> tuple[datetime, datetime]:
-    sh, sm, ch, cm = _get_market_hours(market)
+def _get_prev_close_and_today_close(now_local: datetime, market_hours: tuple) -> tuple[datetime, datetime]:
+    sh, sm, ch, cm = market_hours
     today_close = now_local.replace(hour=ch, minute=cm, second=0, microsecond=0)
     prev_biz = _prev_business_day(now_local)
     prev_close = prev_biz.replace(hour=ch, minute=cm, second=0, microsecond=0)
     return prev_close, today_close
 
-def _try_return_cached_analysis_html(ticker: str, market: str) -> str | None:
-    try:
-        tz = _get_market_timezone(market)
-        now_local = datetime.now(tz)
-        latest_path = _find_latest_cached_analysis_file(ticker, market)
-        prev_close_dt, today_close_dt = _get_prev_close_and_today_close(now_local, market)
-        phase = _determine_market_phase(now_local, market)
+def _is_created_fresh(created_dt: datetime, phase: str, prev_close_dt: datetime, today_close_dt: datetime) -> bool:
+    """장 전/장중에는 직전 영업일 종가 이후, 장 마감 후에는 당일 종가 이후 생성된 결과만 신선"""
+    if phase in ('pre', 'open'):
+        return created_dt >= prev_close_dt
+    return created_dt > today_close_dt  # post
 
-        logging.info(f"[CACHE] {ticker}/{market} phase={phase} now={now_local} prev_close={prev_close_dt} today_close={today_close_dt} latest_path={latest_path}")
+def _is_rendered_at_fresh(market: str, rendered_at: datetime) -> bool:
+    """인메모리 렌더 결과에 디스크 캐시와 동일한 장 상태 기준 신선도 판정 적용"""
+    tz = _get_market_timezone(market)
+    now_local = datetime.now(tz)
+    market_hours = _get_market_hours(market)
+    prev_close_dt, today_close_dt = _get_prev_close_and_today_close(now_local, market_hours)
+    phase = _determine_market_phase(now_local, market_hours)
+    return _is_created_fresh(rendered_at.astimezone(tz), phase, prev_close_dt, today_close_dt)
 
-        if not latest_path:
-            logging.info(f"[CACHE] No cached file found for {ticker}/{market}")
-            return None
+def _get_fresh_cached_analysis_path(ticker: str, market: str) -> str | None:
+    """
+    캐시된 분석 HTML이 신선하면 그 경로를, 아니면 None을 반환합니다.
+    파일 내용은 읽지 않고 mtime/장 상태 계산만 수행합니다.
+    """
+    # 시간대/현재시각/장 시간은 캐시 판정당 한 번만 계산해 하위 헬퍼에 전달
+    tz = _get_market_timezone(market)
+    now_local = datetime.now(tz)
+    market_hours = _get_market_hours(market)
+    latest_path = _find_latest_cached_analysis_file(ticker, market)
+    prev_close_dt, today_close_dt = _get_prev_close_and_today_close(now_local, market_hours)
+    phase = _determine_market_phase(now_local, market_hours)
 
-        created_dt = _get_file_created_dt_in_tz(latest_path, tz)
-        if created_dt is None:
-            return None
+    logging.info(f"[CACHE] {ticker}/{market} phase={phase} now={now_local} prev_close={prev_close_dt} today_close={today_close_dt} latest_path={latest_path}")
 
-        if phase in ('pre', 'open'):
-            is_fresh = created_dt >= prev_close_dt
-        else:  # post
-            is_fresh = created_dt > today_close_dt
+    if not latest_path:
+        logging.info(f"[CACHE] No cached file found for {ticker}/{market}")
+        return None
 
-        logging.info(f"[CACHE] created={created_dt} fresh={is_fresh}")
+    created_dt = _get_file_created_dt_in_tz(latest_path, tz)
+    if created_dt is None:
+        return None
 
-        if not is_fresh:
-            logging.info(f"[CACHE] Not fresh: created={created_dt} phase={phase} prev_close={prev_close_dt} today_close={today_close_dt}")
-            return None
+    is_fresh = _is_created_fresh(created_dt, phase, prev_close_dt, today_close_dt)
 
-        try:
-            with open(latest_path, 'r', encoding='utf-8') as f:
-                html = f.read()
+    logging.info(f"[CACHE] created={created_dt} fresh={is_fresh}")
+
+    if not is_fresh:
+        logging.info(f"[CACHE] Not fresh: created={created_dt} phase={phase} prev_close={prev_close_dt} today_close={today_close_dt}")
+        return None
+    return latest_path
+
+def cache_key_fresh(ticker: str, market: str) -> bool:
+    """
+    빠른 경로 판정용: (ticker, market)의 캐시된 분석이 신선한지 여부만 반환합니다.
+    라우트는 OHLCV/지표 로딩이나 차트 생성 전에 이 결과로 분기해야 합니다.
+    """
+    try:
+        return _get_fresh_cached_analysis_path(ticker, market) is not None
+    except Exception as e:
+        logging.warning(f"[CACHE] Unexpected error: {e}")
+        return False
+
+def _try_get_cached_analysis_path(ticker: str, market: str) -> str | None:
+    """
+    신선한 캐시 HTML이 있으면 그 파일 경로를, 없으면 None을 반환합니다 (파일 내용은 읽지 않음).
+    빠른 경로 계약: 호출자는 반환값이 있으면 데이터 로딩 없이 send_file로 즉시 응답해야 합니다.
+    """
+    try:
+        latest_path = _get_fresh_cached_analysis_path(ticker, market)
+        if latest_path:
             logging.info(f"[CACHE] Using cached analysis HTML: {latest_path}")
-            return html
-        except Exception as read_err:
-            logging.warning(f"[CACHE] Failed to read cached file: {read_err}")
-            return None
+        return latest_path
     except Exception as e:
         logging.warning(f"[CACHE] Unexpected error: {e}")
         return None
 
+# 렌더링된 AI 분석 HTML 인메모리 LRU: (ticker, market, 데이터 파일 최신 mtime) 키 → (HTML, 렌더 시각)
+# 데이터 CSV가 갱신되면 mtime이 바뀌어 자동으로 새 키가 되고, 장 상태 기준으로 오래된 항목은 조회 시 제거
+# 페이지 크기 편차가 커서 항목 수가 아닌 총 메모리(바이트) 기준으로 제한
+_AI_HTML_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_AI_HTML_CACHE: "OrderedDict[tuple, tuple[str, datetime]]" = OrderedDict()
+_AI_HTML_CACHE_BYTES = 0
+_AI_HTML_CACHE_LOCK = Lock()
+
+def _latest_data_mtime(ticker: str, market: str) -> int | None:
+    """static/data/<market>/<ticker>_* 파일들 중 최신 mtime(ns), 파일이 없으면 None"""
+    latest = None
+    for path in glob.glob(os.path.join("static", "data", market, f"{ticker}_*")):
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        if latest is None or mtime_ns > latest:
+            latest = mtime_ns
+    return latest
+
+def _get_rendered_ai_html(cache_key: tuple) -> str | None:
+    global _AI_HTML_CACHE_BYTES
+    with _AI_HTML_CACHE_LOCK:
+        entry = _AI_HTML_CACHE.get(cache_key)
+        if entry is None:
+            return None
+        html_content, rendered_at = entry
+        if not _is_rendered_at_fresh(cache_key[1], rendered_at):
+            del _AI_HTML_CACHE[cache_key]
+            _AI_HTML_CACHE_BYTES -= sys.getsizeof(html_content)
+            return None
+        _AI_HTML_CACHE.move_to_end(cache_key)
+        return html_content
+
+def _store_rendered_ai_html(cache_key: tuple, html_content: str) -> None:
+    global _AI_HTML_CACHE_BYTES
+    size = sys.getsizeof(html_content)
+    if size > _AI_HTML_CACHE_MAX_BYTES:
+        return
+    rendered_at = datetime.now(_get_market_timezone(cache_key[1]))
+    with _AI_HTML_CACHE_LOCK:
+        previous = _AI_HTML_CACHE.pop(cache_key, None)
+        if previous is not None:
+            _AI_HTML_CACHE_BYTES -= sys.getsizeof(previous[0])
+        _AI_HTML_CACHE[cache_key] = (html_content, rendered_at)
+        _AI_HTML_CACHE_BYTES += size
+        while _AI_HTML_CACHE_BYTES > _AI_HTML_CACHE_MAX_BYTES:
+            _, (evicted, _) = _AI_HTML_CACHE.popitem(last=False)
+            _AI_HTML_CACHE_BYTES -= sys.getsizeof(evicted)
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    # 프로세스당 경로별 1회만 생성 시도 (요청마다 makedirs/stat 호출 제거)
+    os.makedirs(path, exist_ok=True)
+
+# 분석 HTML 저장 전용 백그라운드 executor
+_HTML_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='analysis-save')
+
+def _write_analysis_html(filepath: str, html_content: str) -> None:
+    try:
+        # 임시 파일에 쓴 뒤 교체 → 캐시 빠른 경로가 작성 중인 파일을 서빙하지 않음
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        os.replace(tmp_path, filepath)
+        logging.info(f"AI analysis HTML saved: {filepath}")
+    except Exception as save_error:
+        logging.error(f"Failed to save HTML file: {save_error}")
+
 def generate_charts(ticker, market_type='KOSPI'):
     """일봉, 주봉, 월봉 차트를 생성합니다."""
     try:
         # 새로운 차트 서비스 사용
-        from services.analysis.chart_service import ChartService
-        chart_service = ChartService()
         
         # 차트 생성
-        charts, error = chart_service.generate_charts(ticker, market_type)
+        charts, error = _chart_service.generate_charts(ticker, market_type)
         
         return charts, error
         
@@ -181,11 +346,9 @@ def create_chart_image(df, title, timeframe, ticker, market_type='US'):
     """차트 이미지를 생성하고 base64로 인코딩합니다."""
     try:
         # ✅ 새로운 차트 서비스 사용 (중복 계산 제거됨)
-        from services.analysis.chart_service import ChartService
-        chart_service = ChartService()
         
         # 차트 이미지 생성
-        chart_image = chart_service.create_chart_image(df, title, timeframe, ticker, market_type)
+        chart_image = _chart_service.create_chart_image(df, title, timeframe, ticker, market_type)
         
         return chart_image
         
@@ -228,15 +391,13 @@ def load_saved_indicators(df, ticker, timeframe, market_type='US'):
 def get_indicators_data(ticker, timeframe, market_type='US'):
     """indicators CSV에서 지표 데이터 가져오기"""
     try:
-        from services.technical_indicators_service import TechnicalIndicatorsService
-        indicators_service = TechnicalIndicatorsService()
         
         # 지표 CSV 확인 및 자동 생성
-        if not indicators_service.ensure_indicators_exist(ticker, timeframe, market_type):
+        if not _indicators_service.ensure_indicators_exist(ticker, timeframe, market_type):
             logging.error(f"[{ticker}] 지표 CSV 생성 실패")
             return pd.DataFrame()
         
-        return indicators_service.read_indicators_csv(ticker, market_type, timeframe)
+        return _indicators_service.read_indicators_csv(ticker, market_type, timeframe)
     except Exception as e:
         logging.error(f"지표 데이터 가져오기 실패: {e}")
         return pd.DataFrame()
@@ -244,21 +405,70 @@ def get_indicators_data(ticker, timeframe, market_type='US'):
 # 🚫 중복 계산 함수 제거됨 - TechnicalIndicatorsService를 사용하세요
 # def calculate_technical_indicators(df): # 이 함수는 중복을 제거하기 위해 삭제되었습니다
 
+OHLCV_USECOLS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+
+# 일/주/월봉 CSV 동시 로드용 공용 executor (요청마다 생성하지 않음)
+_OHLCV_LOAD_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix='ohlcv-load')
+# 일/주/월봉 지표 로딩(바깥쪽 팬아웃)용 executor
+# 폴백 경로에서 get_ohlcv_data_for_ai가 _OHLCV_LOAD_EXECUTOR를 다시 사용하므로
+# 같은 풀을 공유하면 워커가 모두 대기 상태가 되어 교착됨 → 반드시 별도 풀 사용
+_INDICATOR_LOAD_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix='indicator-load')
+
+def _to_naive_datetime_index(index) -> pd.DatetimeIndex:
+    """인덱스를 tz-naive DatetimeIndex로 변환 (이미 naive DatetimeIndex면 그대로 반환)"""
+    if isinstance(index, pd.DatetimeIndex) and index.tz is None:
+        return index
+    # 혼합 오프셋 문자열/tz-aware 모두 UTC 기준으로 맞춘 뒤 시간대 제거
+    return pd.to_datetime(index, utc=True).tz_localize(None)
+
+# AI 분석용 시간프레임 (접미사, 표시명)
+_AI_TIMEFRAMES = (('d', '일봉'), ('w', '주봉'), ('m', '월봉'))
+
+def _load_timeframe(ticker, market, data_dir, tf, label):
+    """단일 시간프레임 OHLCV를 읽어 AI 분석용으로 포맷팅합니다. 파일/데이터가 없으면 None."""
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
+    # 최신 파일 존재 확인 (glob은 전체 경로를 반환)
+    files = glob.glob(os.path.join(data_dir, f"{ticker}_*_ohlcv_{tf}.csv"))
+    if not files:
+        if debug_enabled:
+            logger.debug(f"[{ticker}] {label} 파일을 찾을 수 없음")
+        return None
+    if debug_enabled:
+        logger.debug(f"[{ticker}] 선택된 {label} 파일: {max(files, key=os.path.getmtime)}")
+    
+    # [메모] 2025-08-19: CSV 직접 파싱을 중단하고 DataReadingService를 사용합니다.
+    # 기존 코드: df = pd.read_csv(path, index_col=0)
+    try:
+        df = _drs.read_ohlcv_csv(ticker, market, tf, usecols=OHLCV_USECOLS)
+    except Exception:
+        return None
+    if df.empty:
+        return None
+    
+    # 인덱스를 tz-naive DatetimeIndex로 정규화 (parse_dates로 이미 naive면 생략)
+    try:
+        df.index = _to_naive_datetime_index(df.index)
+    except Exception as e:
+        logging.error(f"Failed to convert {label} index to datetime: {e}")
+        return None
+    
+    # 컬럼 평탄화는 read_ohlcv_csv가 보장, 필요한 컬럼은 usecols로 이미 강제됨
+    # 포맷 실패는 해당 시간프레임만 None 처리 (다른 시간프레임 결과는 유지)
+    try:
+        data = format_ohlcv_data(df.dropna(), label)
+    except Exception as e:
+        logging.error(f"Failed to format {label} OHLCV data for {ticker}: {e}")
+        return None
+    if debug_enabled:
+        logger.debug(f"[{ticker}] 포맷팅된 {label} 데이터 개수: {len(data)}")
+    return data
+
 def get_ohlcv_data_for_ai(ticker, market_type='KOSPI'):
     """AI 분석용 OHLCV 데이터를 가져옵니다."""
     try:
         ticker = ticker.upper()
         
-        # 디버그: 데이터 로딩 과정 로그 저장
-        debug_log_path = os.path.join("logs", f"data_loading_debug_{ticker}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
-        os.makedirs("logs", exist_ok=True)
-        
-        with open(debug_log_path, 'w', encoding='utf-8') as f:
-            f.write(f"=== AI 분석용 데이터 로딩 디버그 로그 ===\n")
-            f.write(f"티커: {ticker}\n")
-            f.write(f"시장타입: {market_type}\n")
-            f.write(f"로딩 시간: {datetime.now()}\n")
-        
         # market_type을 실제 폴더명으로 변환
         if market_type.upper() in ['KOSPI', 'KOSDAQ']:
             actual_market_type = market_type.upper()
@@ -268,219 +478,23 @@ def get_ohlcv_data_for_ai(ticker, market_type='KOSPI'):
             # 기본값은 KOSPI
             actual_market_type = 'KOSPI'
         
-        with open(debug_log_path, 'a', encoding='utf-8') as f:
-            f.write(f"실제 시장타입: {actual_market_type}\n")
-        
         # 저장된 데이터 파일 찾기
         data_dir = os.path.join("static/data", actual_market_type)
         if not os.path.exists(data_dir):
-            with open(debug_log_path, 'a', encoding='utf-8') as f:
-                f.write(f"데이터 디렉토리가 존재하지 않음: {data_dir}\n")
-            return None, None, None
-        
-        with open(debug_log_path, 'a', encoding='utf-8') as f:
-            f.write(f"데이터 디렉토리: {data_dir}\n")
-        
-        # 최신 파일 찾기
-        ohlcv_files = []
-        for filename in os.listdir(data_dir):
-            if filename.startswith(f"{ticker}_") and filename.endswith("_ohlcv_d.csv"):
-                ohlcv_files.append(filename)
-        
-        with open(debug_log_path, 'a', encoding='utf-8') as f:
-            f.write(f"발견된 일봉 파일들: {ohlcv_files}\n")
-        
-        if not ohlcv_files:
-            with open(debug_log_path, 'a', encoding='utf-8') as f:
-                f.write("일봉 파일을 찾을 수 없음\n")
-            return None, None, None
-        
-        # 가장 최신 파일 선택
-        latest_file = max(ohlcv_files)
-        ohlcv_path = os.path.join(data_dir, latest_file)
-        
-        with open(debug_log_path, 'a', encoding='utf-8') as f:
-            f.write(f"선택된 일봉 파일: {latest_file}\n")
-            f.write(f"일봉 파일 경로: {ohlcv_path}\n")
-        
-        # OHLCV 데이터 로드
-        # [메모] 2025-08-19: CSV 직접 파싱을 중단하고 DataReadingService를 사용합니다.
-        # 기존 코드: df = pd.read_csv(ohlcv_path, index_col=0)
-        try:
-            from services.market.data_reading_service import DataReadingService
-            _drs_tmp = DataReadingService()
-            # market_type을 알 수 없으므로 폴더명 추출 시도, 실패 시 'US'
-            import os
-            market_guess = 'US'
-            try:
-                parts = os.path.normpath(ohlcv_path).split(os.sep)
-                if len(parts) >= 2:
-                    market_guess = parts[-2].upper()
-            except Exception:
-                pass
-            df = _drs_tmp.read_ohlcv_csv(ticker, market_guess, 'd')
-        except Exception as _:
-            df = pd.DataFrame()
-        
-        with open(debug_log_path, 'a', encoding='utf-8') as f:
-            f.write(f"로드된 일봉 데이터 행 수: {len(df)}\n")
-            f.write(f"일봉 데이터 컬럼: {df.columns.tolist()}\n")
-            f.write(f"일봉 데이터 인덱스 (처음 5개): {df.index[:5].tolist()}\n")
-            f.write(f"일봉 데이터 인덱스 (마지막 5개): {df.index[-5:].tolist()}\n")
-        
-        if df.empty:
-            with open(debug_log_path, 'a', encoding='utf-8') as f:
-                f.write("일봉 데이터가 비어있음\n")
-            return None, None, None
-        
-        # 인덱스를 DatetimeIndex로 변환
-        try:
-            df.index = pd.to_datetime(df.index, utc=True)
-            # UTC 시간대 제거 (로컬 시간으로 변환)
-            df.index = df.index.tz_localize(None)
-            
-            with open(debug_log_path, 'a', encoding='utf-8') as f:
-                f.write(f"시간대 변환 후 인덱스 (처음 5개): {df.index[:5].tolist()}\n")
-                f.write(f"시간대 변환 후 인덱스 (마지막 5개): {df.index[-5:].tolist()}\n")
-        except Exception as e:
-            logging.error(f"Failed to convert index to datetime: {e}")
-            with open(debug_log_path, 'a', encoding='utf-8') as f:
-                f.write(f"인덱스 변환 실패: {e}\n")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[{ticker}] 데이터 디렉토리가 존재하지 않음: {data_dir}")
             return None, None, None
         
-        # OHLCV 컬럼 정규화
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
+        # 일/주/월봉 로딩은 서로 독립적인 I/O이므로 모듈 공용 executor로 동시에 수행
+        daily_data, weekly_data, monthly_data = _OHLCV_LOAD_EXECUTOR.map(
+            lambda tf_label: _load_timeframe(ticker, actual_market_type, data_dir, *tf_label),
+            _AI_TIMEFRAMES
+        )
         
-        # 필요한 컬럼만 선택
-        required_columns = ["Open", "High", "Low", "Close", "Volume"]
-        if not all(col in df.columns for col in required_columns):
-            with open(debug_log_path, 'a', encoding='utf-8') as f:
-                f.write(f"필요한 컬럼이 없음. 현재 컬럼: {df.columns.tolist()}\n")
+        # 일봉이 없으면 분석 불가
+        if daily_data is None:
             return None, None, None
         
-        df = df[required_columns].dropna()
-        
-        with open(debug_log_path, 'a', encoding='utf-8') as f:
-            f.write(f"정규화 후 데이터 행 수: {len(df)}\n")
-            f.write(f"정규화 후 컬럼: {df.columns.tolist()}\n")
-        
-        # 일봉 데이터
-        daily_data = format_ohlcv_data(df, "일봉")
-        
-        with open(debug_log_path, 'a', encoding='utf-8') as f:
-            f.write(f"포맷팅된 일봉 데이터 개수: {len(daily_data)}\n")
-            if daily_data:
-                f.write(f"일봉 데이터 샘플 (최근 5개):\n")
-                for i, item in enumerate(daily_data[-5:]):
-                    f.write(f"  {i+1}. {item}\n")
-        
-        # 주봉 데이터 - 저장된 주봉 데이터 사용
-        weekly_files = []
-        for filename in os.listdir(data_dir):
-            if filename.startswith(f"{ticker}_") and filename.endswith("_ohlcv_w.csv"):
-                weekly_files.append(filename)
-        
-        with open(debug_log_path, 'a', encoding='utf-8') as f:
-            f.write(f"발견된 주봉 파일들: {weekly_files}\n")
-        
-        if weekly_files:
-            latest_weekly_file = max(weekly_files)
-            weekly_path = os.path.join(data_dir, latest_weekly_file)
-            # [메모] 2025-08-19: 주봉도 서비스 호출로 대체
-            # 기존 코드: weekly_df = pd.read_csv(weekly_path, index_col=0)
-            try:
-                weekly_df = _drs_tmp.read_ohlcv_csv(ticker, market_guess, 'w')
-            except Exception:
-                weekly_df = pd.DataFrame()
-            
-            with open(debug_log_path, 'a', encoding='utf-8') as f:
-                f.write(f"선택된 주봉 파일: {latest_weekly_file}\n")
-                f.write(f"로드된 주봉 데이터 행 수: {len(weekly_df)}\n")
-            
-            try:
-                weekly_df.index = pd.to_datetime(weekly_df.index, utc=True)
-                weekly_df.index = weekly_df.index.tz_localize(None)
-            except Exception as e:
-                logging.error(f"Failed to convert weekly index to datetime: {e}")
-                weekly_df = pd.DataFrame()
-            
-            if isinstance(weekly_df.columns, pd.MultiIndex):
-                weekly_df.columns = weekly_df.columns.get_level_values(0)
-            
-            if not weekly_df.empty and all(col in weekly_df.columns for col in required_columns):
-                weekly_df = weekly_df[required_columns].dropna()
-                weekly_data = format_ohlcv_data(weekly_df, "주봉")
-                
-                with open(debug_log_path, 'a', encoding='utf-8') as f:
-                    f.write(f"포맷팅된 주봉 데이터 개수: {len(weekly_data)}\n")
-                    if weekly_data:
-                        f.write(f"주봉 데이터 샘플 (최근 5개):\n")
-                        for i, item in enumerate(weekly_data[-5:]):
-                            f.write(f"  {i+1}. {item}\n")
-            else:
-                weekly_data = None
-                with open(debug_log_path, 'a', encoding='utf-8') as f:
-                    f.write("주봉 데이터 처리 실패\n")
-        else:
-            weekly_data = None
-            with open(debug_log_path, 'a', encoding='utf-8') as f:
-                f.write("주봉 파일을 찾을 수 없음\n")
-        
-        # 월봉 데이터 - 저장된 월봉 데이터 사용
-        monthly_files = []
-        for filename in os.listdir(data_dir):
-            if filename.startswith(f"{ticker}_") and filename.endswith("_ohlcv_m.csv"):
-                monthly_files.append(filename)
-        
-        with open(debug_log_path, 'a', encoding='utf-8') as f:
-            f.write(f"발견된 월봉 파일들: {monthly_files}\n")
-        
-        if monthly_files:
-            latest_monthly_file = max(monthly_files)
-            monthly_path = os.path.join(data_dir, latest_monthly_file)
-            # [메모] 2025-08-19: 월봉도 서비스 호출로 대체
-            # 기존 코드: monthly_df = pd.read_csv(monthly_path, index_col=0)
-            try:
-                monthly_df = _drs_tmp.read_ohlcv_csv(ticker, market_guess, 'm')
-            except Exception:
-                monthly_df = pd.DataFrame()
-            
-            with open(debug_log_path, 'a', encoding='utf-8') as f:
-                f.write(f"선택된 월봉 파일: {latest_monthly_file}\n")
-                f.write(f"로드된 월봉 데이터 행 수: {len(monthly_df)}\n")
-            
-            try:
-                monthly_df.index = pd.to_datetime(monthly_df.index, utc=True)
-                monthly_df.index = monthly_df.index.tz_localize(None)
-            except Exception as e:
-                logging.error(f"Failed to convert monthly index to datetime: {e}")
-                monthly_df = pd.DataFrame()
-            
-            if isinstance(monthly_df.columns, pd.MultiIndex):
-                monthly_df.columns = monthly_df.columns.get_level_values(0)
-            
-            if not monthly_df.empty and all(col in monthly_df.columns for col in required_columns):
-                monthly_df = monthly_df[required_columns].dropna()
-                monthly_data = format_ohlcv_data(monthly_df, "월봉")
-                
-                with open(debug_log_path, 'a', encoding='utf-8') as f:
-                    f.write(f"포맷팅된 월봉 데이터 개수: {len(monthly_data)}\n")
-                    if monthly_data:
-                        f.write(f"월봉 데이터 샘플 (최근 5개):\n")
-                        for i, item in enumerate(monthly_data[-5:]):
-                            f.write(f"  {i+1}. {item}\n")
-            else:
-                monthly_data = None
-                with open(debug_log_path, 'a', encoding='utf-8') as f:
-                    f.write("월봉 데이터 처리 실패\n")
-        else:
-            monthly_data = None
-            with open(debug_log_path, 'a', encoding='utf-8') as f:
-                f.write("월봉 파일을 찾을 수 없음\n")
-        
-        logging.info(f"데이터 로딩 디버그 로그 저장됨: {debug_log_path}")
-        
         return daily_data, weekly_data, monthly_data
         
     except Exception as e:
@@ -489,33 +503,23 @@ def get_ohlcv_data_for_ai(ticker, market_type='KOSPI'):
 
 def format_ohlcv_data(df, timeframe):
     """OHLCV 데이터를 AI 분석용으로 포맷팅합니다."""
-    try:
-        formatted_data = []
-        for date, row in df.iterrows():
-            formatted_data.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'open': round(row['Open'], 2),
-                'high': round(row['High'], 2),
-                'low': round(row['Low'], 2),
-                'close': round(row['Close'], 2),
-                'volume': int(row['Volume'])
-            })
-        
-        return formatted_data
-        
-    except Exception as e:
-        logging.error(f"Error formatting OHLCV data: {e}")
-        return []
+    # 가격 4개 컬럼은 연속 배열로 한 번에 반올림, 거래량은 정수 배열로 변환
+    prices = np.round(df[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float64), 2)
+    volumes = df['Volume'].to_numpy().astype(np.int64, copy=False)
+    dates = df.index.strftime('%Y-%m-%d')
+    keys = ('date', 'open', 'high', 'low', 'close', 'volume')
+    return [
+        dict(zip(keys, row))
+        for row in zip(dates, *prices.T.tolist(), volumes.tolist())
+    ]
 
 def perform_ai_analysis(ticker, daily_data, weekly_data, monthly_data, market_type='KOSPI', company_name=None):
     """AI 분석을 수행합니다."""
     try:
         # 새로운 AI 분석 서비스 사용
-        from services.analysis.ai_analysis_service import AIAnalysisService
-        ai_service = AIAnalysisService()
         
         # AI 분석 수행
-        analysis_result, error = ai_service.analyze_stock(ticker, market_type, company_name)
+        analysis_result, error = _ai_service.analyze_stock(ticker, market_type, company_name)
         
         return analysis_result, error
         
@@ -527,11 +531,9 @@ def perform_ai_analysis(ticker, daily_data, weekly_data, monthly_data, market_ty
 def perform_ai_analysis_with_data(ticker, daily_data, weekly_data, monthly_data, market_type='KOSPI', company_name=None):
     """[2025-08-09 추가] 지표 포함 데이터로 AI 분석을 수행합니다."""
     try:
-        from services.analysis.ai_analysis_service import AIAnalysisService
-        ai_service = AIAnalysisService()
         
         # 이미 로딩된 지표 포함 데이터를 AI 서비스에 직접 전달
-        analysis_result, error = ai_service.analyze_stock_with_data(
+        analysis_result, error = _ai_service.analyze_stock_with_data(
             ticker, daily_data, weekly_data, monthly_data, market_type, company_name
         )
         
@@ -543,13 +545,83 @@ def perform_ai_analysis_with_data(ticker, daily_data, weekly_data, monthly_data,
         logging.error(error_msg)
         return None, error_msg
 
+# CrossInfo 컬럼명 별칭 -> 표준 키 매핑 (정규화 결과를 모듈 로드 시 1회 계산)
+_NORM_RE = re.compile(r"[^a-z0-9]")
+
+def _norm_col(s) -> str:
+    return _NORM_RE.sub("", str(s).lower())
+
+_CROSS_TARGET_ALIASES = {
+    'Close_Gap_EMA20': ['Close_Gap_EMA20','CloseGapEMA20','close_gap_ema20','Close-EMA20-Gap','Gap_EMA20','GapEMA20','Close_EMA20_Gap'],
+    'Close_Gap_EMA40': ['Close_Gap_EMA40','CloseGapEMA40','close_gap_ema40','Close-EMA40-Gap','Gap_EMA40','GapEMA40','Close_EMA40_Gap'],
+    'EMA_Array_Order': ['EMA_Array_Order','EMAArrayOrder','ema_array_order','EMA_Order','EMA Array Order','EmaArrayOrder']
+}
+_CROSS_ALIAS_ARRAYS = {
+    t: np.array(sorted({_norm_col(a) for a in aliases}), dtype=object)
+    for t, aliases in _CROSS_TARGET_ALIASES.items()
+}
+
+@lru_cache(maxsize=256)
+def _resolve_cross_cols(columns: tuple) -> tuple:
+    """CrossInfo 컬럼 튜플을 ((표준키, 원본컬럼), ...)으로 해석 (동일 스키마는 캐시 재사용)"""
+    # 컬럼명을 한 번만 정규화한 뒤 표준 키별로 np.isin 매칭, 첫 번째 일치 컬럼을 사용
+    # (표준 키별 별칭 집합은 서로 겹치지 않으므로 컬럼 순회 방식과 결과가 동일)
+    ncols = np.fromiter((_norm_col(c) for c in columns), dtype=object, count=len(columns))
+    resolved = []
+    for target, alias_arr in _CROSS_ALIAS_ARRAYS.items():
+        hits = np.flatnonzero(np.isin(ncols, alias_arr))
+        if hits.size:
+            resolved.append((target, columns[hits[0]]))
+    return tuple(resolved)
+
+# AI 프롬프트용 데이터 포인트: 원본 컬럼 → 출력 키 (출력 순서 유지)
+_COL_TO_KEY = {
+    'Open': 'open',
+    'High': 'high',
+    'Low': 'low',
+    'Close': 'close',
+    'Volume': 'volume',
+    'EMA5': 'ema5',
+    'EMA20': 'ema20',
+    'EMA40': 'ema40',
+    'MACD': 'macd',
+    'MACD_Signal': 'macd_signal',
+    'MACD_Histogram': 'macd_histogram',
+    'BB_Upper': 'bb_upper',
+    'BB_Middle': 'bb_middle',
+    'BB_Lower': 'bb_lower',
+    'RSI': 'rsi',
+    'Stoch_K': 'stoch_k',
+    'Stoch_D': 'stoch_d',
+    'Ichimoku_Tenkan': 'ichimoku_tenkan',
+    'Ichimoku_Kijun': 'ichimoku_kijun',
+    'Ichimoku_Senkou_A': 'ichimoku_senkou_a',
+    'Ichimoku_Senkou_B': 'ichimoku_senkou_b',
+    'Volume_Ratio_5d': 'volume_ratio_5d',
+    'Volume_Ratio_20d': 'volume_ratio_20d',
+    'Volume_Ratio_40d': 'volume_ratio_40d',
+    'Close_Gap_EMA20': 'close_gap_ema20',
+    'Close_Gap_EMA40': 'close_gap_ema40',
+}
+# 가격 컬럼은 값이 없으면 0, 지표는 None
+_OHLC_KEYS = ('open', 'high', 'low', 'close')
+# 소수점 자릿수 (MACD 계열만 4자리)
+_PRECISION = {
+    key: (4 if key.startswith('macd') else 2)
+    for key in _COL_TO_KEY.values() if key != 'volume'
+}
+
+def _load_indicator_timeframes(ticker, market):
+    """일/주/월봉 OHLCV+지표 데이터를 지표 로딩 전용 executor로 동시에 로딩합니다."""
+    return tuple(_INDICATOR_LOAD_EXECUTOR.map(
+        lambda tf_label: get_ohlcv_with_indicators(ticker, tf_label[0], market),
+        _AI_TIMEFRAMES
+    ))
+
 def get_ohlcv_with_indicators(ticker, timeframe, market_type='KOSPI'):
     """OHLCV 데이터와 지표 데이터를 함께 가져옵니다."""
     try:
-        import glob
-        import pandas as pd
-        
-        logging.info(f"get_ohlcv_with_indicators: 시작 - 티커: {ticker}, 타임프레임: {timeframe}, 시장: {market_type}")
+        logger.info("get_ohlcv_with_indicators: 시작 - 티커: %s, 타임프레임: %s, 시장: %s", ticker, timeframe, market_type)
         
         # market_type을 실제 폴더명으로 변환
         if market_type.upper() in ['KOSPI', 'KOSDAQ']:
@@ -560,14 +632,13 @@ def get_ohlcv_with_indicators(ticker, timeframe, market_type='KOSPI'):
             # 기본값은 KOSPI
             actual_market_type = 'KOSPI'
         
-        logging.info(f"get_ohlcv_with_indicators: 실제 폴더명: {actual_market_type}")
+        logger.info("get_ohlcv_with_indicators: 실제 폴더명: %s", actual_market_type)
         # 디버그: 최신 파일 경로 확인 (OHLCV / Indicators)
         try:
-            from services.market.file_management_service import FileManagementService
             fms = FileManagementService()
             latest_ohlcv_path = fms.get_latest_file(ticker, 'ohlcv', actual_market_type, timeframe)
             latest_ind_path = fms.get_latest_file(ticker, 'indicators', actual_market_type, timeframe)
-            logging.info(f"get_ohlcv_with_indicators: 최신 경로 확인 - OHLCV={latest_ohlcv_path}, IND={latest_ind_path}")
+            logger.info("get_ohlcv_with_indicators: 최신 경로 확인 - OHLCV=%s, IND=%s", latest_ohlcv_path, latest_ind_path)
         except Exception as path_err:
             logging.warning(f"get_ohlcv_with_indicators: 최신 경로 확인 실패: {path_err}")
         
@@ -580,11 +651,9 @@ def get_ohlcv_with_indicators(ticker, timeframe, market_type='KOSPI'):
         
         # [2025-08-09 수정] admin_home과 동일한 방식으로 지표 데이터 로드
         try:
-            from services.technical_indicators_service import TechnicalIndicatorsService
-            technical_service = TechnicalIndicatorsService()
             
             # 지표 데이터 로드 (인자 순서 교정, caller 제거)
-            indicators_df = technical_service.read_indicators_csv(ticker, actual_market_type, timeframe)
+            indicators_df = _indicators_service.read_indicators_csv(ticker, actual_market_type, timeframe)
             
             # None 체크 및 DataFrame 검증 강화
             if indicators_df is None:
@@ -608,25 +677,27 @@ def get_ohlcv_with_indicators(ticker, timeframe, market_type='KOSPI'):
                 else:
                     return daily_data
             
-            logging.info(f"get_ohlcv_with_indicators: [{ticker}] 지표 데이터 로딩 성공 (admin_home 방식) - 형태: {indicators_df.shape}")
+            logger.info("get_ohlcv_with_indicators: [%s] 지표 데이터 로딩 성공 (admin_home 방식) - 형태: %s", ticker, indicators_df.shape)
             
         except Exception as e:
             logging.error(f"get_ohlcv_with_indicators: [{ticker}] 지표 로딩 실패 (admin_home 방식): {e}")
             # Fallback: 서비스 함수를 그대로 사용 (직접 CSV 파싱 제거, 메타데이터 문제 방지)
             try:
-                indicators_df = technical_service.read_indicators_csv(ticker, actual_market_type, timeframe)
+                indicators_df = _indicators_service.read_indicators_csv(ticker, actual_market_type, timeframe)
                 try:
                     shape_info = getattr(indicators_df, 'shape', None)
                     cols_preview = list(indicators_df.columns)[:12] if hasattr(indicators_df, 'columns') else []
-                    logging.info(f"get_ohlcv_with_indicators: [{ticker}] indicators_df 로딩 완료 - shape={shape_info}, cols_preview={cols_preview}")
+                    logger.info("get_ohlcv_with_indicators: [%s] indicators_df 로딩 완료 - shape=%s, cols_preview=%s", ticker, shape_info, cols_preview)
                 except Exception as info_err:
                     logging.warning(f"get_ohlcv_with_indicators: indicators_df 정보 로깅 실패: {info_err}")
             except Exception as e2:
                 logging.error(f"get_ohlcv_with_indicators: [{ticker}] 지표 로딩 재시도 실패: {e2}")
                 indicators_df = pd.DataFrame()
         
-        logging.info(f"get_ohlcv_with_indicators: [{ticker}] 지표 데이터 형태: {indicators_df.shape}")
-        logging.info(f"get_ohlcv_with_indicators: [{ticker}] 지표 데이터 컬럼들: {list(indicators_df.columns)}")
+        # 컬럼 목록 문자열화는 INFO 로그가 실제로 출력될 때만 수행
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("get_ohlcv_with_indicators: [%s] 지표 데이터 형태: %s", ticker, indicators_df.shape)
+            logger.info("get_ohlcv_with_indicators: [%s] 지표 데이터 컬럼들: %s", ticker, list(indicators_df.columns))
         
         if indicators_df.empty:
             logging.warning(f"get_ohlcv_with_indicators: [{ticker}] {timeframe}에 대한 지표 데이터가 비어있음")
@@ -634,13 +705,13 @@ def get_ohlcv_with_indicators(ticker, timeframe, market_type='KOSPI'):
             daily_data, weekly_data, monthly_data = get_ohlcv_data_for_ai(ticker, market_type)
             
             if timeframe == 'd':
-                logging.info(f"get_ohlcv_with_indicators: [{ticker}] 일봉 데이터 반환 (개수: {len(daily_data) if daily_data else 0})")
+                logger.info("get_ohlcv_with_indicators: [%s] 일봉 데이터 반환 (개수: %s)", ticker, len(daily_data) if daily_data else 0)
                 return daily_data
             elif timeframe == 'w':
-                logging.info(f"get_ohlcv_with_indicators: [{ticker}] 주봉 데이터 반환 (개수: {len(weekly_data) if weekly_data else 0})")
+                logger.info("get_ohlcv_with_indicators: [%s] 주봉 데이터 반환 (개수: %s)", ticker, len(weekly_data) if weekly_data else 0)
                 return weekly_data
             elif timeframe == 'm':
-                logging.info(f"get_ohlcv_with_indicators: [{ticker}] 월봉 데이터 반환 (개수: {len(monthly_data) if monthly_data else 0})")
+                logger.info("get_ohlcv_with_indicators: [%s] 월봉 데이터 반환 (개수: %s)", ticker, len(monthly_data) if monthly_data else 0)
                 return monthly_data
             else:
                 logging.warning(f"get_ohlcv_with_indicators: [{ticker}] 알 수 없는 timeframe: {timeframe}, 일봉 데이터 반환")
@@ -648,63 +719,56 @@ def get_ohlcv_with_indicators(ticker, timeframe, market_type='KOSPI'):
         
         # OHLCV + 지표 + CrossInfo 병합
         try:
-            from services.market.data_reading_service import DataReadingService
-            drs = DataReadingService()
-            ohlcv_df = drs.read_ohlcv_csv(ticker, actual_market_type, timeframe)
+            ohlcv_df = _drs.read_ohlcv_csv(ticker, actual_market_type, timeframe)
             if ohlcv_df is None or ohlcv_df.empty:
                 logging.warning(f"get_ohlcv_with_indicators: [{ticker}] OHLCV 데이터 없음 ({timeframe})")
             else:
                 # 2025-08-16: 병합 충돌 방지 - indicators_df의 OHLCV/메타 컬럼 전체 제거 후 병합
+                # 컬럼명 정규화/중복 판정은 Index 연산으로 한 번에 처리
                 try:
-                    drop_candidates = {'open','high','low','close','volume','adj close','date','date_index','time_index'}
-                    cols_to_drop = [col for col in indicators_df.columns if str(col).strip().lower() in drop_candidates]
-                    if cols_to_drop:
-                        logging.info(f"get_ohlcv_with_indicators: [{ticker}] 지표 DF 충돌 컬럼 제거: {cols_to_drop}")
+                    drop_candidates = ['open','high','low','close','volume','adj close','date','date_index','time_index']
+                    lowered = indicators_df.columns.astype(str).str.strip().str.lower()
+                    cols_to_drop = indicators_df.columns[lowered.isin(drop_candidates)].union(
+                        indicators_df.columns.intersection(ohlcv_df.columns)
+                    )
+                    if len(cols_to_drop):
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("get_ohlcv_with_indicators: [%s] 지표 DF 충돌 컬럼 제거: %s", ticker, list(cols_to_drop))
                         indicators_df = indicators_df.drop(columns=cols_to_drop, errors='ignore')
                 except Exception as drop_err:
                     logging.warning(f"get_ohlcv_with_indicators: [{ticker}] 충돌 컬럼 제거 중 경고: {drop_err}")
 
                 # 인덱스 시간대 정규화(양쪽 tz-naive)
-                try:
-                    if isinstance(ohlcv_df.index, pd.DatetimeIndex) and ohlcv_df.index.tz is not None:
-                        ohlcv_df.index = ohlcv_df.index.tz_localize(None)
-                    if isinstance(indicators_df.index, pd.DatetimeIndex) and indicators_df.index.tz is not None:
-                        indicators_df.index = indicators_df.index.tz_localize(None)
-                except Exception:
-                    pass
+                if getattr(ohlcv_df.index, 'tz', None) is not None:
+                    ohlcv_df.index = ohlcv_df.index.tz_localize(None)
+                if getattr(indicators_df.index, 'tz', None) is not None:
+                    indicators_df.index = indicators_df.index.tz_localize(None)
 
-                indicators_df = ohlcv_df.join(indicators_df, how='left')
-                logging.info(f"get_ohlcv_with_indicators: [{ticker}] OHLCV+지표 병합 완료: {indicators_df.shape}")
+                # left join 의미 유지: 지표를 OHLCV 인덱스에 맞춘 뒤 블록 단위로 결합
+                # (reindex는 중복 라벨을 허용하지 않으므로 최신 행만 유지)
+                if indicators_df.index.has_duplicates:
+                    indicators_df = indicators_df[~indicators_df.index.duplicated(keep='last')]
+                indicators_df = pd.concat(
+                    [ohlcv_df, indicators_df.reindex(ohlcv_df.index)], axis=1, copy=False
+                )
+                logger.info("get_ohlcv_with_indicators: [%s] OHLCV+지표 병합 완료: %s", ticker, indicators_df.shape)
             # CrossInfo 병합 (갭/EMA 배열 정보) - 컬럼 자동 매핑 포함
             try:
-                cross_df = drs.read_crossinfo_csv(ticker, actual_market_type)
+                cross_df = _drs.read_crossinfo_csv(ticker, actual_market_type)
                 if cross_df is not None and not cross_df.empty:
                     # 날짜 컬럼 정규화
                     if 'Date' in cross_df.columns:
                         cross_df['Date'] = pd.to_datetime(cross_df['Date'])
                         cross_df.set_index('Date', inplace=True)
-                    # 자동 매핑: 다양한 컬럼명 변형을 표준 키로 정규화
-                    import re
-                    def _norm(s: str) -> str:
-                        return re.sub(r"[^a-z0-9]", "", s.lower())
-
-                    target_to_aliases = {
-                        'Close_Gap_EMA20': ['Close_Gap_EMA20','CloseGapEMA20','close_gap_ema20','Close-EMA20-Gap','Gap_EMA20','GapEMA20','Close_EMA20_Gap'],
-                        'Close_Gap_EMA40': ['Close_Gap_EMA40','CloseGapEMA40','close_gap_ema40','Close-EMA40-Gap','Gap_EMA40','GapEMA40','Close_EMA40_Gap'],
-                        'EMA_Array_Order': ['EMA_Array_Order','EMAArrayOrder','ema_array_order','EMA_Order','EMA Array Order','EmaArrayOrder']
-                    }
-                    normalized_aliases = {t: {_norm(a) for a in aliases} for t, aliases in target_to_aliases.items()}
-                    resolved_cols = {}  # {target: original_col}
-                    for original_col in list(cross_df.columns):
-                        ncol = _norm(original_col)
-                        for target, nset in normalized_aliases.items():
-                            if ncol in nset and target not in resolved_cols:
-                                resolved_cols[target] = original_col
-                                break
+                    # 자동 매핑: 다양한 컬럼명 변형을 표준 키로 정규화 (모듈 캐시 사용)
+                    resolved_cols = dict(_resolve_cross_cols(tuple(cross_df.columns)))  # {target: original_col}
                     if resolved_cols:
-                        sub_df = cross_df[list(resolved_cols.values())].rename(columns={v: k for k, v in resolved_cols.items()})
+                        # 선택 결과는 이미 새 프레임이므로 rename 복사 없이 컬럼 라벨만 표준 키로 교체
+                        sub_df = cross_df[list(resolved_cols.values())]
+                        sub_df.columns = list(resolved_cols)
                         indicators_df = indicators_df.join(sub_df, how='left')
-                        logging.info(f"get_ohlcv_with_indicators: [{ticker}] CrossInfo 자동매핑 병합 완료: targets={list(resolved_cols.keys())}")
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("get_ohlcv_with_indicators: [%s] CrossInfo 자동매핑 병합 완료: targets=%s", ticker, list(resolved_cols.keys()))
             except Exception as cx_err:
                 logging.warning(f"get_ohlcv_with_indicators: [{ticker}] CrossInfo 병합 실패: {cx_err}")
         except Exception as merge_err:
@@ -716,71 +780,33 @@ def get_ohlcv_with_indicators(ticker, timeframe, market_type='KOSPI'):
         if missing_core:
             logging.warning(f"get_ohlcv_with_indicators: [{ticker}] 핵심 OHLCV 컬럼 누락: {missing_core} (병합 실패 가능)")
         recent_data = indicators_df.tail(31)
-        logging.info(f"get_ohlcv_with_indicators: [{ticker}] 최근 31개 데이터 선택됨 (post-merge)")
+        logger.info("get_ohlcv_with_indicators: [%s] 최근 31개 데이터 선택됨 (post-merge)", ticker)
 
-        # 데이터를 딕셔너리 리스트로 변환
-        data_list = []
-        for i, (date, row) in enumerate(recent_data.iterrows()):
-            try:
-                # 안전 접근: 컬럼 부재/대소문자 차이/NaN 대응
-                def gv(r, k, default=None):
-                    return r[k] if (k in r and pd.notna(r[k])) else default
-                data_point = {
-                    'date': date.strftime('%Y-%m-%d'),
-                    'open': round(gv(row, 'Open', 0), 2),
-                    'high': round(gv(row, 'High', 0), 2),
-                    'low': round(gv(row, 'Low', 0), 2),
-                    'close': round(gv(row, 'Close', 0), 2),
-                    'volume': int(gv(row, 'Volume', 0) or 0),
-                    'ema5': round(gv(row, 'EMA5'), 2) if gv(row, 'EMA5') is not None else None,
-                    'ema20': round(gv(row, 'EMA20'), 2) if gv(row, 'EMA20') is not None else None,
-                    'ema40': round(gv(row, 'EMA40'), 2) if gv(row, 'EMA40') is not None else None,
-                    'macd': round(gv(row, 'MACD'), 4) if gv(row, 'MACD') is not None else None,
-                    'macd_signal': round(gv(row, 'MACD_Signal'), 4) if gv(row, 'MACD_Signal') is not None else None,
-                    'macd_histogram': round(gv(row, 'MACD_Histogram'), 4) if gv(row, 'MACD_Histogram') is not None else None,
-                    'bb_upper': round(gv(row, 'BB_Upper'), 2) if gv(row, 'BB_Upper') is not None else None,
-                    'bb_middle': round(gv(row, 'BB_Middle'), 2) if gv(row, 'BB_Middle') is not None else None,
-                    'bb_lower': round(gv(row, 'BB_Lower'), 2) if gv(row, 'BB_Lower') is not None else None,
-                    'rsi': round(gv(row, 'RSI'), 2) if gv(row, 'RSI') is not None else None,
-                    'stoch_k': round(gv(row, 'Stoch_K'), 2) if gv(row, 'Stoch_K') is not None else None,
-                    'stoch_d': round(gv(row, 'Stoch_D'), 2) if gv(row, 'Stoch_D') is not None else None,
-                    'ichimoku_tenkan': round(gv(row, 'Ichimoku_Tenkan'), 2) if gv(row, 'Ichimoku_Tenkan') is not None else None,
-                    'ichimoku_kijun': round(gv(row, 'Ichimoku_Kijun'), 2) if gv(row, 'Ichimoku_Kijun') is not None else None,
-                    'ichimoku_senkou_a': round(gv(row, 'Ichimoku_Senkou_A'), 2) if gv(row, 'Ichimoku_Senkou_A') is not None else None,
-                    'ichimoku_senkou_b': round(gv(row, 'Ichimoku_Senkou_B'), 2) if gv(row, 'Ichimoku_Senkou_B') is not None else None,
-                    'volume_ratio_5d': round(gv(row, 'Volume_Ratio_5d'), 2) if gv(row, 'Volume_Ratio_5d') is not None else None,
-                    'volume_ratio_20d': round(gv(row, 'Volume_Ratio_20d'), 2) if gv(row, 'Volume_Ratio_20d') is not None else None,
-                    'volume_ratio_40d': round(gv(row, 'Volume_Ratio_40d'), 2) if gv(row, 'Volume_Ratio_40d') is not None else None,
-                    'close_gap_ema20': round(gv(row, 'Close_Gap_EMA20'), 2) if gv(row, 'Close_Gap_EMA20') is not None else None,
-                    'close_gap_ema40': round(gv(row, 'Close_Gap_EMA40'), 2) if gv(row, 'Close_Gap_EMA40') is not None else None,
-                }
-                data_list.append(data_point)
-                
-                # EMA 배열 문자열 보강: (가능 시)
-                try:
-                    if 'EMA_Array_Order' in row and pd.notna(row['EMA_Array_Order']):
-                        data_point['ema_array'] = {'full_array': str(row['EMA_Array_Order'])}
-                except Exception:
-                    pass
+        # 데이터를 딕셔너리 리스트로 변환 (행 단위 루프 없이 프레임 전체를 한 번에 변환)
+        # 누락 컬럼은 NaN으로 채워 None이 되도록 하고, 문자열 등 비수치 값은 NaN으로 강제
+        frame = recent_data.reindex(columns=list(_COL_TO_KEY)).rename(columns=_COL_TO_KEY)
+        frame = frame.apply(pd.to_numeric, errors='coerce').round(_PRECISION)
+        frame[list(_OHLC_KEYS)] = frame[list(_OHLC_KEYS)].fillna(0)
+        frame['volume'] = frame['volume'].fillna(0).astype('int64')
+        frame = frame.astype(object).where(frame.notna(), None)
+        frame.insert(0, 'date', recent_data.index.strftime('%Y-%m-%d'))
+        data_list = frame.to_dict(orient='records')
 
-                # 첫 번째 항목의 키들을 로깅
-                if i == 0:
-                    # logging.info(f"get_ohlcv_with_indicators: [{ticker}] 첫 번째 데이터 포인트 키들: {list(data_point.keys())}")
-                    # logging.info(f"get_ohlcv_with_indicators: [{ticker}] 첫 번째 데이터 포인트 샘플: {data_point}")
-                    pass
-                
-            except Exception as row_error:
-                logging.error(f"get_ohlcv_with_indicators: [{ticker}] 행 {i} 처리 오류: {row_error}")
-                logging.error(f"get_ohlcv_with_indicators: [{ticker}] 문제 행 데이터: {row}")
-                continue
+        # EMA 배열 문자열 보강: (가능 시)
+        # CrossInfo CSV에는 배열 순서가 이미 문자열로 저장되어 있으므로 컬럼 단위로 한 번만 변환
+        if 'EMA_Array_Order' in recent_data.columns:
+            orders = recent_data['EMA_Array_Order']
+            for data_point, has_order, order in zip(data_list, orders.notna().tolist(), orders.astype(str).tolist()):
+                if has_order:
+                    data_point['ema_array'] = {'full_array': order}
         
-        logging.info(f"get_ohlcv_with_indicators: [{ticker}] 성공적으로 {len(data_list)}개 데이터 포인트 로드됨 ({timeframe})")
+        logger.info("get_ohlcv_with_indicators: [%s] 성공적으로 %s개 데이터 포인트 로드됨 (%s)", ticker, len(data_list), timeframe)
         
         # 지표 데이터가 포함되었는지 확인
         if data_list and len(data_list) > 0:
             first_item = data_list[0]
             if 'ema5' in first_item:
-                logging.info(f"get_ohlcv_with_indicators: [{ticker}] 지표 데이터가 포함된 데이터 반환")
+                logger.info("get_ohlcv_with_indicators: [%s] 지표 데이터가 포함된 데이터 반환", ticker)
             else:
                 logging.warning(f"get_ohlcv_with_indicators: [{ticker}] 지표 데이터가 포함되지 않은 데이터 반환")
         
@@ -798,9 +824,55 @@ def get_ohlcv_with_indicators(ticker, timeframe, market_type='KOSPI'):
             return monthly_data
         return daily_data
 
+def _to_float_or_nan(value) -> float:
+    """단일 값을 float로 변환 (None/변환 불가 값은 NaN)"""
+    try:
+        return float(value) if value is not None else np.nan
+    except (ValueError, TypeError):
+        return np.nan
+
+def _format_indicator_matrix(data, indicator_keys):
+    """
+    지표 값을 (행 x 지표) float64 행렬로 적재한 뒤 한 번의 벡터 연산으로 '%.4f' 문자열 행렬을 만듭니다.
+    결측/변환 불가 값은 빈 문자열로 표시됩니다.
+    """
+    values = _to_float_matrix([[item.get(key) for key in indicator_keys] for item in data])
+    formatted = np.char.mod('%.4f', values)
+    return np.where(np.isnan(values), '', formatted).tolist()
+
+# 프롬프트 지표 컬럼 (출력 순서)
+_PROMPT_INDICATOR_KEYS = (
+    'ema5', 'ema20', 'ema40', 'macd', 'macd_signal', 'macd_histogram',
+    'rsi', 'bb_upper', 'bb_middle', 'bb_lower', 'stoch_k', 'stoch_d',
+    'ichimoku_tenkan', 'ichimoku_kijun', 'volume_ratio_5d', 'volume_ratio_20d', 'volume_ratio_40d'
+)
+
+_PROMPT_OHLCV_KEYS = (('open', 'Open'), ('high', 'High'), ('low', 'Low'), ('close', 'Close'), ('volume', 'Volume'))
+
+def _to_float_matrix(rows) -> np.ndarray:
+    """값 목록의 목록을 float64 행렬로 적재 (변환 불가 값이 섞인 경우에만 셀 단위 변환, 결측은 NaN)"""
+    try:
+        return np.array(rows, dtype=np.float64)
+    except (ValueError, TypeError):
+        return np.array([[_to_float_or_nan(v) for v in row] for row in rows], dtype=np.float64)
+
+def _pick(item: dict, key: str, alt_key: str, default=0):
+    """소문자 키 우선 조회, 값이 없을(None) 때만 대문자 키로 대체 (0/0.0은 유효값으로 유지)"""
+    value = item.get(key)
+    return value if value is not None else item.get(alt_key, default)
+
+def _extract_ohlcv_matrix(data):
+    """
+    OHLCV 값을 (행 x 5) float64 행렬로 한 번에 적재합니다 (키 대소문자 구분 없이 처리).
+    결측/변환 불가 값은 0으로 대체되며, 거래량은 int64로 반환됩니다.
+    """
+    rows = [[_pick(item, lower, upper) for lower, upper in _PROMPT_OHLCV_KEYS] for item in data]
+    values = np.nan_to_num(_to_float_matrix(rows), nan=0.0)
+    return values[:, :4], values[:, 4].astype(np.int64)
+
 def format_data_with_indicators_for_prompt(data):
     """지표 데이터를 포함한 데이터를 프롬프트용으로 포맷팅합니다."""
-    logging.info(f"format_data_with_indicators_for_prompt: 데이터 개수 {len(data) if data else 0}")
+    logger.info("format_data_with_indicators_for_prompt: 데이터 개수 %s", len(data) if data else 0)
     
     if not data:
         logging.warning("format_data_with_indicators_for_prompt: 데이터가 비어있음")
@@ -822,36 +894,18 @@ def format_data_with_indicators_for_prompt(data):
             logging.error(f"format_data_with_indicators_for_prompt: 첫 번째 항목이 딕셔너리가 아님. 타입: {type(first_item)}")
             return "데이터 형식 오류"
         
-        logging.info(f"format_data_with_indicators_for_prompt: 첫 번째 항목 키들: {list(first_item.keys())}")
-        # 디버그: 지표 키 미존재 시 원인 추적 로그 강화
-        try:
-            missing_keys = []
-            for key in ['ema5','ema20','ema40','macd','macd_signal','macd_histogram','bb_upper','bb_middle','bb_lower','rsi','stoch_k','stoch_d']:
-                if key not in first_item:
-                    missing_keys.append(key)
-            if missing_keys:
-                logging.warning(f"format_data_with_indicators_for_prompt: 지표 키 누락: {missing_keys}")
-        except Exception as mk_err:
-            logging.warning(f"format_data_with_indicators_for_prompt: 지표 키 점검 실패: {mk_err}")
-        
-        # 첫 번째 항목 확인 및 디버깅
-        if data and len(data) > 0:
-            first_item = data[0]
-            logging.info(f"format_data_with_indicators_for_prompt: 첫 번째 항목 키들: {list(first_item.keys())}")
-            
-            # 지표 키들 확인 및 로깅
+        # 지표 키 결정: 첫 항목 키 집합을 한 번만 계산 (ema5가 있을 때만 지표 포함)
+        first_keys = set(first_item)
+        if 'ema5' in first_keys:
+            indicator_keys = list(_PROMPT_INDICATOR_KEYS)
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                missing_keys = [key for key in _PROMPT_INDICATOR_KEYS if key not in first_keys]
+                if missing_keys:
+                    logging.debug(f"format_data_with_indicators_for_prompt: 지표 키 누락: {missing_keys}")
+        else:
+            logging.warning("format_data_with_indicators_for_prompt: ema5 키가 없음 - 지표 데이터가 포함되지 않음")
+            # 기본 OHLCV 데이터만 처리
             indicator_keys = []
-            if 'ema5' in first_item:
-                indicator_keys = [
-                    'ema5', 'ema20', 'ema40', 'macd', 'macd_signal', 'macd_histogram',
-                    'rsi', 'bb_upper', 'bb_middle', 'bb_lower', 'stoch_k', 'stoch_d',
-                    'ichimoku_tenkan', 'ichimoku_kijun', 'volume_ratio_5d', 'volume_ratio_20d', 'volume_ratio_40d'
-                ]
-                logging.info(f"format_data_with_indicators_for_prompt: 지표 키들 발견: {indicator_keys}")
-            else:
-                logging.warning("format_data_with_indicators_for_prompt: ema5 키가 없음 - 지표 데이터가 포함되지 않음")
-                # 기본 OHLCV 데이터만 처리
-                indicator_keys = []
         
         formatted_lines = []
         
@@ -859,78 +913,33 @@ def format_data_with_indicators_for_prompt(data):
         if indicator_keys:
             header = "날짜, 시가, 고가, 저가, 종가, 거래량 | 지표: " + ", ".join([key.upper() for key in indicator_keys])
             formatted_lines.append(header)
-            logging.info(f"format_data_with_indicators_for_prompt: 헤더 추가: {header}")
+            logger.info("format_data_with_indicators_for_prompt: 헤더 추가: %s", header)
         else:
             header = "날짜, 시가, 고가, 저가, 종가, 거래량"
             formatted_lines.append(header)
-            logging.info(f"format_data_with_indicators_for_prompt: 기본 헤더 추가: {header}")
+            logger.info("format_data_with_indicators_for_prompt: 기본 헤더 추가: %s", header)
         
-        # 데이터 라인들 추가
-        processed_count = 0
-        for i, item in enumerate(data):
-            try:
-                # 기본 OHLCV 데이터 - 키 이름 대소문자 구분 없이 처리
-                open_val = item.get('open') or item.get('Open', 0)
-                high_val = item.get('high') or item.get('High', 0)
-                low_val = item.get('low') or item.get('Low', 0)
-                close_val = item.get('close') or item.get('Close', 0)
-                volume_val = item.get('volume') or item.get('Volume', 0)
-                date_val = item.get('date') or item.get('Date', '')
-                
-                # numpy.float64 타입 처리
-                if hasattr(open_val, 'item'):
-                    open_val = open_val.item()
-                if hasattr(high_val, 'item'):
-                    high_val = high_val.item()
-                if hasattr(low_val, 'item'):
-                    low_val = low_val.item()
-                if hasattr(close_val, 'item'):
-                    close_val = close_val.item()
-                if hasattr(volume_val, 'item'):
-                    volume_val = volume_val.item()
-                
-                # float 변환 및 안전한 처리
-                try:
-                    open_val = float(open_val) if open_val is not None else 0
-                    high_val = float(high_val) if high_val is not None else 0
-                    low_val = float(low_val) if low_val is not None else 0
-                    close_val = float(close_val) if close_val is not None else 0
-                    volume_val = int(volume_val) if volume_val is not None else 0
-                except (ValueError, TypeError) as conv_error:
-                    logging.error(f"format_data_with_indicators_for_prompt: 값 변환 오류 (항목 {i}): {conv_error}")
-                    open_val = high_val = low_val = close_val = volume_val = 0
-                
-                line = f"{date_val}, {open_val:.2f}, {high_val:.2f}, {low_val:.2f}, {close_val:.2f}, {volume_val}"
-                
-                # 지표 데이터 추가
-                if indicator_keys:
-                    indicator_values = []
-                    for key in indicator_keys:
-                        value = item.get(key)
-                        if value is not None and not pd.isna(value):
-                            # numpy.float64 타입 처리
-                            if hasattr(value, 'item'):
-                                value = value.item()
-                            try:
-                                indicator_values.append(f"{float(value):.4f}")
-                            except (ValueError, TypeError) as ind_error:
-                                logging.error(f"format_data_with_indicators_for_prompt: 지표 값 변환 오류 (키 {key}, 값 {value}): {ind_error}")
-                                indicator_values.append("")
-                        else:
-                            indicator_values.append("")
-                    line += " | " + ", ".join(indicator_values)
-                
-                formatted_lines.append(line)
-                processed_count += 1
-                
-            except Exception as item_error:
-                logging.error(f"format_data_with_indicators_for_prompt: 항목 {i} 포맷팅 오류: {item_error}")
-                logging.error(f"format_data_with_indicators_for_prompt: 문제 항목 데이터: {item}")
-                continue
+        # 지표/OHLCV 값은 루프 밖에서 한 번에 행렬로 적재/포맷팅 (셀 단위 pd.isna/.item()/float 변환 제거)
+        indicator_cells = _format_indicator_matrix(data, indicator_keys) if indicator_keys else None
+        prices, volumes = _extract_ohlcv_matrix(data)
+        
+        # OHLCV 셀도 행렬 단위로 한 번에 문자열화 (날짜 | 시가/고가/저가/종가 '%.2f' | 거래량)
+        dates = np.array([str(_pick(item, 'date', 'Date', '')) for item in data])
+        ohlcv_cells = np.column_stack([dates, np.char.mod('%.2f', prices), volumes.astype(str)]).tolist()
+        
+        # 데이터 라인들 추가 (행 단위 포맷팅 없이 문자열 셀만 결합)
+        if indicator_cells is not None:
+            formatted_lines.extend(
+                f"{', '.join(ohlcv_row)} | {', '.join(indicator_row)}"
+                for ohlcv_row, indicator_row in zip(ohlcv_cells, indicator_cells)
+            )
+        else:
+            formatted_lines.extend(', '.join(ohlcv_row) for ohlcv_row in ohlcv_cells)
+        processed_count = len(ohlcv_cells)
         
         result = '\n'.join(formatted_lines)
-        logging.info(f"format_data_with_indicators_for_prompt: 성공적으로 처리된 항목 수: {processed_count}/{len(data)}")
-        logging.info(f"format_data_with_indicators_for_prompt: 결과 길이: {len(result)} 문자")
+        logger.info("format_data_with_indicators_for_prompt: 성공적으로 처리된 항목 수: %s/%s", processed_count, len(data))
+        logger.info("format_data_with_indicators_for_prompt: 결과 길이: %s 문자", len(result))
         
         return result
         
@@ -938,17 +947,14 @@ def format_data_with_indicators_for_prompt(data):
         logging.error(f"format_data_with_indicators_for_prompt: 전체 포맷팅 오류: {e}")
         return "데이터 포맷팅 오류"
 
-def load_ai_prompt_template():
-    """AI 분석 프롬프트 템플릿을 로드합니다."""
-    try:
-        # 루트 디렉토리의 ai_analysis_prompt.txt 파일을 사용
-        prompt_path = os.path.join(os.path.dirname(__file__), '..', 'ai_analysis_prompt.txt')
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except Exception as e:
-        logging.error(f"Error loading prompt template: {e}")
-        # 기본 프롬프트 반환
-        return """밑에 제공되는 {ticker} 종목의 OHLCV 데이터를 기반으로 EMA, MACD, 볼린저밴드, 일목균형표, RSI, 스토캐스틱 오실레이션 등 가용한 기술적 지표들을 계산하여 차트를 분석 후, 스윙 투자자의 매수 및 매도 타이밍에 대한 의견을 개진해라. 이 분석의 핵심내용을 세 문장으로 요약해 제일 첫머리에 **핵심 요약**의 제목아래 번호를 붙여 제시해라.상세분석은 일봉-주봉-월봉의 순으로 배열해라.
+# ai_analysis 페이지 지표 카드: 지표 CSV 컬럼 → 템플릿 키 (순서 대응)
+_PAGE_IND_SRC = ['EMA5', 'EMA20', 'EMA40', 'MACD', 'MACD_Signal', 'MACD_Histogram', 'RSI',
+                 'Stoch_K', 'Stoch_D', 'Volume_Ratio_5d', 'Volume_Ratio_20d', 'Volume_Ratio_40d']
+_PAGE_IND_DST = ['ema5', 'ema20', 'ema40', 'macd_line', 'macd_signal', 'macd_histogram', 'rsi',
+                 'stoch_k', 'stoch_d', 'volume_ratio_5d', 'volume_ratio_20d', 'volume_ratio_40d']
+
+# 템플릿 파일이 없을 때 사용하는 기본 프롬프트
+_DEFAULT_AI_PROMPT_TEMPLATE = """밑에 제공되는 {ticker} 종목의 OHLCV 데이터를 기반으로 EMA, MACD, 볼린저밴드, 일목균형표, RSI, 스토캐스틱 오실레이션 등 가용한 기술적 지표들을 계산하여 차트를 분석 후, 스윙 투자자의 매수 및 매도 타이밍에 대한 의견을 개진해라. 이 분석의 핵심내용을 세 문장으로 요약해 제일 첫머리에 **핵심 요약**의 제목아래 번호를 붙여 제시해라.상세분석은 일봉-주봉-월봉의 순으로 배열해라.
 
 일봉 데이터 (최근 30일):
 날짜, 시가, 고가, 저가, 종가, 거래량
@@ -960,6 +966,25 @@ def load_ai_prompt_template():
 월봉 데이터 (최근 30개월):
 {monthly_ohlcv_data}"""
 
+_AI_PROMPT_TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), '..', 'ai_analysis_prompt.txt')
+
+@lru_cache(maxsize=4)
+def _read_prompt_template_cached(path: str, mtime_ns: int) -> str:
+    # mtime이 키에 포함되므로 파일이 수정되면 자동으로 다시 읽음
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def load_ai_prompt_template():
+    """AI 분석 프롬프트 템플릿을 로드합니다."""
+    try:
+        # 루트 디렉토리의 ai_analysis_prompt.txt 파일을 사용 (mtime 기준 캐시)
+        prompt_path = _AI_PROMPT_TEMPLATE_PATH
+        return _read_prompt_template_cached(prompt_path, os.stat(prompt_path).st_mtime_ns)
+    except Exception as e:
+        logging.error(f"Error loading prompt template: {e}")
+        # 기본 프롬프트 반환
+        return _DEFAULT_AI_PROMPT_TEMPLATE
+
 def format_data_for_prompt(data):
     """데이터를 프롬프트용으로 포맷팅합니다."""
     if not data:
@@ -998,30 +1023,8 @@ def analyze_ticker(ticker):
     try:
         ticker = ticker.upper()
         
-        # 시장 타입 감지 (파일 존재 여부로 판단)
-        kospi_data_dir = os.path.join("static/data", "KOSPI")
-        kosdaq_data_dir = os.path.join("static/data", "KOSDAQ")
-        us_data_dir = os.path.join("static/data", "US")
-        
-        market_type = 'KOSPI'  # 기본값
-        
-        # KOSPI, KOSDAQ, US 디렉토리에서 해당 티커의 데이터 파일 확인
-        if os.path.exists(kospi_data_dir):
-            kospi_files = [f for f in os.listdir(kospi_data_dir) if f.startswith(f"{ticker}_")]
-            if kospi_files:
-                market_type = 'KOSPI'
-            else:
-                # KOSDAQ 디렉토리 확인
-                if os.path.exists(kosdaq_data_dir):
-                    kosdaq_files = [f for f in os.listdir(kosdaq_data_dir) if f.startswith(f"{ticker}_")]
-                    if kosdaq_files:
-                        market_type = 'KOSDAQ'
-                    else:
-                        # US 디렉토리 확인
-                        if os.path.exists(us_data_dir):
-                            us_files = [f for f in os.listdir(us_data_dir) if f.startswith(f"{ticker}_")]
-                            if us_files:
-                                market_type = 'US'
+        # 시장 타입 감지 (캐시된 티커 → 시장 인덱스로 판단, 기본값 KOSPI)
+        market_type = _lookup_market_by_index(ticker)
         
         # AI 분석 페이지로 리다이렉트
         return redirect(url_for('analysis.ai_analysis', ticker=ticker, market=market_type))
@@ -1030,6 +1033,29 @@ def analyze_ticker(ticker):
         logging.error(f"Analyze ticker error for {ticker}: {e}")
         return f"분석 오류: {str(e)}", 500
 
+@lru_cache(maxsize=64)
+def _parse_macd_proximity_str(proximity_value: str) -> str:
+    # 반복되는 딕셔너리 문자열은 literal_eval 결과를 캐시로 재사용
+    try:
+        proximity_dict = ast.literal_eval(proximity_value)
+        if isinstance(proximity_dict, dict):
+            return proximity_dict.get('type', 'no_proximity')
+    except (ValueError, SyntaxError, TypeError, RecursionError):
+        pass
+    return proximity_value
+
+def parse_macd_proximity(proximity_value):
+    """MACD 근접성 정보를 파싱하여 type 값만 반환"""
+    if not proximity_value or proximity_value == 'no_proximity':
+        return 'no_proximity'
+    
+    # 딕셔너리 문자열인 경우에만 파싱 (캐시 사용)
+    if isinstance(proximity_value, str) and proximity_value.startswith('{'):
+        return _parse_macd_proximity_str(proximity_value)
+    
+    # 이미 문자열인 경우 그대로 반환
+    return str(proximity_value)
+
 @analysis_bp.route('/ai_analysis/<ticker>/<market>')
 @login_required
 def ai_analysis(ticker, market):
@@ -1045,13 +1071,21 @@ def ai_analysis(ticker, market):
             logging.info(f"[CANON] Redirecting to canonical market: {ticker} {market} → {canonical_market}")
             return redirect(url_for('analysis.ai_analysis', ticker=ticker, market=canonical_market))
 
-        # 1) 캐시 신선도 판정 후 즉시 반환 시도 (차트 생성 전에 수행)
-        try:
-            cached_html = _try_return_cached_analysis_html(ticker, market)
-        except Exception:
-            cached_html = None
-        if cached_html:
-            return cached_html
+        # 1) 캐시 신선도 판정 후 즉시 반환 시도
+        #    빠른 경로: 차트 생성, OHLCV/지표 CSV 로딩, AI 호출 등 모든 비용 작업보다 먼저 수행
+        #    (읽기 후 반환 대신 send_file로 스트리밍 - Werkzeug가 가능하면 sendfile 사용)
+        cached_path = _try_get_cached_analysis_path(ticker, market)
+        if cached_path:
+            return send_file(os.path.abspath(cached_path), mimetype='text/html')
+
+        # 1-1) 디스크 캐시가 없거나 오래됐어도 데이터 파일이 그대로면 인메모리 렌더 결과 재사용
+        data_mtime = _latest_data_mtime(ticker, market)
+        render_cache_key = (ticker, market, data_mtime) if data_mtime is not None else None
+        if render_cache_key is not None:
+            cached_html = _get_rendered_ai_html(render_cache_key)
+            if cached_html is not None:
+                logging.info(f"[CACHE] Using in-memory rendered analysis: {ticker} ({market})")
+                return cached_html
 
         # 0-LEGACY) 기존 차트 기반 시장 자동 교정 로직 (성능 문제로 비활성화) — 보존용 주석
         # resolved_market = market
@@ -1080,7 +1114,6 @@ def ai_analysis(ticker, market):
         charts, chart_error = generate_charts(ticker, market)
 
         # 종목명 가져오기
-        from models import Stock
         stock = Stock.query.filter_by(ticker=ticker).first()
         company_name = stock.company_name if stock and stock.company_name else ticker
         
@@ -1089,9 +1122,8 @@ def ai_analysis(ticker, market):
         # daily_data, weekly_data, monthly_data = get_ohlcv_data_for_ai(ticker, market)
         
         # [2025-08-09 수정] OHLCV + 지표 통합 데이터 로딩 (AI 프롬프트용)
-        daily_data = get_ohlcv_with_indicators(ticker, 'd', market)
-        weekly_data = get_ohlcv_with_indicators(ticker, 'w', market)
-        monthly_data = get_ohlcv_with_indicators(ticker, 'm', market)
+        # 일/주/월봉은 서로 독립적인 CSV I/O이므로 동시에 로딩
+        daily_data, weekly_data, monthly_data = _load_indicator_timeframes(ticker, market)
 
         # 데이터 실패 시 한 번 더 시장 교정 재시도
         if (not daily_data) and (not weekly_data) and (not monthly_data):
@@ -1107,9 +1139,7 @@ def ai_analysis(ticker, market):
                         logging.info(f"[AUTO-MARKET] Resolved by indicators/ohlcv presence: {ticker} → {market}")
                         # 재로드
                         charts, chart_error = generate_charts(ticker, market)
-                        daily_data = get_ohlcv_with_indicators(ticker, 'd', market)
-                        weekly_data = get_ohlcv_with_indicators(ticker, 'w', market)
-                        monthly_data = get_ohlcv_with_indicators(ticker, 'm', market)
+                        daily_data, weekly_data, monthly_data = _load_indicator_timeframes(ticker, market)
                         break
                 except Exception:
                     continue
@@ -1132,10 +1162,7 @@ def ai_analysis(ticker, market):
         
         # [2025-08-09 수정] admin_home과 동일한 방식으로 지표 데이터 로딩
         try:
-            from services.technical_indicators_service import TechnicalIndicatorsService
-            
-            technical_service = TechnicalIndicatorsService()
-            indicators_df = technical_service.read_indicators_csv(ticker, market, 'd')
+            indicators_df = _indicators_service.read_indicators_csv(ticker, market, 'd')
             
             # None 체크 및 DataFrame 검증 강화
             if indicators_df is None:
@@ -1153,26 +1180,19 @@ def ai_analysis(ticker, market):
                 # [메모] 2025-08-19: 등락률 최신치 조회 경로 단일화
                 # 기존 CSV 컬럼 직접 참조는 보존하되, 표준 함수 호출 결과를 우선 사용합니다.
                 try:
-                    change_pct_value = technical_service.get_latest_change_percent(ticker, 'd', market)
+                    change_pct_value = _indicators_service.get_latest_change_percent(ticker, 'd', market)
                 except Exception:
                     change_pct_value = latest_indicators.get('Change_Percent', 0)
 
+                # 최신 지표값을 한 번의 reindex로 추출 후 표준 키로 매핑 (누락 컬럼은 0)
+                page_indicators = dict(zip(
+                    _PAGE_IND_DST,
+                    latest_indicators.reindex(_PAGE_IND_SRC, fill_value=0).tolist()
+                ))
+                page_indicators['change_percent'] = change_pct_value
+
                 indicators_data = {ticker: {
-                    'indicators': {
-                        'ema5': latest_indicators.get('EMA5', 0),
-                        'ema20': latest_indicators.get('EMA20', 0),
-                        'ema40': latest_indicators.get('EMA40', 0),
-                        'macd_line': latest_indicators.get('MACD', 0),
-                        'macd_signal': latest_indicators.get('MACD_Signal', 0),
-                        'macd_histogram': latest_indicators.get('MACD_Histogram', 0),
-                        'rsi': latest_indicators.get('RSI', 0),
-                        'stoch_k': latest_indicators.get('Stoch_K', 0),
-                        'stoch_d': latest_indicators.get('Stoch_D', 0),
-                        'volume_ratio_5d': latest_indicators.get('Volume_Ratio_5d', 0),
-                        'volume_ratio_20d': latest_indicators.get('Volume_Ratio_20d', 0),
-                        'volume_ratio_40d': latest_indicators.get('Volume_Ratio_40d', 0),
-                        'change_percent': change_pct_value
-                    },
+                    'indicators': page_indicators,
                     'analysis': {
                         'macd_signals': {},  # 크로스오버는 나중에 처리
                         'ema_signals': {},   # 크로스오버는 나중에 처리
@@ -1184,90 +1204,53 @@ def ai_analysis(ticker, market):
                 
                 # CrossInfo CSV 읽기 및 새로운 컬럼들 추가 (admin_home과 동일한 방식)
                 try:
-                    from services.market.data_reading_service import DataReadingService
-                    data_reading_service = DataReadingService()
                     # CrossInfo 호출 인자 정리 (caller 인자 제거)
-                    crossinfo_df = data_reading_service.read_crossinfo_csv(ticker, market)
+                    crossinfo_df = _drs.read_crossinfo_csv(ticker, market)
                     
                     if not crossinfo_df.empty:
                         latest_crossinfo = crossinfo_df.iloc[-1]
 
-                    # CrossInfo 컬럼명 자동 매핑(표준화)
-                    import re
-                    def _norm(s: str) -> str:
-                        return re.sub(r"[^a-z0-9]", "", str(s).lower())
-                    aliases = {
-                        'Close_Gap_EMA20': ['Close_Gap_EMA20','CloseGapEMA20','close_gap_ema20','Close-EMA20-Gap','Gap_EMA20','GapEMA20','Close_EMA20_Gap'],
-                        'Close_Gap_EMA40': ['Close_Gap_EMA40','CloseGapEMA40','close_gap_ema40','Close-EMA40-Gap','Gap_EMA40','GapEMA40','Close_EMA40_Gap'],
-                        'EMA_Array_Order': ['EMA_Array_Order','EMAArrayOrder','ema_array_order','EMA_Order','EMA Array Order','EmaArrayOrder']
-                    }
-                    norm_map = {k: {_norm(a) for a in v} for k, v in aliases.items()}
-                    resolved = {}
-                    for col in list(crossinfo_df.columns):
-                        n = _norm(col)
-                        for tgt, aset in norm_map.items():
-                            if n in aset and tgt not in resolved:
-                                resolved[tgt] = col
-                                break
+                    # CrossInfo 컬럼명 자동 매핑(표준화, 모듈 캐시 사용)
+                    resolved = dict(_resolve_cross_cols(tuple(crossinfo_df.columns)))
+
+                    # 새로운 컬럼들 추가 (admin_home과 동일)
+                    # 표준 키 추출
+                    gap20_val = latest_crossinfo.get(resolved.get('Close_Gap_EMA20', 'Close_Gap_EMA20'), 0.0)
+                    gap40_val = latest_crossinfo.get(resolved.get('Close_Gap_EMA40', 'Close_Gap_EMA40'), 0.0)
+                    order_val = latest_crossinfo.get(resolved.get('EMA_Array_Order', 'EMA_Array_Order'), '')
+
+                    indicators_data[ticker]['analysis'].update({
+                        'ema_array_pattern': latest_crossinfo.get('EMA_Array_Pattern', '분석불가'),
+                        'ema_array_order': order_val if order_val != '' else '분석불가',
+                        'close_gap_ema20': gap20_val,
+                        'close_gap_ema40': gap40_val,
                         
-                        # MACD 근접성 정보 파싱 함수
-                        def parse_macd_proximity(proximity_value):
-                            """MACD 근접성 정보를 파싱하여 type 값만 반환"""
-                            if not proximity_value or proximity_value == 'no_proximity':
-                                return 'no_proximity'
-                            
-                            # 딕셔너리 문자열인 경우 파싱
-                            if isinstance(proximity_value, str) and proximity_value.startswith('{'):
-                                try:
-                                    import ast
-                                    proximity_dict = ast.literal_eval(proximity_value)
-                                    if isinstance(proximity_dict, dict):
-                                        return proximity_dict.get('type', 'no_proximity')
-                                except:
-                                    pass
-                            
-                            # 이미 문자열인 경우 그대로 반환
-                            return str(proximity_value)
+                        # MACD 크로스오버 정보
+                        'macd_signals': {
+                            'type': 'crossover' if latest_crossinfo.get('MACD_Latest_Crossover_Type') else 'normal',
+                            'status': latest_crossinfo.get('MACD_Latest_Crossover_Type', '정상'),
+                            'latest_crossover_type': latest_crossinfo.get('MACD_Latest_Crossover_Type'),
+                            'latest_crossover_date': latest_crossinfo.get('MACD_Latest_Crossover_Date'),
+                            'days_since_crossover': latest_crossinfo.get('MACD_Days_Since_Crossover'),
+                            'proximity_type': parse_macd_proximity(latest_crossinfo.get('MACD_Current_Proximity'))
+                        },
                         
-                        # 새로운 컬럼들 추가 (admin_home과 동일)
-                        # 표준 키 추출
-                        gap20_val = latest_crossinfo.get(resolved.get('Close_Gap_EMA20', 'Close_Gap_EMA20'), 0.0)
-                        gap40_val = latest_crossinfo.get(resolved.get('Close_Gap_EMA40', 'Close_Gap_EMA40'), 0.0)
-                        order_val = latest_crossinfo.get(resolved.get('EMA_Array_Order', 'EMA_Array_Order'), '')
-
-                        indicators_data[ticker]['analysis'].update({
-                            'ema_array_pattern': latest_crossinfo.get('EMA_Array_Pattern', '분석불가'),
-                            'ema_array_order': order_val if order_val != '' else '분석불가',
-                            'close_gap_ema20': gap20_val,
-                            'close_gap_ema40': gap40_val,
-                            
-                            # MACD 크로스오버 정보
-                            'macd_signals': {
-                                'type': 'crossover' if latest_crossinfo.get('MACD_Latest_Crossover_Type') else 'normal',
-                                'status': latest_crossinfo.get('MACD_Latest_Crossover_Type', '정상'),
-                                'latest_crossover_type': latest_crossinfo.get('MACD_Latest_Crossover_Type'),
-                                'latest_crossover_date': latest_crossinfo.get('MACD_Latest_Crossover_Date'),
-                                'days_since_crossover': latest_crossinfo.get('MACD_Days_Since_Crossover'),
-                                'proximity_type': parse_macd_proximity(latest_crossinfo.get('MACD_Current_Proximity'))
-                            },
-                            
-                            # EMA 크로스오버 정보
-                            'ema_signals': {
-                                'type': 'crossover' if latest_crossinfo.get('EMA_Latest_Crossover_Type') else 'normal',
-                                'status': latest_crossinfo.get('EMA_Latest_Crossover_Type', '정상'),
-                                'latest_crossover_type': latest_crossinfo.get('EMA_Latest_Crossover_Type'),
-                                'latest_crossover_date': latest_crossinfo.get('EMA_Latest_Crossover_Date'),
-                                'days_since_crossover': latest_crossinfo.get('EMA_Days_Since_Crossover'),
-                                'crossover_pair': latest_crossinfo.get('EMA_Crossover_Pair'),
-                                'proximity_type': latest_crossinfo.get('EMA_Current_Proximity', 'no_proximity')
-                            }
-                        })
-                        # 템플릿 호환: ema_array.full_array 채우기
-                        try:
-                            indicators_data[ticker]['analysis']['ema_array'] = {'full_array': str(order_val) if order_val != '' else ''}
-                        except Exception:
-                            pass
-                        logging.debug(f"[{ticker}] CrossInfo CSV 읽기 성공 - EMA 배열(Order): {order_val}")
+                        # EMA 크로스오버 정보
+                        'ema_signals': {
+                            'type': 'crossover' if latest_crossinfo.get('EMA_Latest_Crossover_Type') else 'normal',
+                            'status': latest_crossinfo.get('EMA_Latest_Crossover_Type', '정상'),
+                            'latest_crossover_type': latest_crossinfo.get('EMA_Latest_Crossover_Type'),
+                            'latest_crossover_date': latest_crossinfo.get('EMA_Latest_Crossover_Date'),
+                            'days_since_crossover': latest_crossinfo.get('EMA_Days_Since_Crossover'),
+                            'crossover_pair': latest_crossinfo.get('EMA_Crossover_Pair'),
+                            'proximity_type': latest_crossinfo.get('EMA_Current_Proximity', 'no_proximity')
+                        }
+                    })
+                    # 템플릿 호환: ema_array.full_array 채우기 (CSV 값은 이미 문자열이므로 그대로 전달)
+                    indicators_data[ticker]['analysis']['ema_array'] = {
+                        'full_array': order_val if isinstance(order_val, str) else str(order_val)
+                    }
+                    logging.debug(f"[{ticker}] CrossInfo CSV 읽기 성공 - EMA 배열(Order): {order_val}")
                 except Exception as e:
                     logging.warning(f"[{ticker}] CrossInfo CSV 읽기 실패: {e}")
                 
@@ -1306,20 +1289,21 @@ def ai_analysis(ticker, market):
         # static/analysis 폴더에 HTML 파일 자동 저장
         try:
             analysis_dir = os.path.join("static", "analysis")
-            os.makedirs(analysis_dir, exist_ok=True)
+            _ensure_dir(analysis_dir)
             
-            from datetime import datetime
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{ticker}_AI_Analysis_{market}_{timestamp}.html"
             filepath = os.path.join(analysis_dir, filename)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logging.info(f"AI analysis HTML saved: {filepath}")
+            # 파일 쓰기는 백그라운드에서 수행하고 응답은 즉시 반환
+            _HTML_SAVE_EXECUTOR.submit(_write_analysis_html, filepath, html_content)
         except Exception as save_error:
             logging.error(f"Failed to save HTML file: {save_error}")
         
+        # AI 분석이 성공한 결과만 인메모리 캐시에 보관 (오류 페이지는 캐시하지 않음)
+        if render_cache_key is not None and analysis_result and not analysis_error:
+            _store_rendered_ai_html(render_cache_key, html_content)
+        
         return html_content
         
     except Exception as e:
@@ -1336,30 +1320,13 @@ def view_chart(ticker):
     try:
         ticker = ticker.upper()
         
-        # 시장 타입 감지
-        kospi_data_dir = os.path.join("static/data", "KOSPI")
-        kosdaq_data_dir = os.path.join("static/data", "KOSDAQ")
-        us_data_dir = os.path.join("static/data", "US")
-        
-        market_type = 'KOSPI'  # 기본값
-        
-        # KOSPI, KOSDAQ, US 디렉토리에서 해당 티커의 데이터 파일 확인
-        if os.path.exists(kospi_data_dir):
-            kospi_files = [f for f in os.listdir(kospi_data_dir) if f.startswith(f"{ticker}_")]
-            if kospi_files:
-                market_type = 'KOSPI'
-            else:
-                # KOSDAQ 디렉토리 확인
-                if os.path.exists(kosdaq_data_dir):
-                    kosdaq_files = [f for f in os.listdir(kosdaq_data_dir) if f.startswith(f"{ticker}_")]
-                    if kosdaq_files:
-                        market_type = 'KOSDAQ'
-                    else:
-                        # US 디렉토리 확인
-                        if os.path.exists(us_data_dir):
-                            us_files = [f for f in os.listdir(us_data_dir) if f.startswith(f"{ticker}_")]
-                            if us_files:
-                                market_type = 'US'
+        # 시장 타입 감지: 등록 종목이면 DB의 market_type을 사용 (디렉토리 스캔 없음)
+        stock_row = Stock.query.with_entities(Stock.market_type).filter_by(ticker=ticker, is_active=True).first()
+        if stock_row and stock_row.market_type:
+            market_type = stock_row.market_type
+        else:
+            # 미등록 종목은 캐시된 티커 → 시장 인덱스로 판단 (기본값 KOSPI)
+            market_type = _lookup_market_by_index(ticker)
         
         # 차트 생성
         charts, chart_error = generate_charts(ticker, market_type)
@@ -1375,17 +1342,23 @@ def view_chart(ticker):
         logging.error(f"Chart view error for {ticker}: {e}")
         return f"차트 보기 오류: {str(e)}", 500 
 
+def _records_json_response(df: pd.DataFrame):
+    # 중간 dict 리스트 생성 없이 numpy 버퍼에서 바로 JSON 직렬화 (NaN → null, 날짜 → ISO)
+    return current_app.response_class(
+        df.to_json(orient='records', date_format='iso', force_ascii=False),
+        mimetype='application/json'
+    )
+
 @analysis_bp.route('/api/indicators/<ticker>/<market_type>/<timeframe>')
 def get_indicators_api(ticker, market_type, timeframe):
     """특정 종목의 지표 데이터를 JSON으로 반환"""
     try:
-        technical_service = TechnicalIndicatorsService()
-        indicators_df = technical_service.read_indicators_csv(ticker, timeframe, market_type)
+        indicators_df = _indicators_service.read_indicators_csv(ticker, timeframe, market_type)
         
         if indicators_df.empty:
             return jsonify({'error': '지표 데이터를 찾을 수 없습니다.'}), 404
             
-        return jsonify(indicators_df.to_dict(orient='records'))
+        return _records_json_response(indicators_df)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1393,12 +1366,11 @@ def get_indicators_api(ticker, market_type, timeframe):
 def get_crossinfo_api(ticker, market_type):
     """특정 종목의 CrossInfo 데이터를 JSON으로 반환"""
     try:
-        data_reading_service = DataReadingService()
-        crossinfo_df = data_reading_service.read_crossinfo_csv(ticker, market_type)
+        crossinfo_df = _drs.read_crossinfo_csv(ticker, market_type)
 
         if crossinfo_df.empty:
             return jsonify({'error': 'CrossInfo 데이터를 찾을 수 없습니다.'}), 404
 
-        return jsonify(crossinfo_df.to_dict(orient='records'))
+        return _records_json_response(crossinfo_df)
     except Exception as e:
         return jsonify({'error': str(e)}), 500 
\ No newline at end of file
@@ -1,8 +1,11 @@
-from flask import Blueprint, render_template, request, jsonify, current_app
+from flask import Blueprint, render_template, request, jsonify, current_app, send_from_directory, session
 from flask_login import login_required, current_user
 from services.newsletter_generation_service import NewsletterGenerationService
 from services.newsletter_storage_service import NewsletterStorageService
+from models import db, Stock, NewsletterContent, NewsletterSubscription
 from datetime import datetime
+from functools import lru_cache
+import hashlib
 import os
 import logging
 
@@ -10,6 +13,39 @@ newsletter_bp = Blueprint('newsletter', __name__)
 logger = logging.getLogger(__name__)
 
 storage_service = NewsletterStorageService()
+newsletter_service = NewsletterGenerationService()
+
+# 저장된 뉴스레터 조회 페이지 렌더링 결과 디스크 캐시 (저장 내용은 불변 → 1회 렌더 후 파일 전송)
+SAVED_VIEW_CACHE_SUBDIR = 'newsletter_views'
+_SAVED_VIEW_TEMPLATES = ('newsletter/view_saved.html', 'base.html')
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path):
+    # 프로세스당 경로별 1회만 생성 시도
+    os.makedirs(path, exist_ok=True)
+
+def _saved_view_cache_path(newsletter_id):
+    """사용자별 저장 뉴스레터 페이지 캐시 파일 (디렉토리, 파일명)
+
+    base.html이 사용자 이름/관리자 메뉴를 그리므로 사용자 정보를 파일명에 반영
+    """
+    cache_dir = os.path.join(current_app.instance_path, SAVED_VIEW_CACHE_SUBDIR)
+    user_key = f"{current_user.id}:{bool(current_user.is_admin)}:{current_user.get_full_name()}"
+    user_tag = hashlib.md5(user_key.encode('utf-8')).hexdigest()[:12]
+    return cache_dir, f"newsletter_{newsletter_id}_{user_tag}.html"
+
+def _saved_view_cache_fresh(filepath):
+    """캐시 파일이 템플릿보다 최신인지 확인 (템플릿 배포 시 자동 무효화)"""
+    try:
+        cached_mtime = os.path.getmtime(filepath)
+    except OSError:
+        return False
+    template_dir = os.path.join(current_app.root_path, current_app.template_folder)
+    try:
+        return all(os.path.getmtime(os.path.join(template_dir, name)) <= cached_mtime
+                   for name in _SAVED_VIEW_TEMPLATES)
+    except OSError:
+        return False
 
 @newsletter_bp.route('/kospi')
 @login_required
@@ -17,14 +53,14 @@ def kospi_newsletter():
     """KOSPI 뉴스레터 페이지 - 단순화된 버전"""
     try:
         timeframe = request.args.get('timeframe', 'd')
-        service = NewsletterGenerationService()
+        service = newsletter_service
         # 생성 서비스 경로 사용: category_summary_html 포함
         newsletter_data = service.generate_kospi_newsletter(timeframe, current_user.id)
 
         html_content = render_template('newsletter/kospi_newsletter.html', 
                                        newsletter=newsletter_data,
                                        timeframe=timeframe)
-        storage_service.save_html_file(html_content, kind="kospi")
+        storage_service.save_html_file_async(html_content, kind="kospi")
         return html_content
     except Exception as e:
         logger.error(f"KOSPI 뉴스레터 생성 중 오류: {str(e)}")
@@ -36,7 +72,7 @@ def kosdaq_newsletter():
     """KOSDAQ 뉴스레터 페이지"""
     try:
         timeframe = request.args.get('timeframe', 'd')
-        service = NewsletterGenerationService()
+        service = newsletter_service
         
         # KOSDAQ 뉴스레터 생성 (사용자 ID 전달하여 저장)
         newsletter_data = service.generate_kosdaq_newsletter(timeframe, current_user.id)
@@ -44,7 +80,7 @@ def kosdaq_newsletter():
         html_content = render_template('newsletter/kosdaq_newsletter.html', 
                                        newsletter=newsletter_data,
                                        timeframe=timeframe)
-        storage_service.save_html_file(html_content, kind="kosdaq")
+        storage_service.save_html_file_async(html_content, kind="kosdaq")
         return html_content
     except Exception as e:
         logger.error(f"KOSDAQ 뉴스레터 생성 중 오류: {str(e)}")
@@ -56,7 +92,7 @@ def us_newsletter():
     """미국장 뉴스레터 페이지"""
     try:
         timeframe = request.args.get('timeframe', 'd')
-        service = NewsletterGenerationService()
+        service = newsletter_service
         
         # 미국장 뉴스레터 생성 (사용자 ID 전달하여 저장)
         newsletter_data = service.generate_us_newsletter(timeframe, current_user.id)
@@ -64,7 +100,7 @@ def us_newsletter():
         html_content = render_template('newsletter/us_newsletter.html', 
                                        newsletter=newsletter_data,
                                        timeframe=timeframe)
-        storage_service.save_html_file(html_content, kind="us")
+        storage_service.save_html_file_async(html_content, kind="us")
         return html_content
     except Exception as e:
         logger.error(f"미국장 뉴스레터 생성 중 오류: {str(e)}")
@@ -77,22 +113,24 @@ def combined_newsletter():
     try:
         timeframe = request.args.get('timeframe', 'd')
         primary_market = request.args.get('primary', 'kospi')  # kospi, kosdaq, US
-        service = NewsletterGenerationService()
+        service = newsletter_service
         
-        # 통합 뉴스레터 생성 (사용자 ID 전달하여 저장)
-        newsletter_data = service.generate_combined_newsletter(timeframe, primary_market, current_user.id)
+        # 통합 뉴스레터 조회 (생성 결과는 사용자 간 TTL 공유, 관리자는 항상 새로 생성)
+        newsletter_data = service.get_combined_newsletter_cached(
+            timeframe, primary_market, current_user.id, refresh=bool(current_user.is_admin)
+        )
         
         # 각 시장별 종목 수만 계산 (이미 분류는 완료됨)
-        from models import Stock
-        
-        # KOSPI 데이터
-        kospi_stocks = Stock.query.filter_by(market_type='KOSPI', is_active=True).count()
-        
-        # KOSDAQ 데이터
-        kosdaq_stocks = Stock.query.filter_by(market_type='KOSDAQ', is_active=True).count()
-        
-        # US Market 데이터
-        us_stocks = Stock.query.filter_by(market_type='US', is_active=True).count()
+        # 시장별 활성 종목 수를 한 번의 GROUP BY 쿼리로 집계
+        market_counts = dict(
+            db.session.query(Stock.market_type, db.func.count(Stock.id))
+            .filter(Stock.is_active == True, Stock.market_type.in_(('KOSPI', 'KOSDAQ', 'US')))
+            .group_by(Stock.market_type)
+            .all()
+        )
+        kospi_stocks = market_counts.get('KOSPI', 0)
+        kosdaq_stocks = market_counts.get('KOSDAQ', 0)
+        us_stocks = market_counts.get('US', 0)
         
         # 크로스오버 수는 newsletter_data의 summary에서 추출
         kospi_crossover = newsletter_data.get('summary', {}).get('kospi', {}).get('crossover_proximity_count', 0) + \
@@ -112,7 +150,7 @@ def combined_newsletter():
                                        kosdaq_crossover=kosdaq_crossover,
                                        us_count=us_stocks,
                                        us_crossover=us_crossover)
-        storage_service.save_html_file(html_content, kind="combined", primary=primary_market)
+        storage_service.save_html_file_async(html_content, kind="combined", primary=primary_market)
         return html_content
     except Exception as e:
         logger.error(f"통합 뉴스레터 생성 중 오류: {str(e)}")
@@ -124,15 +162,18 @@ def auto_newsletter():
     """시간대에 따른 자동 뉴스레터 페이지"""
     try:
         timeframe = request.args.get('timeframe', 'd')
-        service = NewsletterGenerationService()
+        service = newsletter_service
         
-        # 시간대에 따른 뉴스레터 생성 (통합 뉴스레터 재사용)
-        newsletter_data = service.get_newsletter_by_time(timeframe, current_user.id)
+        # 시간대에 따른 뉴스레터 생성 (통합 뉴스레터 공유 캐시 재사용)
+        newsletter_data = service.get_combined_newsletter_cached(
+            timeframe, service.resolve_primary_market_by_time(), current_user.id,
+            refresh=bool(current_user.is_admin)
+        )
         
         html_content = render_template('newsletter/combined_newsletter.html', 
                                        newsletter=newsletter_data,
                                        timeframe=timeframe)
-        storage_service.save_html_file(html_content, kind="auto")
+        storage_service.save_html_file_async(html_content, kind="auto")
         return html_content
     except Exception as e:
         logger.error(f"자동 뉴스레터 생성 중 오류: {str(e)}")
@@ -143,7 +184,7 @@ def auto_newsletter():
 def newsletter_history():
     """뉴스레터 히스토리 페이지"""
     try:
-        service = NewsletterGenerationService()
+        service = newsletter_service
         history = service.get_newsletter_history(current_user.id, limit=20)
         
         return render_template('newsletter/history.html', 
@@ -157,14 +198,37 @@ def newsletter_history():
 def view_newsletter(newsletter_id):
     """저장된 뉴스레터 조회"""
     try:
-        service = NewsletterGenerationService()
+        cache_dir, filename = _saved_view_cache_path(newsletter_id)
+        filepath = os.path.join(cache_dir, filename)
+        # 대기 중인 flash 메시지가 없을 때만 캐시 파일을 그대로 전송 (sendfile + 조건부 응답)
+        # 파일명은 사용자별이지만 소유권은 매 요청 확인
+        has_flashes = bool(session.get('_flashes'))
+        if not has_flashes and _saved_view_cache_fresh(filepath):
+            owned = NewsletterContent.query.with_entities(NewsletterContent.id) \
+                .filter_by(id=newsletter_id, user_id=current_user.id).first()
+            if owned:
+                return send_from_directory(cache_dir, filename, mimetype='text/html', conditional=True)
+
+        service = newsletter_service
         newsletter_data = service.get_newsletter_by_id(newsletter_id, current_user.id)
         
         if not newsletter_data:
             return render_template('error.html', error="뉴스레터를 찾을 수 없습니다.")
         
-        return render_template('newsletter/view_saved.html', 
+        html = render_template('newsletter/view_saved.html', 
                              newsletter=newsletter_data)
+        if has_flashes:
+            # flash 메시지가 포함된 렌더링 결과는 캐시하지 않음
+            return html
+        try:
+            _ensure_dir(cache_dir)
+            tmp_path = filepath + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(html)
+            os.replace(tmp_path, filepath)
+        except OSError as e:
+            logger.warning(f"저장 뉴스레터 페이지 캐시 저장 실패: {e}")
+        return html
     except Exception as e:
         logger.error(f"뉴스레터 조회 중 오류: {str(e)}")
         return render_template('error.html', error="뉴스레터 조회 중 오류가 발생했습니다.")
@@ -174,7 +238,6 @@ def view_newsletter(newsletter_id):
 @newsletter_bp.route('/unsubscribe/<token>')
 def unsubscribe(token):
     try:
-        from models import db, NewsletterSubscription
         sub = NewsletterSubscription.query.filter_by(unsubscribe_token=token).first()
         if not sub:
             return render_template('error.html', error="구독 정보를 찾을 수 없습니다.")
@@ -192,7 +255,7 @@ def api_kospi_newsletter():
     """KOSPI 뉴스레터 API"""
     try:
         timeframe = request.args.get('timeframe', 'd')
-        service = NewsletterGenerationService()
+        service = newsletter_service
         
         newsletter_data = service.generate_kospi_newsletter(timeframe, current_user.id)
         
@@ -213,7 +276,7 @@ def api_kosdaq_newsletter():
     """KOSDAQ 뉴스레터 API"""
     try:
         timeframe = request.args.get('timeframe', 'd')
-        service = NewsletterGenerationService()
+        service = newsletter_service
         
         newsletter_data = service.generate_kosdaq_newsletter(timeframe, current_user.id)
         
@@ -234,7 +297,7 @@ def api_us_newsletter():
     """미국장 뉴스레터 API"""
     try:
         timeframe = request.args.get('timeframe', 'd')
-        service = NewsletterGenerationService()
+        service = newsletter_service
         
         newsletter_data = service.generate_us_newsletter(timeframe, current_user.id)
         
@@ -256,7 +319,7 @@ def api_combined_newsletter():
     try:
         timeframe = request.args.get('timeframe', 'd')
         primary_market = request.args.get('primary', 'kospi')
-        service = NewsletterGenerationService()
+        service = newsletter_service
         
         newsletter_data = service.generate_combined_newsletter(timeframe, primary_market, current_user.id)
         
@@ -277,7 +340,7 @@ def api_newsletter_history():
     """뉴스레터 히스토리 API"""
     try:
         limit = request.args.get('limit', 10, type=int)
-        service = NewsletterGenerationService()
+        service = newsletter_service
         
         history = service.get_newsletter_history(current_user.id, limit)
         
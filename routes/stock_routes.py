@@ -8,23 +8,35 @@ from werkzeug.utils import secure_filename
 from models import db, Stock
 from forms import CSVUploadForm
 from datetime import datetime
-from services.market.market_data_orchestrator import MarketDataOrchestrator
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 stock_bp = Blueprint('stock_bp', __name__, url_prefix='/stock')
 
 ALLOWED_EXTENSIONS = {'csv'}
 
+@lru_cache(maxsize=None)
+def _ensure_dir(path):
+    # 프로세스당 경로별 1회만 생성 시도 (요청마다 makedirs/stat 호출 제거)
+    os.makedirs(path, exist_ok=True)
+
 def allowed_file(filename):
     """허용된 파일 확장자 확인"""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+# 업로드 시 yfinance 회사명 동시 조회 스레드 수
+YAHOO_NAME_WORKERS = 16
+
+@lru_cache(maxsize=16384)
+def _fetch_company_name_from_yahoo(ticker):
+    # 성공한 조회만 캐시 (예외는 캐시되지 않음)
+    return yf.Ticker(ticker).info.get('longName', 'Unknown')
+
 def get_company_name_from_yahoo(ticker):
     """야후 파이낸스에서 회사명 가져오기"""
     try:
-        stock_info = yf.Ticker(ticker)
-        company_name = stock_info.info.get('longName', 'Unknown')
-        return company_name
+        return _fetch_company_name_from_yahoo(ticker)
     except Exception as e:
         print(f"Error fetching company name for {ticker}: {e}")
         return "Unknown"
@@ -32,10 +44,12 @@ def get_company_name_from_yahoo(ticker):
 def process_csv_file(file_path, market_type):
     """CSV 파일 처리 및 데이터베이스 저장 (비활성 종목 재활성화 포함)"""
     # CSV 로드 및 컬럼 보정
+    # 모든 컬럼을 문자열로 고정 (타입 추론 생략, 숫자형 티커의 선행 0 보존)
+    # C 엔진 사용: pyarrow 엔진은 dtype=str일 때 빈 셀을 NaN이 아닌 문자열 'None'으로 변환함
     try:
-        df = pd.read_csv(file_path)
+        df = pd.read_csv(file_path, dtype=str, engine='c')
     except UnicodeDecodeError:
-        df = pd.read_csv(file_path, encoding='cp949')
+        df = pd.read_csv(file_path, dtype=str, engine='c', encoding='cp949')
 
     # 컬럼명 유연화: Ticker/Symbol → ticker
     if 'ticker' not in df.columns:
@@ -57,49 +71,67 @@ def process_csv_file(file_path, market_type):
                 df = df.rename(columns={alias: 'company_name'})
                 break
 
-    orchestrator = MarketDataOrchestrator()
-
     added = 0
     reactivated = 0
     processed = 0
 
-    for _, row in df.iterrows():
-        raw = row.get('ticker')
-        if raw is None or str(raw).strip() == '':
-            continue
-        ticker = str(raw).strip().upper()
+    # 티커 정규화는 컬럼 단위로 한 번에 처리하고 빈 티커 행은 제외
+    df['ticker'] = df['ticker'].where(df['ticker'].notna(), '').astype(str).str.strip().str.upper()
+    df = df[df['ticker'] != '']
+    # 회사명도 컬럼 단위로 정규화 (NaN/공백 → '', 루프에서는 빈 문자열만 확인)
+    if 'company_name' in df.columns:
+        df['company_name'] = df['company_name'].where(df['company_name'].notna(), '').astype(str).str.strip()
 
-        # (ticker, market_type) 기준으로 조회
-        existing = Stock.query.filter_by(ticker=ticker, market_type=market_type).first()
+    # (ticker, market_type) 기준 기존 종목을 한 번의 쿼리로 조회
+    existing_map = {
+        stock.ticker: stock
+        for stock in Stock.query.filter(
+            Stock.market_type == market_type,
+            Stock.ticker.in_(df['ticker'].unique().tolist())
+        ).all()
+    }
+    new_rows = {}     # ticker → 신규 INSERT 매핑 (CSV 내 중복 티커는 같은 매핑을 갱신)
+    update_rows = {}  # stock.id → 재활성/회사명 변경 UPDATE 매핑
+    name_pending = []  # (ticker, 매핑) — yfinance로 회사명을 채워야 하는 종목
 
-        # CSV에서 회사명 추출 (있으면 우선 사용)
-        csv_company_name = None
-        try:
-            if 'company_name' in df.columns:
-                raw_name = row.get('company_name')
-                if raw_name is not None:
-                    csv_company_name = str(raw_name).strip()
-                    if csv_company_name == '':
-                        csv_company_name = None
-        except Exception:
-            csv_company_name = None
+    # iterrows는 행마다 Series를 생성하므로 위치 기반 튜플 순회 사용
+    ticker_pos = df.columns.get_loc('ticker')
+    name_pos = df.columns.get_loc('company_name') if 'company_name' in df.columns else None
+
+    for row in df.itertuples(index=False, name=None):
+        ticker = row[ticker_pos]
+
+        existing = existing_map.get(ticker)
+
+        # CSV에서 회사명 추출 (있으면 우선 사용, 정규화는 루프 전에 완료)
+        csv_company_name = (row[name_pos] or None) if name_pos is not None else None
         if existing:
+            # ORM 속성 대신 UPDATE 매핑에 변경분만 누적 (같은 업로드의 이전 행 변경분 반영)
+            update_row = update_rows.setdefault(existing.id, {'id': existing.id})
+
             # 비활성인 경우 재활성화
-            if not existing.is_active:
-                existing.is_active = True
+            if not update_row.get('is_active', existing.is_active):
+                update_row['is_active'] = True
                 reactivated += 1
 
             # 회사명 채우기: CSV 우선, 없으면 yfinance 보강
+            current_name = update_row.get('company_name', existing.company_name)
             if csv_company_name:
                 # CSV 값이 있고 기존과 다르면 갱신
-                if (existing.company_name or '').strip() != csv_company_name:
-                    existing.company_name = csv_company_name
+                if (current_name or '').strip() != csv_company_name:
+                    update_row['company_name'] = csv_company_name
             else:
-                if not existing.company_name:
+                if not current_name:
                     # 기존 로직(메모): 비어있을 때 yfinance로 보강
                     # existing.company_name = get_company_name_from_yahoo(ticker)
                     # MEMO(2025-08-20): 위 한 줄은 회귀 대비 주석 보존. 아래와 동일 동작 수행.
-                    existing.company_name = get_company_name_from_yahoo(ticker)
+                    # yfinance 조회는 루프 이후 일괄 병렬 수행
+                    name_pending.append((ticker, update_row))
+        elif ticker in new_rows:
+            # CSV 내 중복 티커: 방금 추가한 매핑의 회사명만 CSV 값으로 갱신
+            new_row = new_rows[ticker]
+            if csv_company_name and (new_row['company_name'] or '').strip() != csv_company_name:
+                new_row['company_name'] = csv_company_name
         else:
             # 없으면 신규 추가: CSV 우선, 없으면 yfinance
             if csv_company_name:
@@ -108,25 +140,55 @@ def process_csv_file(file_path, market_type):
                 # 기존 로직(메모): 신규 추가 시 yfinance 조회
                 # company_name = get_company_name_from_yahoo(ticker)
                 # MEMO(2025-08-20): 위 한 줄은 회귀 대비 주석 보존. 아래와 동일 동작 수행.
-                company_name = get_company_name_from_yahoo(ticker)
+                # yfinance 조회는 루프 이후 일괄 병렬 수행
+                company_name = None
 
-            new_stock = Stock(
-                ticker=ticker,
-                company_name=company_name,
-                market_type=market_type
-            )
-            db.session.add(new_stock)
+            new_row = {
+                'ticker': ticker,
+                'company_name': company_name,
+                'market_type': market_type,
+            }
+            new_rows[ticker] = new_row
+            if company_name is None:
+                name_pending.append((ticker, new_row))
             added += 1
 
-        # 신규/재활성 모두 데이터 확보 시도 (조용히 실패 허용)
-        try:
-            orchestrator.execute(ticker, market_type)
-        except Exception:
-            pass
-
         processed += 1
 
+    # 같은 업로드의 다른 행에서 CSV 회사명이 채워진 종목은 조회 대상에서 제외
+    name_pending = [(ticker, mapping) for ticker, mapping in name_pending if not mapping.get('company_name')]
+    if name_pending:
+        pending_tickers = list(dict.fromkeys(ticker for ticker, _ in name_pending))
+        # DB에 이미 저장된 회사명(다른 시장/비활성 종목 포함)을 영속 캐시로 우선 사용
+        fetched_names = {
+            ticker: name
+            for ticker, name in db.session.query(Stock.ticker, Stock.company_name).filter(
+                Stock.ticker.in_(pending_tickers),
+                Stock.company_name.isnot(None),
+                Stock.company_name != '',
+                Stock.company_name != 'Unknown'
+            )
+        }
+        # 남은 종목만 yfinance 조회를 동시에 수행 (티커당 1회, 네트워크 대기 중첩)
+        remote_tickers = [ticker for ticker in pending_tickers if ticker not in fetched_names]
+        if remote_tickers:
+            with ThreadPoolExecutor(max_workers=min(YAHOO_NAME_WORKERS, len(remote_tickers))) as executor:
+                fetched_names.update(zip(remote_tickers, executor.map(get_company_name_from_yahoo, remote_tickers)))
+        for ticker, mapping in name_pending:
+            # 같은 업로드의 다른 행에서 CSV 회사명이 채워졌다면 그대로 유지
+            if not mapping.get('company_name'):
+                mapping['company_name'] = fetched_names[ticker]
+
+    # ORM 인스턴스 생성/작업 단위 추적 없이 매핑으로 일괄 INSERT/UPDATE
+    if new_rows:
+        db.session.bulk_insert_mappings(Stock, list(new_rows.values()))
+    changed_rows = [row for row in update_rows.values() if len(row) > 1]
+    if changed_rows:
+        db.session.bulk_update_mappings(Stock, changed_rows)
     db.session.commit()
+
+    # 업로드 단계에서는 데이터 다운로드를 수행하지 않음
+    # (기존 orchestrator.execute 호출은 MarketDataOrchestrator에 해당 메서드가 없어 항상 무동작이었음)
     return {"processed": processed, "added": added, "reactivated": reactivated}
 
 @stock_bp.route('/upload-csv', methods=['POST'])
@@ -144,7 +206,7 @@ def upload_csv():
     if file and allowed_file(file.filename):
         try:
             # 업로드 폴더 보장
-            os.makedirs(current_app.config['UPLOAD_FOLDER'], exist_ok=True)
+            _ensure_dir(current_app.config['UPLOAD_FOLDER'])
 
             filename = secure_filename(file.filename)
             file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
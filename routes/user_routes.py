@@ -8,14 +8,63 @@ from flask_login import login_required, current_user
 from functools import wraps
 from models import db, User, Stock
 from services.core.unified_market_analysis_service import UnifiedMarketAnalysisService
+from services.core.market_summary_service import MarketSummaryService
 from services.technical_indicators_service import technical_indicators_service
 from datetime import datetime
+from threading import Lock
 import logging
+import time
 from typing import Dict
 import pandas as pd
 
 user_bp = Blueprint('user', __name__)
 
+# 홈 화면 분석/요약 결과 캐시: (market, 날짜) → (만료 시각, payload)
+HOME_PAYLOAD_TTL = 300  # 초
+_HOME_PAYLOAD_CACHE: Dict[tuple, tuple] = {}
+_HOME_PAYLOAD_LOCK = Lock()
+
+def _compute_home_payload(market: str, market_type: str) -> Dict:
+    """홈 화면에 필요한 분석 결과와 시장 요약 계산"""
+    # 통합 서비스 사용 (admin_routes와 동일한 패턴)
+    unified_service = UnifiedMarketAnalysisService()
+    analysis_result = unified_service.analyze_market_comprehensive(market, 'd')
+    
+    # 분석 결과에서 데이터 추출
+    classification_results = analysis_result.get('classification_results', {})
+    
+    # MarketSummaryService로 시장 요약 생성
+    market_summary = MarketSummaryService.create_market_summary(classification_results, market_type)
+    return {
+        'analysis_result': analysis_result,
+        'classification_results': classification_results,
+        'market_summary': market_summary,
+    }
+
+def get_home_payload(market: str, market_type: str) -> Dict:
+    """홈 화면 payload 조회 (같은 날짜 내 TTL 동안 사용자 간 공유)"""
+    key = (market, datetime.now().strftime('%Y-%m-%d'))
+    with _HOME_PAYLOAD_LOCK:
+        entry = _HOME_PAYLOAD_CACHE.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    payload = _compute_home_payload(market, market_type)
+    with _HOME_PAYLOAD_LOCK:
+        # 날짜가 바뀐 이전 키는 정리
+        for stale_key in [k for k in _HOME_PAYLOAD_CACHE if k[1] != key[1]]:
+            del _HOME_PAYLOAD_CACHE[stale_key]
+        _HOME_PAYLOAD_CACHE[key] = (time.monotonic() + HOME_PAYLOAD_TTL, payload)
+    return payload
+
+def clear_home_payload_cache(market: str = None) -> None:
+    """홈 화면 payload 캐시 무효화 (데이터 갱신 시 호출)"""
+    with _HOME_PAYLOAD_LOCK:
+        if market is None:
+            _HOME_PAYLOAD_CACHE.clear()
+        else:
+            for stale_key in [k for k in _HOME_PAYLOAD_CACHE if k[0] == market]:
+                del _HOME_PAYLOAD_CACHE[stale_key]
+
 # 어드민 권한 확인 데코레이터 - 주석처리
 # def admin_required(f):
 #     """관리자 권한 확인 데코레이터"""
@@ -41,24 +90,16 @@ def home(market='us'):
         market_type = 'US' if market == 'us' else 'KOSPI' if market == 'kospi' else 'KOSDAQ'
         market_name = '미국 주식 (US)' if market == 'us' else 'KOSPI' if market == 'kospi' else 'KOSDAQ'
         
-        # 통합 서비스 사용 (admin_routes와 동일한 패턴)
-        unified_service = UnifiedMarketAnalysisService()
-        analysis_result = unified_service.analyze_market_comprehensive(market, 'd')
-        
-        # 분석 결과에서 데이터 추출
-        classification_results = analysis_result.get('classification_results', {})
-        
-        # MarketSummaryService로 시장 요약 생성
-        from services.core.market_summary_service import MarketSummaryService
-        market_summary = MarketSummaryService.create_market_summary(classification_results, market_type)
+        # 분석 결과 + 시장 요약 (캐시된 payload 재사용)
+        payload = get_home_payload(market, market_type)
         
         return render_template('user/user_home.html',
                              title='사용자 홈',
                              current_market=market,
                              current_market_name=market_name,
-                             market_summary=market_summary,
-                             classification_results=classification_results,
-                             analysis_result=analysis_result,
+                             market_summary=payload['market_summary'],
+                             classification_results=payload['classification_results'],
+                             analysis_result=payload['analysis_result'],
                              display_date=datetime.now().strftime('%Y-%m-%d'))
     except Exception as e:
         logging.error(f"사용자 홈페이지 오류: {e}")
@@ -403,8 +444,4 @@ def home(market='us'):
 #         
 #     except Exception as e:
 #         logging.error(f"[{ticker}] Error getting stock with indicators from cache: {e}")
-#         return None 
-
-# 임시 Blueprint 생성 (다른 파일에서 import 에러 방지용)
-from flask import Blueprint
-user_bp = Blueprint('user', __name__)
\ No newline at end of file
+#         return None
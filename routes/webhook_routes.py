@@ -4,6 +4,10 @@ from models import db, EmailMessage, EmailEvent, EmailSuppression
 from datetime import datetime
 import json
 import base64
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
 
 try:
     from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
@@ -14,6 +18,39 @@ except Exception:
 
 webhooks_bp = Blueprint('webhooks', __name__)
 
+# 웹훅 본문 최대 크기 (초과 시 JSON 파싱 전에 413)
+MAX_WEBHOOK_BYTES = 2 * 1024 * 1024
+# 최근 처리 완료한 배치 본문 해시 (SendGrid 재전송 시 파싱/DB 작업 없이 200 응답)
+_RECENT_BATCH_MAX = 1024
+_RECENT_BATCHES: "OrderedDict[str, None]" = OrderedDict()
+_RECENT_BATCHES_LOCK = Lock()
+# raw_payload 직렬화용 인코더 재사용 (json.dumps는 기본값 외 인자 사용 시 호출마다 인코더 생성)
+# 파싱된 JSON에서 온 이벤트는 순환 참조가 없으므로 순환 검사 생략
+_RAW_PAYLOAD_ENCODER = json.JSONEncoder(ensure_ascii=False, check_circular=False)
+
+
+def _claim_batch(digest: str) -> bool:
+    """배치 처리 권한 획득 (확인과 기록을 한 번의 잠금 안에서 수행). 이미 처리했거나 처리 중이면 False"""
+    with _RECENT_BATCHES_LOCK:
+        if digest in _RECENT_BATCHES:
+            _RECENT_BATCHES.move_to_end(digest)
+            return False
+        _RECENT_BATCHES[digest] = None
+        while len(_RECENT_BATCHES) > _RECENT_BATCH_MAX:
+            _RECENT_BATCHES.popitem(last=False)
+        return True
+
+
+def _forget_batch(digest: str) -> None:
+    with _RECENT_BATCHES_LOCK:
+        _RECENT_BATCHES.pop(digest, None)
+
+
+@lru_cache(maxsize=4)
+def _get_verify_key(public_key_b64: str):
+    """공개키 파싱 결과 캐시 (키 변경 시에만 다시 파싱)"""
+    return Ed25519PublicKey.from_public_bytes(base64.b64decode(public_key_b64))
+
 
 def _verify_sendgrid_signature(headers, body_bytes) -> bool:
     """SendGrid Event Webhook 서명 검증(Ed25519). 개발 단계에서는 우회 가능.
@@ -29,8 +66,7 @@ def _verify_sendgrid_signature(headers, body_bytes) -> bool:
         logging.warning('[Webhook] cryptography 미설치로 검증 우회')
         return True
     try:
-        pk_bytes = base64.b64decode(public_key)
-        verify_key = Ed25519PublicKey.from_public_bytes(pk_bytes)
+        verify_key = _get_verify_key(public_key)
         sig_bytes = base64.b64decode(signature)
         message = (timestamp.encode('utf-8') + body_bytes)
         verify_key.verify(sig_bytes, message)
@@ -43,73 +79,160 @@ def _verify_sendgrid_signature(headers, body_bytes) -> bool:
         return False
 
 
+def _insert_suppressions_ignore_existing(rows) -> None:
+    """억제 리스트 일괄 추가: 지원 DB에서는 ON CONFLICT DO NOTHING으로 조회 없이 1문장 처리"""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        # 그 외 DB: 기존 등록 여부를 IN 쿼리 1회로 확인 후 추가
+        suppressed = {
+            row.email
+            for row in db.session.query(EmailSuppression.email).filter(
+                EmailSuppression.email.in_([r['email'] for r in rows])
+            )
+        }
+        new_rows = [r for r in rows if r['email'] not in suppressed]
+        if new_rows:
+            db.session.bulk_insert_mappings(EmailSuppression, new_rows)
+        return
+    db.session.execute(
+        dialect_insert(EmailSuppression).on_conflict_do_nothing(index_elements=['email']),
+        rows
+    )
+
+
+def _persist_sendgrid_events(events) -> int:
+    """SendGrid 이벤트 배치 저장 (이벤트 INSERT, 메시지 상태 전이, 바운스 억제) 후 커밋"""
+    # 이벤트 ID/메시지 ID를 먼저 수집해 IN 쿼리 2회로 조회 (이벤트당 쿼리 2회 제거)
+    parsed = []
+    for ev in events:
+        try:
+            sg_event_id = ev.get('sg_event_id') or ev.get('event_id')
+            # 메시지 매핑: sg_message_id / smtp-id (각괄호 제거)
+            raw_msg_id = ev.get('sg_message_id') or ev.get('smtp-id') or ''
+            msg_id_clean = str(raw_msg_id).strip('<>') if raw_msg_id else None
+            parsed.append((ev, sg_event_id, msg_id_clean))
+        except Exception as ie:
+            logging.warning(f"[Webhook] 이벤트 처리 실패: {ie}")
+
+    sg_ids = list({sg_event_id for _, sg_event_id, _ in parsed if sg_event_id})
+    msg_ids = list({msg_id for _, _, msg_id in parsed if msg_id})
+    seen_event_ids = {
+        row.sg_event_id
+        for row in db.session.query(EmailEvent.sg_event_id).filter(EmailEvent.sg_event_id.in_(sg_ids))
+    } if sg_ids else set()
+    # 상태 전이에는 id만 필요하므로 ORM 객체 대신 (sendgrid_message_id, id)만 조회
+    message_map = dict(
+        db.session.query(EmailMessage.sendgrid_message_id, EmailMessage.id)
+        .filter(EmailMessage.sendgrid_message_id.in_(msg_ids))
+    ) if msg_ids else {}
+
+    event_rows = []
+    message_updates = {}  # message id → 최종 상태 전이 값 (배치 내 순서대로 덮어씀)
+    bounce_emails = {}  # 억제 리스트 후보: email → reason
+    saved = 0
+    for ev, sg_event_id, msg_id_clean in parsed:
+        try:
+            event_type = ev.get('event')
+            occurred_at = ev.get('timestamp')
+            if isinstance(occurred_at, (int, float)):
+                occurred_dt = datetime.utcfromtimestamp(occurred_at)
+            else:
+                occurred_dt = datetime.utcnow()
+
+            message_pk = message_map.get(msg_id_clean) if msg_id_clean else None
+
+            # 이벤트 중복 차단 (DB 기존 + 같은 배치 내 중복)
+            if sg_event_id:
+                if sg_event_id in seen_event_ids:
+                    continue
+                seen_event_ids.add(sg_event_id)
+
+            event_rows.append({
+                'message_id': message_pk,
+                'event': event_type or 'unknown',
+                'reason': ev.get('reason'),
+                'sg_event_id': sg_event_id,
+                'occurred_at': occurred_dt,
+                'raw_payload': _RAW_PAYLOAD_ENCODER.encode(ev)
+            })
+
+            # 상태 전이 (메시지별 변경값만 누적 → 루프 이후 UPDATE 일괄 실행)
+            if message_pk is not None:
+                if event_type == 'delivered':
+                    update = message_updates.setdefault(message_pk, {'id': message_pk})
+                    update['status'] = 'delivered'
+                    update['delivered_at'] = occurred_dt
+                elif event_type == 'bounce':
+                    update = message_updates.setdefault(message_pk, {'id': message_pk})
+                    update['status'] = 'bounced'
+                    update['last_error'] = ev.get('reason')
+                    # 바운스 억제 리스트 후보 (루프 이후 일괄 추가)
+                    to_email = ev.get('email')
+                    if to_email:
+                        bounce_emails.setdefault(to_email, ev.get('reason'))
+                elif event_type in ('dropped', 'deferred'):
+                    message_updates.setdefault(message_pk, {'id': message_pk})['status'] = event_type
+
+            saved += 1
+        except Exception as ie:
+            logging.warning(f"[Webhook] 이벤트 처리 실패: {ie}")
+
+    if event_rows:
+        db.session.bulk_insert_mappings(EmailEvent, event_rows)
+    # 메시지 상태 전이는 executemany UPDATE로 일괄 반영 (변경 컬럼 조합별 1문장)
+    if message_updates:
+        db.session.bulk_update_mappings(EmailMessage, list(message_updates.values()))
+
+    # 바운스 억제 리스트 추가 (이미 등록된 이메일은 DB에서 무시)
+    # SAVEPOINT로 격리: 실패해도 PostgreSQL 트랜잭션이 중단되지 않아 이벤트/상태 변경은 커밋됨
+    if bounce_emails:
+        try:
+            with db.session.begin_nested():
+                _insert_suppressions_ignore_existing([
+                    {'email': email, 'reason': 'bounce', 'detail': detail}
+                    for email, detail in bounce_emails.items()
+                ])
+        except Exception as se:
+            logging.error(f"[Webhook] 바운스 억제 리스트 추가 실패: {se}")
+
+    db.session.commit()
+    return saved
+
+
 @webhooks_bp.route('/sendgrid/events', methods=['POST'])
 def handle_sendgrid_events():
     try:
-        if not _verify_sendgrid_signature(request.headers, request.data):
-            return jsonify({'success': False, 'message': 'invalid signature'}), 400
+        # 본문을 읽기 전에 크기 제한 확인
+        if request.content_length is not None and request.content_length > MAX_WEBHOOK_BYTES:
+            return jsonify({'success': False, 'message': 'payload too large'}), 413
 
-        events = request.get_json(force=True, silent=True)
-        if not isinstance(events, list):
-            return jsonify({'success': False, 'message': 'invalid payload'}), 400
-
-        saved = 0
-        for ev in events:
-            try:
-                event_type = ev.get('event')
-                sg_event_id = ev.get('sg_event_id') or ev.get('event_id')
-                occurred_at = ev.get('timestamp')
-                if isinstance(occurred_at, (int, float)):
-                    occurred_dt = datetime.utcfromtimestamp(occurred_at)
-                else:
-                    occurred_dt = datetime.utcnow()
-
-                # 메시지 매핑: sg_message_id / smtp-id (각괄호 제거)
-                raw_msg_id = ev.get('sg_message_id') or ev.get('smtp-id') or ''
-                msg_id_clean = str(raw_msg_id).strip('<>') if raw_msg_id else None
-
-                email_message = None
-                if msg_id_clean:
-                    email_message = EmailMessage.query.filter_by(sendgrid_message_id=msg_id_clean).first()
-
-                # 이벤트 중복 차단
-                if sg_event_id and EmailEvent.query.filter_by(sg_event_id=sg_event_id).first():
-                    continue
+        body = request.get_data()
+        if len(body) > MAX_WEBHOOK_BYTES:
+            return jsonify({'success': False, 'message': 'payload too large'}), 413
+
+        if not _verify_sendgrid_signature(request.headers, body):
+            return jsonify({'success': False, 'message': 'invalid signature'}), 400
 
-                email_event = EmailEvent(
-                    message_id=email_message.id if email_message else None,
-                    event=event_type or 'unknown',
-                    reason=ev.get('reason'),
-                    sg_event_id=sg_event_id,
-                    occurred_at=occurred_dt,
-                    raw_payload=json.dumps(ev, ensure_ascii=False)
-                )
-                db.session.add(email_event)
-
-                # 상태 전이
-                if email_message:
-                    if event_type == 'delivered':
-                        email_message.status = 'delivered'
-                        email_message.delivered_at = occurred_dt
-                    elif event_type == 'bounce':
-                        email_message.status = 'bounced'
-                        email_message.last_error = ev.get('reason')
-                        # 바운스 억제 리스트 추가
-                        try:
-                            to_email = ev.get('email')
-                            if to_email:
-                                if not EmailSuppression.query.filter_by(email=to_email).first():
-                                    db.session.add(EmailSuppression(email=to_email, reason='bounce', detail=ev.get('reason')))
-                        except Exception:
-                            pass
-                    elif event_type in ('dropped', 'deferred'):
-                        email_message.status = event_type
-
-                saved += 1
-            except Exception as ie:
-                logging.warning(f"[Webhook] 이벤트 처리 실패: {ie}")
-
-        db.session.commit()
+        # 이미 처리했거나 처리 중인 배치의 재전송은 JSON 파싱 없이 바로 성공 응답
+        batch_digest = hashlib.sha256(body).hexdigest()
+        if not _claim_batch(batch_digest):
+            return jsonify({'success': True, 'saved': 0, 'duplicate': True})
+
+        # 저장이 끝난 뒤에만 200 응답 (실패 시 배치 기록 해제 후 5xx → SendGrid가 재전송)
+        try:
+            events = request.get_json(force=True, silent=True)
+            if not isinstance(events, list):
+                _forget_batch(batch_digest)
+                return jsonify({'success': False, 'message': 'invalid payload'}), 400
+            saved = _persist_sendgrid_events(events)
+        except Exception:
+            _forget_batch(batch_digest)
+            raise
+        logging.info(f"[Webhook] 이벤트 {saved}건 저장 완료")
         return jsonify({'success': True, 'saved': saved})
     except Exception as e:
         logging.error(f"[Webhook] 오류: {e}")
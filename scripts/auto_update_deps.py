@@ -34,7 +34,13 @@ from __future__ import annotations
 import sys
 import subprocess
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import importlib.metadata
+import json
+import logging
 import os
+import urllib.request
 from pathlib import Path
 from typing import List, Dict
 
@@ -71,20 +77,34 @@ def resolve_app_paths() -> tuple[Path, Path]:
 APP_DIR, LOG_FILE = resolve_app_paths()
 
 
-def log(message: str) -> None:
-    timestamp = dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    line = f"[{timestamp}] {message}\n"
+def _build_logger() -> logging.Logger:
+    """로그 파일 핸들러를 한 번만 열어 유지하는 로거 구성 (줄마다 open/close 제거)."""
+    logger = logging.getLogger("auto_update_deps")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
     try:
-        with LOG_FILE.open("a", encoding="utf-8") as f:
-            f.write(line)
+        file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+        file_handler.setFormatter(formatter)
+        logger.addHandler(file_handler)
     except Exception:
         # 로그 파일 기록 실패 시에도 표준출력은 보장
         pass
-    print(line, end="")
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    logger.addHandler(stream_handler)
+    return logger
+
+
+LOGGER = _build_logger()
+
+
+def log(message: str) -> None:
+    LOGGER.info(message)
 
 
 def run(cmd: List[str], allow_fail: bool = False) -> int:
-    """서브프로세스 실행 헬퍼. 표준출력/에러를 로그에 적재.
+    """서브프로세스 실행 헬퍼. 표준출력/에러를 줄 단위로 로그에 적재.
 
     Args:
         cmd: 실행할 명령(리스트 형태)
@@ -96,16 +116,25 @@ def run(cmd: List[str], allow_fail: bool = False) -> int:
     """
     log(f"$ {' '.join(cmd)}")
     try:
-        res = subprocess.run(cmd, capture_output=True, text=True)
-        if res.stdout:
-            log(res.stdout.strip())
-        if res.stderr:
-            log(res.stderr.strip())
-        if res.returncode != 0 and not allow_fail:
+        # 전체 출력을 메모리에 모으지 않고 줄 단위로 바로 기록 (stderr는 stdout에 합침)
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        ) as proc:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                line = line.rstrip()
+                if line:
+                    log(line)
+            returncode = proc.wait()
+        if returncode != 0 and not allow_fail:
             raise RuntimeError(
-                f"Command failed: {' '.join(cmd)} (code={res.returncode})"
+                f"Command failed: {' '.join(cmd)} (code={returncode})"
             )
-        return res.returncode
+        return returncode
     except Exception as e:
         log(f"ERROR: {e}")
         if allow_fail:
@@ -113,21 +142,47 @@ def run(cmd: List[str], allow_fail: bool = False) -> int:
         raise
 
 
+@lru_cache(maxsize=None)
+def _pip_cmd() -> tuple[str, ...]:
+    return (sys.executable, "-m", "pip")
+
+
 def pip_exec() -> List[str]:
     """현재 파이썬 해석기의 pip를 사용하도록 명령을 구성.
 
     - 가상환경을 활성화한 상태라면 해당 venv의 pip가 사용됨
     - 그렇지 않더라도 sys.executable -m pip로 안전하게 호출
     """
-    return [sys.executable, "-m", "pip"]
+    return list(_pip_cmd())
+
+
+def needs_update(pkg: str) -> bool:
+    """설치 버전과 PyPI 최신 버전 비교 (확인 실패 시 업데이트 대상으로 간주)."""
+    try:
+        current = importlib.metadata.version(pkg)
+    except importlib.metadata.PackageNotFoundError:
+        log(f"{pkg}: not installed")
+        return True
+    try:
+        with urllib.request.urlopen(f"https://pypi.org/pypi/{pkg}/json", timeout=10) as resp:
+            latest = json.loads(resp.read())["info"]["version"]
+    except Exception as e:
+        log(f"{pkg}: PyPI version check failed ({e})")
+        return True
+    log(f"{pkg}: installed={current} latest={latest}")
+    return current != latest
 
 
-def list_outdated() -> None:
-    run(pip_exec() + ["list", "--outdated"], allow_fail=True)
+def list_outdated() -> List[str]:
+    """허용 목록 패키지만 PyPI에 조회 (전체 설치 패키지 대상 pip list --outdated 대체)."""
+    with ThreadPoolExecutor(max_workers=len(ALLOW_PACKAGES)) as executor:
+        flags = list(executor.map(needs_update, ALLOW_PACKAGES))
+    return [pkg for pkg, stale in zip(ALLOW_PACKAGES, flags) if stale]
 
 
-def upgrade_allowlist() -> None:
-    run(pip_exec() + ["install", "-U", *ALLOW_PACKAGES])
+def upgrade_allowlist(packages: List[str]) -> None:
+    # 휠만 사용해 소스 빌드(pandas/numpy 컴파일) 방지
+    run(pip_exec() + ["install", "-U", "--only-binary=:all:", "--prefer-binary", *packages])
 
 
 def smoke_test() -> bool:
@@ -143,20 +198,20 @@ def smoke_test() -> bool:
         log(f"import error: {e}")
         return False
 
-    ok = True
-    try:
-        df1 = yf.Ticker("AAPL").history(period="1mo")
-        ok &= (not df1.empty)
-    except Exception as e:
-        log(f"yfinance error: {e}")
-        ok = False
-
-    try:
-        df2 = fdr.DataReader("AAPL", dt.date(2024, 1, 1), dt.date(2024, 2, 1))
-        ok &= (not df2.empty)
-    except Exception as e:
-        log(f"FDR error: {e}")
-        ok = False
+    def _check(name: str, fetch) -> bool:
+        try:
+            return not fetch().empty
+        except Exception as e:
+            log(f"{name} error: {e}")
+            return False
+
+    # 두 데이터 소스 호출은 서로 독립적인 네트워크 대기이므로 동시에 수행
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        f1 = executor.submit(_check, "yfinance", lambda: yf.Ticker("AAPL").history(period="1mo"))
+        f2 = executor.submit(
+            _check, "FDR", lambda: fdr.DataReader("AAPL", dt.date(2024, 1, 1), dt.date(2024, 2, 1))
+        )
+        ok = f1.result() and f2.result()
 
     log("SMOKE_OK" if ok else "SMOKE_FAIL")
     return ok
@@ -164,14 +219,19 @@ def smoke_test() -> bool:
 
 def rollback_pins() -> None:
     pkgs = [f"{name}=={ver}" for name, ver in PINS.items()]
-    run(pip_exec() + ["install", *pkgs])
+    # 롤백은 반드시 성공해야 하므로 휠 우선(소스 빌드 허용)으로 설치
+    run(pip_exec() + ["install", "--prefer-binary", *pkgs])
 
 
 def main() -> None:
     log("=== Auto Update Deps: START ===")
-    list_outdated()
+    to_update = list_outdated()
+    if not to_update:
+        log("Nothing to update")
+        log("=== Auto Update Deps: END (OK) ===")
+        return
     try:
-        upgrade_allowlist()
+        upgrade_allowlist(to_update)
         if not smoke_test():
             log("Smoke failed → rollback to pinned versions")
             rollback_pins()
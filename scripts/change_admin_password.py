@@ -14,6 +14,7 @@ except Exception:
 
 def main() -> int:
     try:
+        from sqlalchemy.pool import NullPool
         from app import create_app
         from models import db, User
     except Exception as e:
@@ -42,7 +43,8 @@ def main() -> int:
     if len(new_password) < 8:
         print("[WARN] 8자 미만의 비밀번호입니다. 보안을 위해 더 길게 설정하는 것을 권장합니다.")
 
-    app = create_app()
+    # 단발성 실행: 커넥션 풀 없이 사용 후 즉시 종료
+    app = create_app(engine_options={'poolclass': NullPool})
     with app.app_context():
         # 사용자 조회
         user: User | None = None
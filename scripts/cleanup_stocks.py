@@ -14,60 +14,115 @@
 """
 
 import sys
-from collections import defaultdict
 from datetime import datetime
 
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool
+
 from app import create_app
 from models import db, Stock
 
 
+# (정규화 ticker, 정규화 market_type) 그룹 내 최신 레코드 순위 (rn = 1 이 유지 대상)
+_RANKED_CTE = """
+WITH ranked AS (
+    SELECT id,
+           UPPER(TRIM(ticker)) AS norm_ticker,
+           UPPER(TRIM(market_type)) AS norm_market,
+           ROW_NUMBER() OVER (
+               PARTITION BY UPPER(TRIM(ticker)), UPPER(TRIM(market_type))
+               ORDER BY created_at DESC, id DESC
+           ) AS rn
+    FROM stocks
+)
+"""
+
+_COUNT_SQL = _RANKED_CTE + """
+SELECT
+    SUM(CASE WHEN s.ticker <> r.norm_ticker OR s.market_type <> r.norm_market THEN 1 ELSE 0 END),
+    SUM(CASE WHEN r.rn > 1 AND s.is_active THEN 1 ELSE 0 END)
+FROM stocks s JOIN ranked r ON s.id = r.id
+"""
+
+# 변경이 필요한 행만 한 문장으로 정규화 + 활성/비활성 전환
+_UPDATE_SQL = _RANKED_CTE + """
+UPDATE stocks
+SET ticker = ranked.norm_ticker,
+    market_type = ranked.norm_market,
+    is_active = (ranked.rn = 1),
+    updated_at = :now
+FROM ranked
+WHERE stocks.id = ranked.id
+  AND (stocks.ticker <> ranked.norm_ticker
+       OR stocks.market_type <> ranked.norm_market
+       OR stocks.is_active IS NULL
+       OR stocks.is_active <> (ranked.rn = 1))
+"""
+
+# 윈도 함수 + UPDATE ... FROM을 지원하는 DB (SQLite 3.33+, PostgreSQL)
+_SQL_DIALECTS = ('postgresql', 'sqlite')
+
+# ORM 경로의 스트리밍 조회/일괄 UPDATE 단위
+UPDATE_CHUNK_SIZE = 1000
+
+
 def normalize_ticker(raw: str) -> str:
     if raw is None:
         return ''
     return str(raw).strip().upper()
 
 
+def cleanup_with_sql() -> tuple[int, int]:
+    """집합 단위 SQL로 정리 (행 로드 없이 집계 1회 + UPDATE 1회)"""
+    normalized, deactivated = db.session.execute(text(_COUNT_SQL)).one()
+    db.session.execute(text(_UPDATE_SQL), {'now': datetime.utcnow()})
+    db.session.commit()
+    return normalized or 0, deactivated or 0
+
+
 def main() -> int:
-    app = create_app()
+    # 단발성 실행(트랜잭션 1회): 커넥션 풀 없이 사용 후 즉시 종료
+    app = create_app(engine_options={'poolclass': NullPool})
     with app.app_context():
-        stocks = Stock.query.order_by(Stock.created_at.desc()).all()
-
-        groups = defaultdict(list)
-        for s in stocks:
-            key = (normalize_ticker(s.ticker), (s.market_type or '').strip().upper())
-            groups[key].append(s)
-
-        to_deactivate = []
-        to_normalize = []
-
-        for (ticker, market_type), items in groups.items():
-            # 최신 1개만 활성화 유지
-            # created_at 내림차순으로 이미 로드됨
-            keep = None
-            for idx, item in enumerate(items):
-                # 티커/마켓 정규화 반영
-                changed = False
-                if item.ticker != ticker:
-                    item.ticker = ticker
-                    changed = True
-                if (item.market_type or '').strip().upper() != market_type:
-                    item.market_type = market_type
-                    changed = True
-                if changed:
-                    to_normalize.append(item)
-
-                if idx == 0:
-                    keep = item
-                    if not item.is_active:
-                        item.is_active = True
-                else:
-                    if item.is_active:
-                        item.is_active = False
-                        to_deactivate.append(item)
-
+        if db.engine.dialect.name in _SQL_DIALECTS:
+            normalized, deactivated = cleanup_with_sql()
+            print(f"정규화 적용: {normalized}건, 비활성화 처리: {deactivated}건")
+            return 0
+
+        # 그 외 DB: 필요한 컬럼만 스트리밍 조회하며 변경분만 매핑으로 모아 일괄 UPDATE
+        # created_at 내림차순이므로 그룹별 첫 행이 유지 대상 (행 전체를 메모리에 올리지 않음)
+        rows = db.session.query(
+            Stock.id, Stock.ticker, Stock.market_type, Stock.is_active
+        ).order_by(Stock.created_at.desc(), Stock.id.desc()).yield_per(UPDATE_CHUNK_SIZE)
+
+        kept_keys = set()
+        norm_payload = []   # 티커/마켓 정규화
+        active_payload = []  # 활성/비활성 전환
+        deactivated = 0
+
+        for row in rows:
+            ticker = normalize_ticker(row.ticker)
+            market_type = (row.market_type or '').strip().upper()
+            # 티커/마켓 정규화 반영
+            if row.ticker != ticker or row.market_type != market_type:
+                norm_payload.append({'id': row.id, 'ticker': ticker, 'market_type': market_type})
+
+            key = (ticker, market_type)
+            if key not in kept_keys:
+                # 최신 1개만 활성화 유지
+                kept_keys.add(key)
+                if not row.is_active:
+                    active_payload.append({'id': row.id, 'is_active': True})
+            elif row.is_active:
+                active_payload.append({'id': row.id, 'is_active': False})
+                deactivated += 1
+
+        for payload in (norm_payload, active_payload):
+            for start in range(0, len(payload), UPDATE_CHUNK_SIZE):
+                db.session.bulk_update_mappings(Stock, payload[start:start + UPDATE_CHUNK_SIZE])
         db.session.commit()
 
-        print(f"정규화 적용: {len(to_normalize)}건, 비활성화 처리: {len(to_deactivate)}건")
+        print(f"정규화 적용: {len(norm_payload)}건, 비활성화 처리: {deactivated}건")
     return 0
 
 
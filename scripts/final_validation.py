@@ -8,6 +8,10 @@ import os
 import time
 import logging
 import subprocess
+import importlib.util
+import tempfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Any
 
@@ -28,6 +32,15 @@ class FinalValidation:
     def __init__(self):
         self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.validation_results = {}
+        # Flask 앱은 한 번만 생성해 모든 점검에서 재사용
+        self.app = None
+        self.client = None
+        try:
+            from app import create_app
+            self.app = create_app()
+            self.client = self.app.test_client()
+        except Exception as e:
+            logger.warning(f"Flask 앱 생성 실패: {str(e)}")
         
     def run_all_validations(self) -> Dict[str, Any]:
         """모든 검증 실행"""
@@ -36,35 +49,39 @@ class FinalValidation:
         try:
             start_time = time.time()
             
-            # 1. 단위 테스트
-            logger.info("🧪 1단계: 단위 테스트 실행")
-            unit_test_results = self._run_unit_tests()
-            
-            # 2. 통합 테스트
-            logger.info("🔗 2단계: 통합 테스트 실행")
-            integration_test_results = self._run_integration_tests()
-            
-            # 3. 성능 테스트
-            logger.info("⚡ 3단계: 성능 테스트 실행")
-            performance_test_results = self._run_performance_tests()
-            
-            # 4. 보안 테스트
-            logger.info("🔒 4단계: 보안 테스트 실행")
-            security_test_results = self._run_security_tests()
-            
-            # 5. 사용성 테스트
-            logger.info("👥 5단계: 사용성 테스트 실행")
-            usability_test_results = self._run_usability_tests()
+            # 각 단계는 서로 독립적(서브프로세스/IO 위주)이므로 동시 실행
+            stages = {
+                "unit_tests": ("🧪 단위 테스트 실행", self._run_unit_tests),
+                "integration_tests": ("🔗 통합 테스트 실행", self._run_integration_tests),
+                "security_tests": ("🔒 보안 테스트 실행", self._run_security_tests),
+                "usability_tests": ("👥 사용성 테스트 실행", self._run_usability_tests),
+            }
+            stage_results = {}
+            with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+                futures = {}
+                for name, (label, stage) in stages.items():
+                    logger.info(label)
+                    futures[executor.submit(stage)] = name
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        stage_results[name] = future.result()
+                    except Exception as e:
+                        stage_results[name] = {"success": False, "error": str(e)}
+            
+            # 성능 테스트는 CPU/메모리 사용률을 측정하므로 다른 단계가 끝난 뒤 단독 실행
+            logger.info("⚡ 성능 테스트 실행")
+            try:
+                stage_results["performance_tests"] = self._run_performance_tests()
+            except Exception as e:
+                stage_results["performance_tests"] = {"success": False, "error": str(e)}
             
             # 결과 통합
             total_time = time.time() - start_time
             
             self.validation_results = {
-                "unit_tests": unit_test_results,
-                "integration_tests": integration_test_results,
-                "performance_tests": performance_test_results,
-                "security_tests": security_test_results,
-                "usability_tests": usability_test_results,
+                **{name: stage_results[name] for name in
+                   ("unit_tests", "integration_tests", "performance_tests", "security_tests", "usability_tests")},
                 "total_validation_time": total_time,
                 "timestamp": datetime.now().isoformat()
             }
@@ -87,24 +104,40 @@ class FinalValidation:
     def _run_unit_tests(self) -> Dict[str, Any]:
         """단위 테스트 실행"""
         try:
-            # pytest를 사용한 단위 테스트 실행
-            test_command = [sys.executable, '-m', 'pytest', 'tests/unit/', '-v', '--tb=short']
-            
-            result = subprocess.run(
-                test_command,
-                capture_output=True,
-                text=True,
-                cwd=self.project_root
-            )
-            
-            # 테스트 결과 파싱
-            test_output = result.stdout
-            test_errors = result.stderr
-            
-            # 성공/실패 개수 계산
-            success_count = test_output.count('PASSED')
-            failed_count = test_output.count('FAILED')
-            total_count = success_count + failed_count
+            # pytest를 사용한 단위 테스트 실행 (결과 집계는 JUnit XML 리포트로, 출력은 최소화)
+            report_fd, report_path = tempfile.mkstemp(suffix='.xml')
+            os.close(report_fd)
+            test_command = [sys.executable, '-m', 'pytest', 'tests/unit/', '-q', '--tb=short',
+                            f'--junitxml={report_path}']
+            # pytest-xdist 설치 시 CPU 코어 수만큼 분산 실행
+            if importlib.util.find_spec('xdist') is not None:
+                test_command += ['-n', 'auto']
+            
+            try:
+                result = subprocess.run(
+                    test_command,
+                    capture_output=True,
+                    text=True,
+                    cwd=self.project_root
+                )
+                
+                # 테스트 결과 파싱
+                test_output = result.stdout
+                test_errors = result.stderr
+                
+                # 성공/실패 개수 계산 (testsuite 속성 합산)
+                total_count = failed_count = skipped_count = 0
+                if os.path.getsize(report_path) > 0:
+                    root = ET.parse(report_path).getroot()
+                    suites = [root] if root.tag == 'testsuite' else root.iter('testsuite')
+                    for suite in suites:
+                        total_count += int(suite.get('tests', 0))
+                        failed_count += int(suite.get('failures', 0)) + int(suite.get('errors', 0))
+                        skipped_count += int(suite.get('skipped', 0))
+                total_count -= skipped_count
+                success_count = total_count - failed_count
+            finally:
+                os.remove(report_path)
             
             success_rate = success_count / total_count if total_count > 0 else 0
             
@@ -294,15 +327,15 @@ class FinalValidation:
         """API 엔드포인트 확인"""
         try:
             # 주요 API 엔드포인트 확인
-            from app import app
-            
-            with app.test_client() as client:
-                # 기본 엔드포인트 테스트
-                response = client.get('/')
-                if response.status_code == 200:
-                    return True
-                else:
-                    return False
+            if self.client is None:
+                return False
+            
+            # 기본 엔드포인트 테스트
+            response = self.client.get('/')
+            if response.status_code == 200:
+                return True
+            else:
+                return False
                     
         except Exception as e:
             logger.warning(f"API 엔드포인트 확인 실패: {str(e)}")
@@ -312,10 +345,17 @@ class FinalValidation:
         """데이터베이스 연결 확인"""
         try:
             # 데이터베이스 연결 테스트
+            from sqlalchemy import text
             from models import db
             
-            # 간단한 쿼리 실행
-            db.engine.execute("SELECT 1")
+            if self.app is None:
+                return False
+            
+            # 간단한 쿼리 실행 (앱 컨텍스트 필요)
+            # SQLAlchemy 2.x에서는 Engine.execute가 제거됨 → 풀 커넥션으로 실행
+            with self.app.app_context():
+                with db.engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
             return True
             
         except Exception as e:
@@ -33,9 +33,10 @@ def orchestrate_and_get_latest_ohlcv(tickers, market_type, **kwargs):
             # 4. 새 데이터 다운로드 및 저장
             result = orchestrator.process_stock_data_complete(ticker, market_type)
             if result.success:
-                # 5. 등락률은 indicators CSV에서 읽기
-                change_percent = indicators_service.get_latest_change_percent(ticker, 'd', market_type)
-                latest_ohlcv = reading_service.read_ohlcv_csv(ticker, market_type, 'd').iloc[-1]
+                # 5. 등락률은 방금 읽은 OHLCV에서 계산 (같은 CSV 재읽기 방지)
+                ohlcv_df = reading_service.read_ohlcv_csv(ticker, market_type, 'd')
+                change_percent = indicators_service.change_percent_from_ohlcv(ohlcv_df, ticker)
+                latest_ohlcv = ohlcv_df.iloc[-1]
 
                 results[ticker] = {
                     'close': latest_ohlcv['Close'],
@@ -48,7 +49,7 @@ def orchestrate_and_get_latest_ohlcv(tickers, market_type, **kwargs):
             ohlcv_df = reading_service.read_ohlcv_csv(ticker, market_type, 'd')
 
             if not ohlcv_df.empty:
-                change_percent = indicators_service.get_latest_change_percent(ticker, 'd', market_type)
+                change_percent = indicators_service.change_percent_from_ohlcv(ohlcv_df, ticker)
                 latest_ohlcv = ohlcv_df.iloc[-1]
 
                 # Deprecated: DataReadingService.find_latest_csv_file → FileManagementService.get_latest_file
@@ -3,12 +3,19 @@ import logging
 import pandas as pd
 import google.generativeai as genai
 from datetime import datetime, time
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from typing import Dict, List, Optional, Tuple
 
 # Config
 from config import DevelopmentConfig
 
+@lru_cache(maxsize=4)
+def _read_prompt_template_cached(path: str, mtime_ns: int) -> str:
+    """프롬프트 템플릿 파일 읽기 (mtime이 바뀔 때만 디스크에서 다시 읽음)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
 class AIAnalysisService:
     """AI 분석 전용 서비스"""
     
@@ -151,14 +158,12 @@ class AIAnalysisService:
             # [2025-08-09 수정] ai_analysis_prompt.txt 파일은 프로젝트 루트에 위치
             template_path = "ai_analysis_prompt.txt"  # 프로젝트 루트 경로
             if os.path.exists(template_path):
-                with open(template_path, 'r', encoding='utf-8') as f:
-                    return f.read()
+                return _read_prompt_template_cached(template_path, os.stat(template_path).st_mtime_ns)
             else:
                 # 이전 경로로도 시도
                 fallback_path = os.path.join("templates", "ai_analysis_prompt.txt") 
                 if os.path.exists(fallback_path):
-                    with open(fallback_path, 'r', encoding='utf-8') as f:
-                        return f.read()
+                    return _read_prompt_template_cached(fallback_path, os.stat(fallback_path).st_mtime_ns)
                 # 기본 템플릿 반환
                 return self._get_default_prompt_template()
         except Exception as e:
@@ -210,15 +215,13 @@ class AIAnalysisService:
             ohlcv_df = reading_service.read_ohlcv_csv(ticker, market_type, timeframe)
             ohlcv_data = []
             if not ohlcv_df.empty:
-                for idx, row in ohlcv_df.iterrows():
-                    ohlcv_data.append({
-                        'date': idx.strftime('%Y-%m-%d') if hasattr(idx, 'strftime') else str(idx),
-                        'open': row.get('Open', 0),
-                        'high': row.get('High', 0),
-                        'low': row.get('Low', 0),
-                        'close': row.get('Close', 0),
-                        'volume': row.get('Volume', 0),
-                    })
+                # 행마다 Series를 만들지 않고 필요한 컬럼을 한 번에 배열로 꺼내 위치 기반으로 접근
+                values = ohlcv_df.reindex(columns=['Open', 'High', 'Low', 'Close', 'Volume'], fill_value=0).to_numpy(dtype=object)
+                dates = self._format_index_dates(ohlcv_df.index)
+                ohlcv_data = [
+                    {'date': date, 'open': row[0], 'high': row[1], 'low': row[2], 'close': row[3], 'volume': row[4]}
+                    for date, row in zip(dates, values)
+                ]
             
             if not ohlcv_data:
                 return []
@@ -240,11 +243,9 @@ class AIAnalysisService:
                 return []
             
             # 지표 DataFrame을 딕셔너리 리스트로 변환
-            indicators_list = []
-            for idx, row in indicators_df.iterrows():
-                indicator_dict = row.to_dict()
-                indicator_dict['date'] = idx.strftime('%Y-%m-%d') if hasattr(idx, 'strftime') else str(idx)
-                indicators_list.append(indicator_dict)
+            indicators_list = indicators_df.to_dict(orient='records')
+            for indicator_dict, date in zip(indicators_list, self._format_index_dates(indicators_df.index)):
+                indicator_dict['date'] = date
             
             # 데이터 결합
             combined_data = []
@@ -266,6 +267,13 @@ class AIAnalysisService:
             self.logger.error(f"지표 포함 데이터 로딩 실패: {e}")
             return []
     
+    @staticmethod
+    def _format_index_dates(index) -> List[str]:
+        """인덱스를 'YYYY-MM-DD' 문자열 리스트로 변환 (DatetimeIndex는 벡터 변환)"""
+        if isinstance(index, pd.DatetimeIndex):
+            return index.strftime('%Y-%m-%d').tolist()
+        return [idx.strftime('%Y-%m-%d') if hasattr(idx, 'strftime') else str(idx) for idx in index]
+    
     def _create_analysis_prompt(self, ticker: str, company_name: str, 
                                daily_data: List, weekly_data: List, monthly_data: List,
                                market_type: str = 'KOSPI') -> str:
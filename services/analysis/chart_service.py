@@ -8,19 +8,29 @@ import logging
 import pandas as pd
 import base64
 import io
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import mplfinance as mpf
 import glob
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 from services.technical_indicators_service import technical_indicators_service
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = ['DejaVu Sans', 'Arial Unicode MS', 'Malgun Gothic', 'NanumGothic', 'sans-serif']
-plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
+@lru_cache(maxsize=1)
+def _init_matplotlib():
+    """
+    matplotlib/mplfinance를 최초 차트 생성 시점에 한 번만 로드합니다.
+    (차트를 쓰지 않는 요청 경로/워커 부팅에서 import 비용 제거)
+    Returns:
+        (pyplot 모듈, mplfinance 모듈)
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import mplfinance as mpf
+
+    # 한글 폰트 설정
+    plt.rcParams['font.family'] = ['DejaVu Sans', 'Arial Unicode MS', 'Malgun Gothic', 'NanumGothic', 'sans-serif']
+    plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
+    return plt, mpf
 
 class ChartService:
     """차트 생성 전용 서비스"""
@@ -332,6 +342,7 @@ class ChartService:
         
         # 새로운 코드 - 기존 아카이브 방식 복원
         try:
+            plt, mpf = _init_matplotlib()
             self.logger.info(f"[{ticker}] 기존 방식 차트 생성 시작")
             
             # 데이터 전처리
@@ -706,6 +717,7 @@ class ChartService:
         Returns:
             차트 스타일
         """
+        _, mpf = _init_matplotlib()
         if market_type.upper() in ['KOSPI', 'KOSDAQ']:
             # 한국식 색상 (빨간색 상승, 파란색 하락)
             return mpf.make_mpf_style(
@@ -745,6 +757,7 @@ class ChartService:
         Returns:
             추가할 플롯 리스트
         """
+        _, mpf = _init_matplotlib()
         add_plots = []
         
         try:
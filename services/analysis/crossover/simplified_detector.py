@@ -11,6 +11,23 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List, Tuple
 
+def _find_latest_cross(values1: np.ndarray, values2: np.ndarray) -> Tuple[Optional[int], Optional[str]]:
+    """
+    values1이 values2를 돌파한 가장 최근 행 인덱스와 유형을 반환
+    - 골드크로스: 이전 values1 <= values2 이고 현재 values1 > values2
+    - 데드크로스: 이전 values1 >= values2 이고 현재 values1 < values2
+    (NaN 비교는 False로 처리되어 돌파로 간주되지 않음)
+    """
+    prev1, prev2 = values1[:-1], values2[:-1]
+    cur1, cur2 = values1[1:], values2[1:]
+    golden = (prev1 <= prev2) & (cur1 > cur2)
+    dead = (prev1 >= prev2) & (cur1 < cur2)
+    hits = np.flatnonzero(golden | dead)
+    if hits.size == 0:
+        return None, None
+    j = hits[-1]
+    return int(j) + 1, ('golden_cross' if golden[j] else 'dead_cross')
+
 class SimplifiedCrossoverDetector:
     """간소화된 크로스오버 및 근접성 감지 서비스"""
     
@@ -198,40 +215,24 @@ class SimplifiedCrossoverDetector:
             if len(data) < 2:
                 return None
             
-            # 최근 데이터에서 크로스오버 감지
-            for i in range(len(data) - 1, 0, -1):
+            # 최근 데이터에서 크로스오버 감지 (행 단위 iloc 대신 배열 연산으로 가장 최근 돌파 지점 탐색)
+            i, cross_type = _find_latest_cross(
+                data[col1].to_numpy(dtype=np.float64),
+                data[col2].to_numpy(dtype=np.float64)
+            )
+            if i is not None:
                 current = data.iloc[i]
-                previous = data.iloc[i-1]
-                
-                # col1이 col2를 상향 돌파 (골드크로스)
-                if (previous[col1] <= previous[col2] and 
-                    current[col1] > current[col2]):
-                    days_since = self._calculate_days_ago(current.name)
-                    return {
-                        'type': 'golden_cross',
-                        'date': current.name,
-                        'col1': col1,
-                        'col2': col2,
-                        'col1_value': current[col1],
-                        'col2_value': current[col2],
-                        'strength': abs(current[col1] - current[col2]),
-                        'days_since': days_since
-                    }
-                
-                # col1이 col2를 하향 돌파 (데드크로스)
-                elif (previous[col1] >= previous[col2] and 
-                      current[col1] < current[col2]):
-                    days_since = self._calculate_days_ago(current.name)
-                    return {
-                        'type': 'dead_cross',
-                        'date': current.name,
-                        'col1': col1,
-                        'col2': col2,
-                        'col1_value': current[col1],
-                        'col2_value': current[col2],
-                        'strength': abs(current[col1] - current[col2]),
-                        'days_since': days_since
-                    }
+                days_since = self._calculate_days_ago(current.name)
+                return {
+                    'type': cross_type,
+                    'date': current.name,
+                    'col1': col1,
+                    'col2': col2,
+                    'col1_value': current[col1],
+                    'col2_value': current[col2],
+                    'strength': abs(current[col1] - current[col2]),
+                    'days_since': days_since
+                }
             
             return None
             
@@ -11,6 +11,62 @@ from typing import Dict, List, Optional
 from .file_management_service import FileManagementService
 from ..core.error_handler import log_error
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pa_csv = None
+
+# OHLCV 컬럼 dtype 고정 (자동 추론 생략)
+OHLCV_DTYPES = {
+    'Open': 'float64',
+    'High': 'float64',
+    'Low': 'float64',
+    'Close': 'float64',
+    'Volume': 'float64',
+}
+
+
+def _read_csv_after_skip(path: str, skiprows: int = 0, usecols: Optional[List[str]] = None,
+                         dtype: Optional[Dict[str, str]] = None,
+                         parse_dates: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    앞쪽 skiprows개 라인(메타데이터)을 건너뛰고 다음 라인을 헤더로 CSV 읽기
+    - pandas의 engine='pyarrow'는 정수 skiprows를 헤더 이후 행으로 해석하므로
+      pyarrow 설치 시 pyarrow.csv(ReadOptions.skip_rows)를 직접 사용
+    - pyarrow 미설치 또는 파싱 실패 시 C 엔진으로 폴백
+    """
+    if pa_csv is not None:
+        try:
+            column_types = {col: pa.from_numpy_dtype(t) for col, t in (dtype or {}).items()}
+            # 날짜는 문자열로 읽어 pandas와 동일한 규칙(to_datetime)으로 변환
+            column_types.update({col: pa.string() for col in parse_dates or ()})
+            table = pa_csv.read_csv(
+                path,
+                read_options=pa_csv.ReadOptions(skip_rows=skiprows),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=usecols or [],
+                    column_types=column_types,
+                    strings_can_be_null=True,
+                ),
+            )
+            df = table.to_pandas()
+            for col in parse_dates or ():
+                if col in df.columns:
+                    df[col] = pd.to_datetime(df[col])
+            return df
+        except (pa.ArrowException, ValueError) as e:
+            logging.debug(f"pyarrow CSV 파싱 실패, C 엔진 폴백: {path} ({e})")
+    return pd.read_csv(
+        path,
+        skiprows=skiprows,
+        usecols=usecols,
+        dtype=dtype,
+        parse_dates=parse_dates,
+        engine='c'
+    )
+
+
 class DataReadingService:
     """데이터 읽기 전담 서비스"""
     
@@ -21,11 +77,13 @@ class DataReadingService:
         self.logger = logging.getLogger(__name__)
     
     @log_error
-    def read_ohlcv_csv(self, ticker: str, market: str, timeframe: str = 'd') -> pd.DataFrame:
+    def read_ohlcv_csv(self, ticker: str, market: str, timeframe: str = 'd',
+                       usecols: Optional[List[str]] = None) -> pd.DataFrame:
         """
         OHLCV CSV 파일 읽기
         - 파일 기반 읽기 전용(다운로드/저장 수행하지 않음)
         - 최신 파일 탐색은 FileManagementService.get_latest_file 단일 진입점을 사용
+        - pyarrow 설치 시 pyarrow.csv로 파싱, usecols 지정 시 해당 컬럼만 로드
         """
         try:
             latest_file = self.file_manager.get_latest_file(ticker, 'ohlcv', market, timeframe)
@@ -43,8 +101,17 @@ class DataReadingService:
                         break
             
             logging.info(f"read_ohlcv_csv: skiprows={skiprows}")
-            df = pd.read_csv(latest_file, skiprows=skiprows, parse_dates=['Date'])
+            df = _read_csv_after_skip(
+                latest_file,
+                skiprows=skiprows,
+                usecols=usecols,
+                dtype=OHLCV_DTYPES,
+                parse_dates=['Date']
+            )
             df.set_index('Date', inplace=True)
+            # 호출자에게 항상 평탄한 컬럼 Index를 보장
+            if isinstance(df.columns, pd.MultiIndex):
+                df.columns = df.columns.get_level_values(0)
             try:
                 preview_cols = list(df.columns)[:12]
                 logging.info(f"read_ohlcv_csv: cols_preview={preview_cols}, rows={len(df)}")
@@ -98,17 +165,12 @@ class DataReadingService:
             
             logging.info(f"read_indicators_csv: header_idx={header_idx}")
             try:
-                # 주의: header_idx는 원본 파일 기준 라인 인덱스이므로 skiprows로 건너뛰고 header=0으로 지정
-                df = pd.read_csv(
-                    latest_file,
-                    skiprows=header_idx,
-                    header=0,
-                    sep=',',
-                    engine='python',
-                    on_bad_lines='skip'
-                )
+                # 주의: header_idx는 원본 파일 기준 라인 인덱스이므로 skiprows로 건너뛰고 다음 라인을 헤더로 사용
+                # 정상 파일은 pyarrow.csv(미설치/실패 시 C 엔진)로 빠르게 파싱
+                # Date는 문자열로 읽어 to_datetime으로 변환 (pyarrow 자체 추론은 +09:00 등 오프셋을 UTC로 바꿈)
+                df = _read_csv_after_skip(latest_file, skiprows=header_idx, parse_dates=['Date'])
             except Exception as e:
-                # 토크나이즈 오류 등 발생 시 문제있는 라인 스킵 시도
+                # 토크나이즈 오류 등 발생 시 python 엔진으로 문제있는 라인 스킵 시도
                 logging.warning(f"read_indicators_csv: tokenizing 오류 발생, 폴백 적용: {e}")
                 df = pd.read_csv(
                     latest_file,
@@ -165,7 +227,7 @@ class DataReadingService:
                         break
             
             logging.info(f"read_crossinfo_csv: skiprows={skiprows}")
-            df = pd.read_csv(latest_file, skiprows=skiprows, parse_dates=['Date'])
+            df = _read_csv_after_skip(latest_file, skiprows=skiprows, parse_dates=['Date'])
             try:
                 preview_cols = list(df.columns)[:12]
                 logging.info(f"read_crossinfo_csv: cols_preview={preview_cols}, rows={len(df)}")
@@ -234,8 +296,8 @@ class DataReadingService:
                 # 새로운 표준 경로: TechnicalIndicatorsService.get_latest_change_percent 호출
                 change_percent_value = None
                 try:
-                    from services.technical_indicators_service import TechnicalIndicatorsService
-                    tis = TechnicalIndicatorsService()
+                    # 티커마다 서비스 인스턴스를 만들지 않고 모듈 싱글톤 재사용
+                    from services.technical_indicators_service import technical_indicators_service as tis
                     # csv_path에서 market_type, ticker, timeframe 추출 시도
                     market_type = ''
                     ticker = ''
@@ -1,12 +1,25 @@
 import os
 import logging
 import json
+import time
+from threading import Lock
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import pandas as pd
 from services.newsletter_classification_service import NewsletterClassificationService
 from models import db, NewsletterContent
 
+# 통합 뉴스레터 생성 결과 공유 캐시: (timeframe, primary_market) → (만료 시각, newsletter_data)
+# 생성 결과는 사용자와 무관하므로 짧은 TTL 동안 여러 사용자 요청이 1회 생성 결과를 재사용
+COMBINED_NEWSLETTER_TTL = 60  # 초
+_COMBINED_NEWSLETTER_CACHE: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+_COMBINED_NEWSLETTER_LOCK = Lock()
+
+def clear_combined_newsletter_cache() -> None:
+    """통합 뉴스레터 공유 캐시 초기화 (관리자 시장 데이터 갱신/강제 다운로드 시 호출)"""
+    with _COMBINED_NEWSLETTER_LOCK:
+        _COMBINED_NEWSLETTER_CACHE.clear()
+
 class NewsletterGenerationService:
     def __init__(self):
         self.classification_service = NewsletterClassificationService()
@@ -170,17 +183,41 @@ class NewsletterGenerationService:
             
             # 데이터베이스에 저장 (통합 저장 서비스 사용)
             if user_id:
-                try:
-                    from services.newsletter_storage_service import NewsletterStorageService
-                    NewsletterStorageService().save_to_db(user_id, newsletter_data, 'combined')
-                except Exception:
-                    self._save_newsletter_content(user_id, newsletter_data, 'combined')
+                self._save_combined_for_user(user_id, newsletter_data)
             
             return newsletter_data
         except Exception as e:
             self.logger.error(f"통합 뉴스레터 생성 중 오류: {str(e)}")
             raise
 
+    def _save_combined_for_user(self, user_id: int, newsletter_data: Dict) -> None:
+        """통합 뉴스레터를 사용자 이력으로 저장 (통합 저장 서비스 실패 시 기존 경로)"""
+        try:
+            from services.newsletter_storage_service import NewsletterStorageService
+            NewsletterStorageService().save_to_db(user_id, newsletter_data, 'combined')
+        except Exception:
+            self._save_newsletter_content(user_id, newsletter_data, 'combined')
+
+    def get_combined_newsletter_cached(self, timeframe: str = 'd', primary_market: str = 'kospi',
+                                       user_id: Optional[int] = None, refresh: bool = False) -> Dict:
+        """통합 뉴스레터 조회 (생성은 TTL 캐시로 공유, 이력 저장은 사용자별 수행)"""
+        key = (timeframe, primary_market)
+        newsletter_data = None
+        if not refresh:
+            with _COMBINED_NEWSLETTER_LOCK:
+                entry = _COMBINED_NEWSLETTER_CACHE.get(key)
+            if entry and entry[0] > time.monotonic():
+                newsletter_data = entry[1]
+
+        if newsletter_data is None:
+            newsletter_data = self.generate_combined_newsletter(timeframe, primary_market)
+            with _COMBINED_NEWSLETTER_LOCK:
+                _COMBINED_NEWSLETTER_CACHE[key] = (time.monotonic() + COMBINED_NEWSLETTER_TTL, newsletter_data)
+
+        if user_id:
+            self._save_combined_for_user(user_id, newsletter_data)
+        return newsletter_data
+
     def _create_email_combined_body_html(
         self,
         kospi_results: Dict,
@@ -608,8 +645,8 @@ class NewsletterGenerationService:
             self.logger.error(f"뉴스레터 조회 실패: {str(e)}")
             return None
     
-    def get_newsletter_by_time(self, timeframe: str = 'd', user_id: Optional[int] = None) -> Dict:
-        """시간대에 따라 적절한 뉴스레터 생성"""
+    def resolve_primary_market_by_time(self) -> str:
+        """시간대에 따른 통합 뉴스레터 주요 시장"""
         now = datetime.now()
         
         # 한국 시간 기준 (UTC+9)
@@ -619,7 +656,11 @@ class NewsletterGenerationService:
         # 한국장 마감 후 (15:30 + 2시간 = 17:30 이후)
         if 17 <= hour or hour < 9:
             # 한국장이 주요 시장
-            return self.generate_combined_newsletter(timeframe, 'kospi', user_id)
+            return 'kospi'
         else:
             # 미국장이 주요 시장 (한국 시간 9시~17시는 미국장 시간대)
-            return self.generate_combined_newsletter(timeframe, 'US', user_id)
\ No newline at end of file
+            return 'US'
+
+    def get_newsletter_by_time(self, timeframe: str = 'd', user_id: Optional[int] = None) -> Dict:
+        """시간대에 따라 적절한 뉴스레터 생성"""
+        return self.generate_combined_newsletter(timeframe, self.resolve_primary_market_by_time(), user_id)
\ No newline at end of file
@@ -1,10 +1,14 @@
 import os
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Optional
 
 from models import db, NewsletterContent
 
+# HTML 파일 저장 전용 백그라운드 executor (응답 경로에서 디스크 쓰기 제거)
+_HTML_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='newsletter-save')
+
 
 class NewsletterStorageService:
     """뉴스레터 저장 책임 통합 서비스
@@ -15,16 +19,22 @@ class NewsletterStorageService:
 
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
+        self._html_dir_ready = False
+
+    def _build_html_path(self, kind: str, primary: Optional[str] = None) -> str:
+        base_dir = os.path.join("static", "newsletters")
+        # 저장 디렉토리는 인스턴스당 1회만 생성 시도
+        if not self._html_dir_ready:
+            os.makedirs(base_dir, exist_ok=True)
+            self._html_dir_ready = True
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = f"_{primary}" if primary else ""
+        return os.path.join(base_dir, f"Newsletter_{kind}{suffix}_{timestamp}.html")
 
     def save_html_file(self, html_content: str, kind: str, primary: Optional[str] = None) -> str:
         """렌더된 뉴스레터 HTML을 파일로 저장하고 경로를 반환한다."""
         try:
-            base_dir = os.path.join("static", "newsletters")
-            os.makedirs(base_dir, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            suffix = f"_{primary}" if primary else ""
-            filename = f"Newsletter_{kind}{suffix}_{timestamp}.html"
-            filepath = os.path.join(base_dir, filename)
+            filepath = self._build_html_path(kind, primary)
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(html_content)
             self.logger.info(f"Newsletter HTML saved: {filepath}")
@@ -33,6 +43,10 @@ class NewsletterStorageService:
             self.logger.error(f"Failed to save newsletter HTML: {e}")
             return ""
 
+    def save_html_file_async(self, html_content: str, kind: str, primary: Optional[str] = None) -> Future:
+        """save_html_file을 백그라운드에서 실행하고 즉시 Future를 반환한다 (오류는 save_html_file에서 로깅)."""
+        return _HTML_SAVE_EXECUTOR.submit(self.save_html_file, html_content, kind, primary)
+
     def save_to_db(self, user_id: int, newsletter_data: Dict, newsletter_type: str) -> None:
         """뉴스레터 내용을 DB에 저장한다."""
         try:
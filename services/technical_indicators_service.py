@@ -480,20 +480,25 @@ class TechnicalIndicatorsService:
         """
         try:
             # OHLCV 데이터 읽기
-            from services.market.data_reading_service import DataReadingService
-            data_reading_service = DataReadingService()
-            df = data_reading_service.read_ohlcv_csv(ticker, market_type, timeframe)
-            
+            df = self.data_reader.read_ohlcv_csv(ticker, market_type, timeframe)
+            return self.change_percent_from_ohlcv(df, ticker)
+        except Exception as e:
+            logging.error(f"[{ticker}] 최신 등락률 계산 실패: {e}")
+            return 0.0
+    
+    @staticmethod
+    def change_percent_from_ohlcv(df, ticker=None):
+        """
+        이미 읽어둔 OHLCV 데이터프레임에서 최신 등락률 계산 (파일 재읽기 없음)
+        get_latest_change_percent와 동일한 수식
+        """
+        try:
             if df.empty or len(df) < 2:
                 logging.warning(f"[{ticker}] 등락률 계산을 위한 충분한 데이터가 없습니다.")
                 return 0.0
             
-            # 최신 데이터와 이전 데이터
-            latest = df.iloc[-1]
-            previous = df.iloc[-2]
-            
-            current_close = latest['Close']
-            previous_close = previous['Close']
+            # 최신 데이터와 이전 데이터의 종가
+            current_close, previous_close = df['Close'].iloc[-1], df['Close'].iloc[-2]
             
             # 등락률 계산
             change_percent = ((current_close - previous_close) / previous_close) * 100
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+# 실행 경로 무관하게 프로젝트 루트를 모듈 경로에 추가
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+
+@pytest.fixture
+def db_app():
+    """인메모리 SQLite에 모델 테이블만 생성한 최소 Flask 앱 (블루프린트/외부 서비스 미등록)"""
+    from flask import Flask
+    from models import db
+
+    app = Flask(__name__)
+    app.config.update(
+        TESTING=True,
+        SECRET_KEY='test',
+        SQLALCHEMY_DATABASE_URI='sqlite://',
+    )
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
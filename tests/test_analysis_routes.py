@@ -0,0 +1,90 @@
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from routes import analysis_routes
+
+
+def _call_with_timeout(func, *args, timeout=30):
+    """교착 시 테스트가 멈추지 않도록 데몬 스레드에서 실행하고 제한 시간 내 결과를 반환"""
+    result = {}
+    worker = threading.Thread(target=lambda: result.setdefault('value', func(*args)), daemon=True)
+    worker.start()
+    worker.join(timeout)
+    assert not worker.is_alive(), f'{func.__name__} did not finish within {timeout}s'
+    return result['value']
+
+
+def test_load_indicator_timeframes_without_indicator_files(tmp_path, monkeypatch):
+    # 지표 CSV가 없으면 각 타임프레임이 get_ohlcv_data_for_ai 폴백으로 내려감
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'static' / 'data' / 'KOSPI').mkdir(parents=True)
+
+    assert _call_with_timeout(analysis_routes._load_indicator_timeframes, 'ZZZZ', 'KOSPI') == (None, None, None)
+    # 이후 호출도 공용 executor가 막히지 않고 정상 종료되어야 함
+    assert _call_with_timeout(analysis_routes.get_ohlcv_data_for_ai, 'ZZZZ', 'KOSPI') == (None, None, None)
+
+
+def _empty_ai_html_cache(monkeypatch):
+    monkeypatch.setattr(analysis_routes, '_AI_HTML_CACHE', OrderedDict())
+    monkeypatch.setattr(analysis_routes, '_AI_HTML_CACHE_BYTES', 0)
+
+
+def test_rendered_ai_html_cache_drops_stale_entries(monkeypatch):
+    _empty_ai_html_cache(monkeypatch)
+    key = ('AAPL', 'US', 1)
+    analysis_routes._store_rendered_ai_html(key, '<html>fresh</html>')
+    assert analysis_routes._get_rendered_ai_html(key) == '<html>fresh</html>'
+
+    # 장 마감 이후 등 디스크 캐시 기준으로 오래된 렌더 결과는 반환하지 않고 제거
+    monkeypatch.setattr(analysis_routes, '_is_rendered_at_fresh', lambda market, rendered_at: False)
+    assert analysis_routes._get_rendered_ai_html(key) is None
+    assert key not in analysis_routes._AI_HTML_CACHE
+    assert analysis_routes._AI_HTML_CACHE_BYTES == 0
+
+
+def test_rendered_ai_html_cache_is_bounded_by_bytes(monkeypatch):
+    _empty_ai_html_cache(monkeypatch)
+    page = 'x' * 1000
+    monkeypatch.setattr(analysis_routes, '_AI_HTML_CACHE_MAX_BYTES', 2 * sys.getsizeof(page))
+
+    for n in range(3):
+        analysis_routes._store_rendered_ai_html(('AAPL', 'US', n), page)
+    # 크기 제한을 넘으면 가장 오래된 항목부터 제거
+    assert list(analysis_routes._AI_HTML_CACHE) == [('AAPL', 'US', 1), ('AAPL', 'US', 2)]
+    assert analysis_routes._AI_HTML_CACHE_BYTES == 2 * sys.getsizeof(page)
+
+    # 제한보다 큰 단일 페이지는 캐시하지 않음
+    analysis_routes._store_rendered_ai_html(('AAPL', 'US', 3), page * 3)
+    assert ('AAPL', 'US', 3) not in analysis_routes._AI_HTML_CACHE
+
+
+def test_get_ohlcv_data_for_ai_isolates_timeframe_failures(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data_dir = tmp_path / 'static' / 'data' / 'US'
+    data_dir.mkdir(parents=True)
+    for tf in ('d', 'w', 'm'):
+        (data_dir / f'AAPL_20240105_ohlcv_{tf}.csv').write_text('')
+    frame = pd.DataFrame(
+        {'Open': [1.0], 'High': [2.0], 'Low': [0.5], 'Close': [1.5], 'Volume': [100]},
+        index=pd.DatetimeIndex(['2024-01-05'], name='Date'),
+    )
+    monkeypatch.setattr(analysis_routes._drs, 'read_ohlcv_csv', lambda *args, **kwargs: frame)
+    format_ohlcv_data = analysis_routes.format_ohlcv_data
+
+    def _format(df, timeframe):
+        if timeframe == '주봉':
+            raise ValueError('bad weekly data')
+        return format_ohlcv_data(df, timeframe)
+
+    monkeypatch.setattr(analysis_routes, 'format_ohlcv_data', _format)
+
+    daily, weekly, monthly = _call_with_timeout(analysis_routes.get_ohlcv_data_for_ai, 'AAPL', 'US')
+
+    # 주봉 포맷 실패는 주봉만 None으로 만들고 일봉/월봉 결과는 유지
+    assert weekly is None
+    assert daily == monthly == [
+        {'date': '2024-01-05', 'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5, 'volume': 100}
+    ]
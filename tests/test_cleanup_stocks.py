@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+
+from models import db, Stock
+from scripts import cleanup_stocks
+
+
+def test_cleanup_with_sql_keeps_latest_per_normalized_key(db_app):
+    base = datetime(2024, 1, 1)
+    db.session.add_all([
+        Stock(ticker=' aapl ', market_type='us', is_active=True, created_at=base),
+        Stock(ticker='AAPL', market_type='US', is_active=False, created_at=base + timedelta(days=2)),
+        Stock(ticker='Aapl', market_type='US ', is_active=True, created_at=base + timedelta(days=1)),
+        Stock(ticker='MSFT', market_type='US', is_active=True, created_at=base),
+        Stock(ticker='005930', market_type='KOSPI', is_active=True, created_at=base),
+        Stock(ticker='005930', market_type='KOSDAQ', is_active=True, created_at=base),
+    ])
+    db.session.commit()
+
+    normalized, deactivated = cleanup_stocks.cleanup_with_sql()
+
+    db.session.expire_all()
+    rows = db.session.query(Stock.ticker, Stock.market_type, Stock.is_active, Stock.created_at).order_by(Stock.id).all()
+    assert (normalized, deactivated) == (2, 2)
+    assert [(r.ticker, r.market_type) for r in rows] == [
+        ('AAPL', 'US'), ('AAPL', 'US'), ('AAPL', 'US'), ('MSFT', 'US'), ('005930', 'KOSPI'), ('005930', 'KOSDAQ'),
+    ]
+    # 그룹별 최신(created_at) 1건만 활성, 다른 시장의 같은 티커는 별도 그룹
+    assert [r.is_active for r in rows] == [False, True, False, True, True, True]
+
+
+def test_cleanup_with_sql_is_idempotent(db_app):
+    db.session.add(Stock(ticker='MSFT', market_type='US', is_active=True))
+    db.session.commit()
+
+    assert cleanup_stocks.cleanup_with_sql() == (0, 0)
+    assert cleanup_stocks.cleanup_with_sql() == (0, 0)
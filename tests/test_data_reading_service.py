@@ -0,0 +1,112 @@
+import logging
+
+import pandas as pd
+import pytest
+
+from services.market import data_reading_service
+from services.market.data_reading_service import DataReadingService
+from services.market.data_storage_service import DataStorageService
+
+
+@pytest.fixture(params=['pyarrow', 'c'])
+def engine(request, monkeypatch):
+    """pyarrow.csv 경로와 C 엔진 폴백 경로를 모두 검증"""
+    if request.param == 'pyarrow':
+        if data_reading_service.pa_csv is None:
+            pytest.skip('pyarrow 미설치')
+    else:
+        monkeypatch.setattr(data_reading_service, 'pa_csv', None)
+    return request.param
+
+
+def _frame(columns, tz=None):
+    index = pd.date_range('2024-01-02', periods=5, freq='D', name='Date', tz=tz)
+    return pd.DataFrame({col: [float(i + n) for i in range(5)] for n, col in enumerate(columns)}, index=index)
+
+
+def _write_with_metadata(path, df):
+    """DataStorageService와 동일한 형식(메타데이터 + 빈 줄 + CSV)으로 저장"""
+    storage = DataStorageService()
+    storage._save_csv_with_metadata(
+        storage._add_date_time_columns(df), str(path), {'ticker': 'TEST', 'total_rows': len(df)}
+    )
+    return str(path)
+
+
+def _reader(monkeypatch, path):
+    reader = DataReadingService()
+    monkeypatch.setattr(reader.file_manager, 'get_latest_file', lambda *args, **kwargs: path)
+    return reader
+
+
+def test_read_ohlcv_csv_skips_metadata(tmp_path, monkeypatch, engine):
+    path = _write_with_metadata(tmp_path / 'TEST_ohlcv_d.csv', _frame(['Open', 'High', 'Low', 'Close', 'Volume']))
+
+    df = _reader(monkeypatch, path).read_ohlcv_csv('TEST', 'US', 'd')
+
+    assert len(df) == 5
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert df.index[0] == pd.Timestamp('2024-01-02')
+    assert df['Close'].dtype == 'float64'
+    assert df['Close'].tolist() == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert {'Date_Index', 'Time_Index'} <= set(df.columns)
+
+
+def test_read_ohlcv_csv_usecols(tmp_path, monkeypatch, engine):
+    path = _write_with_metadata(tmp_path / 'TEST_ohlcv_d.csv', _frame(['Open', 'High', 'Low', 'Close', 'Volume']))
+
+    df = _reader(monkeypatch, path).read_ohlcv_csv('TEST', 'US', 'd', usecols=['Date', 'Close', 'Volume'])
+
+    assert list(df.columns) == ['Close', 'Volume']
+    assert df['Volume'].tolist() == [4.0, 5.0, 6.0, 7.0, 8.0]
+
+
+def test_read_indicators_csv_without_fallback(tmp_path, monkeypatch, caplog, engine):
+    path = _write_with_metadata(tmp_path / 'TEST_indicators_d.csv', _frame(['Close', 'EMA5', 'RSI']))
+
+    with caplog.at_level(logging.WARNING):
+        df = _reader(monkeypatch, path).read_indicators_csv('TEST', 'US', 'd')
+
+    assert len(df) == 5
+    assert df['RSI'].tolist() == [2.0, 3.0, 4.0, 5.0, 6.0]
+    assert df.index[-1] == pd.Timestamp('2024-01-06')
+    # 정상 파일은 python 엔진 폴백(tokenizing 경고) 없이 읽혀야 함
+    assert 'tokenizing' not in caplog.text
+
+
+def test_read_crossinfo_csv_skips_metadata(tmp_path, monkeypatch, engine):
+    path = tmp_path / 'TEST_crossinfo_d.csv'
+    path.write_text(
+        '# CrossInfo Metadata\n# ticker: TEST\n# End Metadata\n\n'
+        'Date,Cross_Type,Days_Ago\n'
+        '2024-01-02,golden,3\n'
+        '2024-01-05,,0\n',
+        encoding='utf-8-sig'
+    )
+
+    df = _reader(monkeypatch, str(path)).read_crossinfo_csv('TEST', 'US')
+
+    assert len(df) == 2
+    assert pd.api.types.is_datetime64_any_dtype(df['Date'])
+    assert df['Cross_Type'].iloc[0] == 'golden'
+    assert pd.isna(df['Cross_Type'].iloc[1])
+    assert df['Days_Ago'].tolist() == [3, 0]
+
+
+def test_indicator_dates_match_ohlcv_dates_with_utc_offset(tmp_path, monkeypatch, engine):
+    # KOSPI/KOSDAQ 파일은 '2024-01-02 00:00:00+09:00' 형식으로 저장됨
+    ohlcv_path = _write_with_metadata(
+        tmp_path / 'TEST_ohlcv_d.csv', _frame(['Open', 'High', 'Low', 'Close', 'Volume'], tz='Asia/Seoul'))
+    ind_path = _write_with_metadata(tmp_path / 'TEST_indicators_d.csv', _frame(['Close', 'EMA5'], tz='Asia/Seoul'))
+    reader = DataReadingService()
+    paths = {'ohlcv': ohlcv_path, 'indicators': ind_path}
+    monkeypatch.setattr(reader.file_manager, 'get_latest_file', lambda ticker, kind, *args, **kwargs: paths[kind])
+
+    ohlcv = reader.read_ohlcv_csv('TEST', 'KOSPI', 'd')
+    indicators = reader.read_indicators_csv('TEST', 'KOSPI', 'd')
+
+    # 현지 자정 그대로 유지되어야 하며 UTC(전날 15:00)로 바뀌면 안 됨
+    assert indicators.index[0] == pd.Timestamp('2024-01-02', tz='Asia/Seoul')
+    assert indicators.index.tz_localize(None)[0] == pd.Timestamp('2024-01-02')
+    aligned = indicators.reindex(ohlcv.index)
+    assert aligned['EMA5'].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
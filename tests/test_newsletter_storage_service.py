@@ -0,0 +1,31 @@
+import os
+
+from services.newsletter_storage_service import NewsletterStorageService
+
+
+def _saved_files(base):
+    directory = base / 'static' / 'newsletters'
+    return sorted(os.listdir(directory)) if directory.exists() else []
+
+
+def test_save_html_file_async_writes_full_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = NewsletterStorageService()
+    html = ''.join(f'<p>{i}</p>' for i in range(2000))
+
+    filepath = service.save_html_file_async(html, kind='kospi').result(timeout=5)
+
+    [name] = _saved_files(tmp_path)
+    assert name.startswith('Newsletter_kospi_')
+    assert filepath == os.path.join('static', 'newsletters', name)
+    with open(tmp_path / 'static' / 'newsletters' / name, encoding='utf-8') as f:
+        assert f.read() == html
+
+
+def test_save_html_file_async_logs_failure(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # 저장 경로가 파일로 막혀 있으면 예외 대신 빈 경로를 반환해야 함
+    (tmp_path / 'static').write_text('')
+    service = NewsletterStorageService()
+
+    assert service.save_html_file_async('<p>x</p>', kind='combined', primary='US').result(timeout=5) == ''
@@ -0,0 +1,70 @@
+from models import db, Stock
+from routes import stock_routes
+
+
+def _write_csv(tmp_path, text, encoding='utf-8'):
+    path = tmp_path / 'stocks.csv'
+    path.write_bytes(text.encode(encoding))
+    return str(path)
+
+
+def _stocks():
+    return {s.ticker: s for s in Stock.query.order_by(Stock.id).all()}
+
+
+def test_process_csv_file_handles_blank_cells(db_app, tmp_path, monkeypatch):
+    fetched = []
+
+    def _fake_lookup(ticker):
+        fetched.append(ticker)
+        return f'{ticker} Inc.'
+
+    monkeypatch.setattr(stock_routes, 'get_company_name_from_yahoo', _fake_lookup)
+    path = _write_csv(tmp_path, (
+        'ticker,company_name\n'
+        'aapl,Apple Inc.\n'
+        ',Orphan Name\n'
+        '  ,\n'
+        'msft,\n'
+        '005930, Samsung \n'
+    ))
+
+    stats = stock_routes.process_csv_file(path, 'US')
+
+    stocks = _stocks()
+    # 빈 티커 행은 건너뛰고 'NONE' 같은 가짜 종목을 만들지 않아야 함
+    assert set(stocks) == {'AAPL', 'MSFT', '005930'}
+    assert stats == {'processed': 3, 'added': 3, 'reactivated': 0}
+    assert stocks['AAPL'].company_name == 'Apple Inc.'
+    # 빈 회사명은 문자열 'None'으로 저장되지 않고 조회로 채워져야 함
+    assert stocks['MSFT'].company_name == 'MSFT Inc.'
+    assert stocks['005930'].company_name == 'Samsung'
+    assert fetched == ['MSFT']
+
+
+def test_process_csv_file_reactivates_and_fills_missing_name(db_app, tmp_path, monkeypatch):
+    monkeypatch.setattr(stock_routes, 'get_company_name_from_yahoo', lambda ticker: 'Fetched')
+    db.session.add_all([
+        Stock(ticker='AAPL', company_name='Apple Inc.', market_type='US', is_active=False),
+        Stock(ticker='TSLA', company_name=None, market_type='US', is_active=True),
+    ])
+    db.session.commit()
+    path = _write_csv(tmp_path, 'Symbol,Name\nAAPL,\nTSLA,\n')
+
+    stats = stock_routes.process_csv_file(path, 'US')
+
+    db.session.expire_all()
+    stocks = _stocks()
+    assert stats == {'processed': 2, 'added': 0, 'reactivated': 1}
+    assert stocks['AAPL'].is_active is True
+    assert stocks['AAPL'].company_name == 'Apple Inc.'
+    assert stocks['TSLA'].company_name == 'Fetched'
+
+
+def test_process_csv_file_falls_back_to_cp949(db_app, tmp_path, monkeypatch):
+    monkeypatch.setattr(stock_routes, 'get_company_name_from_yahoo', lambda ticker: 'Unknown')
+    path = _write_csv(tmp_path, 'ticker,company_name\n005930,삼성전자\n', encoding='cp949')
+
+    stock_routes.process_csv_file(path, 'KOSPI')
+
+    assert _stocks()['005930'].company_name == '삼성전자'
@@ -0,0 +1,92 @@
+import json
+
+from models import db, EmailMessage, EmailEvent, EmailSuppression
+from routes import webhook_routes
+
+
+def _events():
+    return [
+        {'sg_message_id': 'msg-1', 'event': 'delivered', 'sg_event_id': 'ev-1', 'timestamp': 1700000000},
+        {'sg_message_id': 'msg-2', 'event': 'bounce', 'sg_event_id': 'ev-2', 'timestamp': 1700000001,
+         'email': 'bounce@example.com', 'reason': 'mailbox full'},
+    ]
+
+
+def _add_messages():
+    db.session.add_all([
+        EmailMessage(to='a@example.com', subject='s', status='sent', sendgrid_message_id='msg-1'),
+        EmailMessage(to='bounce@example.com', subject='s', status='sent', sendgrid_message_id='msg-2'),
+    ])
+    db.session.commit()
+
+
+def test_persist_events_applies_status_and_suppression(db_app):
+    _add_messages()
+
+    assert webhook_routes._persist_sendgrid_events(_events()) == 2
+
+    statuses = dict(db.session.query(EmailMessage.sendgrid_message_id, EmailMessage.status))
+    assert statuses == {'msg-1': 'delivered', 'msg-2': 'bounced'}
+    assert db.session.query(EmailEvent).count() == 2
+    assert [s.email for s in EmailSuppression.query.all()] == ['bounce@example.com']
+
+
+def test_suppression_failure_is_rolled_back_alone(db_app, monkeypatch):
+    _add_messages()
+
+    def _fail(rows):
+        # 일부 행을 쓴 뒤 실패 → 억제 리스트 변경만 SAVEPOINT로 되돌려져야 함
+        db.session.bulk_insert_mappings(EmailSuppression, rows)
+        raise RuntimeError('insert failed')
+
+    monkeypatch.setattr(webhook_routes, '_insert_suppressions_ignore_existing', _fail)
+
+    assert webhook_routes._persist_sendgrid_events(_events()) == 2
+
+    db.session.expire_all()
+    statuses = dict(db.session.query(EmailMessage.sendgrid_message_id, EmailMessage.status))
+    assert statuses == {'msg-1': 'delivered', 'msg-2': 'bounced'}
+    assert db.session.query(EmailEvent).count() == 2
+    assert EmailSuppression.query.count() == 0
+
+
+def _client(db_app):
+    db_app.register_blueprint(webhook_routes.webhooks_bp)
+    return db_app.test_client()
+
+
+def test_handler_persists_before_responding(db_app):
+    _add_messages()
+    client = _client(db_app)
+    body = json.dumps(_events())
+
+    response = client.post('/sendgrid/events', data=body, content_type='application/json')
+
+    assert response.status_code == 200
+    assert response.get_json() == {'success': True, 'saved': 2}
+    assert db.session.query(EmailEvent).count() == 2
+    # 같은 본문 재전송은 저장 없이 중복으로 응답
+    again = client.post('/sendgrid/events', data=body, content_type='application/json')
+    assert again.get_json()['duplicate'] is True
+    assert db.session.query(EmailEvent).count() == 2
+
+
+def test_handler_failure_returns_5xx_and_allows_retry(db_app, monkeypatch):
+    _add_messages()
+    client = _client(db_app)
+    body = json.dumps(_events()) + ' '
+    real_persist = webhook_routes._persist_sendgrid_events
+
+    def _db_down(events):
+        raise RuntimeError('database unavailable')
+
+    monkeypatch.setattr(webhook_routes, '_persist_sendgrid_events', _db_down)
+    failed = client.post('/sendgrid/events', data=body, content_type='application/json')
+    assert failed.status_code == 500
+
+    # 실패한 배치는 중복으로 취급되지 않고 SendGrid 재전송 시 다시 저장되어야 함
+    monkeypatch.setattr(webhook_routes, '_persist_sendgrid_events', real_persist)
+    retried = client.post('/sendgrid/events', data=body, content_type='application/json')
+    assert retried.status_code == 200
+    assert retried.get_json() == {'success': True, 'saved': 2}
+    assert db.session.query(EmailEvent).count() == 2